@@ -1,53 +1,99 @@
 import sys
 
-from bugfixpy.utils import validate
+from bugfixpy import modes, utils
+from bugfixpy.exceptions import InvalidCredentialsError, InvalidJobError
 from bugfixpy.utils.text import colors
 from bugfixpy.utils.arguments import setup_parser
-from bugfixpy.modes import (
-    TransitionMode,
-    AutomaticMode,
-    ManualMode,
-    ViewRepository,
-    RevertCommit,
-    SetupCredentials,
-    AlertMode,
-)
 
 
 def main() -> None:
     parser = setup_parser()
     args = parser.parse_args()
 
-    if len(sys.argv) > 2 and not (
-        args.test and (args.auto or args.revert or args.manual or args.alert)
+    mode_flags = [
+        args.setup,
+        args.transition,
+        args.revert,
+        args.auto,
+        args.manual,
+        args.alert,
+        args.view,
+        args.sync_catalog,
+        bool(args.batch),
+    ]
+
+    if sum(mode_flags) > 1 or (
+        args.test
+        and not (args.auto or args.revert or args.manual or args.alert or args.batch)
     ):
         parser.error("Multiple flags cannot be enabled at the same time")
 
+    if args.dry_run and not (args.transition or args.auto or args.alert):
+        parser.error("--dry-run only applies to --transition, --auto and --alert")
+
+    if args.clone_strategy and not (
+        args.revert or args.auto or args.manual or args.alert or args.view or args.batch
+    ):
+        parser.error(
+            "--clone-strategy only applies to --revert, --auto, --manual, --alert,"
+            " --view and --batch"
+        )
+
+    if (args.workers or args.results) and not args.batch:
+        parser.error("--workers and --results only apply to --batch")
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.resume and not (args.auto or args.manual or args.alert):
+        parser.error("--resume only applies to --auto, --manual and --alert")
+
     if args.setup:
-        SetupCredentials().start()
+        modes.SetupCredentials().start()
     elif args.transition:
-        TransitionMode().start()
+        modes.TransitionMode(args.refresh, args.dry_run).start()
     elif args.revert:
-        RevertCommit.run(args.test)
+        modes.RevertCommitMode(args.test, args.refresh, args.clone_strategy).start()
     elif args.manual:
-        ManualMode(args.test).start()
-    elif not args.test and not validate.has_valid_credentials():
+        modes.ManualMode(args.test, args.clone_strategy, args.resume).start()
+    elif not args.test and not utils.validate.has_valid_credentials():
         print(
             f"{colors.FAIL}Credentials are not setup\nRun: python3 bugfixpy --setup{colors.ENDC}"
         )
+    elif args.batch:
+        modes.BatchMode(
+            args.batch,
+            args.results,
+            args.workers,
+            args.test,
+            args.refresh,
+            args.clone_strategy,
+        ).start()
     elif args.auto:
-        AutomaticMode(args.test).start()
+        modes.AutomaticMode(
+            args.test, args.refresh, args.dry_run, args.clone_strategy, args.resume
+        ).start()
     elif args.alert:
-        AlertMode(args.test).start()
+        modes.AlertMode(
+            args.test, args.refresh, args.dry_run, args.clone_strategy, args.resume
+        ).start()
     elif args.view:
-        ViewRepository().start()
+        modes.ViewRepository(args.refresh, args.clone_strategy).start()
+    elif args.sync_catalog:
+        modes.SyncCatalogMode(args.refresh).start()
     else:
         print("No mode entered. Try bugfixpy --help to see list of modes")
 
 
-try:
-    main()
+# Worker processes that are spawned instead of forked import this module again
+if __name__ == "__main__":
+    try:
+        main()
+
+    except (InvalidCredentialsError, InvalidJobError) as err:
+        print(f"{colors.FAIL}{err}{colors.ENDC}")
+        sys.exit(1)
 
-except KeyboardInterrupt:
-    print(f"\n{colors.FAIL}Exited program.")
-    sys.exit(0)
+    except KeyboardInterrupt:
+        print(f"\n{colors.FAIL}Exited program.")
+        sys.exit(0)
@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for bugfixpy. Run with: python3 -m benchmarks.<name>
+"""
@@ -0,0 +1,50 @@
+"""
+Benchmark the clone strategies against a real application repository.
+
+Clones the repository once per strategy into a temporary REPO_DIR and prints
+the bytes transferred and the elapsed time of each. The full strategy runs
+twice, so the second row shows the cost of a run with a warm mirror.
+Run with: python3 -m benchmarks.clone_strategies <repository> [branch ...]
+"""
+
+import sys
+import tempfile
+from unittest.mock import patch
+
+from bugfixpy.git import Repository, constants, mirror_cache
+
+STRATEGIES = [
+    ("full (cold mirror)", constants.CLONE_STRATEGY_FULL),
+    ("full (warm mirror)", constants.CLONE_STRATEGY_FULL),
+    ("blobless", constants.CLONE_STRATEGY_BLOBLESS),
+    ("sparse", constants.CLONE_STRATEGY_SPARSE),
+    ("narrow", constants.CLONE_STRATEGY_NARROW),
+]
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print("Usage: python3 -m benchmarks.clone_strategies <repository> [branch]...")
+        sys.exit(1)
+
+    repository_name = sys.argv[1]
+    branches = sys.argv[2:] or [constants.FULL_APP_SECURE_BRANCH]
+
+    print(f"{'strategy':<20}{'MiB':>10}{'seconds':>10}{'branches':>10}")
+
+    with tempfile.TemporaryDirectory() as repo_dir, patch.object(
+        constants, "REPO_DIR", repo_dir
+    ), patch.object(constants, "MIRROR_DIR", f"{repo_dir}/.mirrors"):
+        mirror_cache.delete_mirror(repository_name)
+
+        for name, strategy in STRATEGIES:
+            repository = Repository(repository_name, strategy, branches)
+            report = repository.get_clone_report()
+            print(
+                f"{name:<20}{report.transferred_bytes / 1024 / 1024:>10.1f}"
+                f"{report.elapsed:>10.1f}{repository.get_num_branches():>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
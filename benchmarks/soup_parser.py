@@ -0,0 +1,110 @@
+"""
+Benchmark soup_parser against the recorded CMS pages used by the tests.
+
+Compares the single-pass, strained parsing engine against the previous
+approach of building a full html.parser tree and walking every anchor once
+per field. Run with: python3 -m benchmarks.soup_parser
+"""
+
+import os
+import re
+import timeit
+
+from bs4 import BeautifulSoup
+from requests import Response
+
+from bugfixpy.jira import constants as jira_constants
+from bugfixpy.git import constants as git_constants
+from bugfixpy.cms import soup_parser
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "../bugfixpy/tests/cms/pages")
+
+ITERATIONS = 50
+
+
+def load_page(filename: str) -> Response:
+    response = Response()
+    with open(os.path.join(PAGES_DIR, filename), "rb") as page:
+        response._content = page.read()  # pylint: disable=protected-access
+    return response
+
+
+def parse_value_from_link(soup: BeautifulSoup, url_pattern: str) -> str:
+    for link in soup.find_all("a", href=True):
+        if url_pattern in link["href"]:
+            return link["href"].split(url_pattern)[1]
+    return ""
+
+
+def parse_application_endpoint(soup: BeautifulSoup) -> str:
+    for link in soup.find_all("a", href=True):
+        if re.search("/show$", link["href"]):
+            return link["href"]
+    return ""
+
+
+def legacy_parse_challenge_screen(result: Response) -> None:
+    soup = BeautifulSoup(result.content, "html.parser")
+    parse_value_from_link(soup, jira_constants.SCW_BROWSE_URL)
+    parse_application_endpoint(soup)
+    divs = soup.find_all("i", {"class": "fa fa-code-branch"})
+    [divs[i].parent.contents[1].strip() for i in (0, 2, 3, 4)]
+    divs = soup.find_all("i", {"class": "fa fa-code-branch"})
+    divs[1].parent.contents[1].strip()
+
+
+def legacy_parse_application_screen(result: Response) -> None:
+    soup = BeautifulSoup(result.content, "html.parser")
+    parse_value_from_link(soup, jira_constants.SCW_BROWSE_URL)
+    parse_value_from_link(soup, git_constants.SCW_CONTENT_URL)
+    rows = soup.find_all("table")[1].find_all("tr")
+    for table_row in rows[1:]:
+        cols = table_row.find_all("td")
+        cols[0].find("a", href=True).contents[0].strip()
+        cols[2].find("span").contents[0].strip()
+
+
+def legacy_parse_csrf_token(result: Response) -> None:
+    soup = BeautifulSoup(result.content, "html.parser")
+    soup.find("input", {"name": "_csrf_token"}).get("value")
+
+
+BENCHMARKS = [
+    (
+        "challenge screen",
+        "challenge_screen.html",
+        legacy_parse_challenge_screen,
+        soup_parser.parse_challenge_screen_data,
+    ),
+    (
+        "application screen",
+        "application_screen.html",
+        legacy_parse_application_screen,
+        soup_parser.parse_application_screen_data,
+    ),
+    (
+        "csrf token",
+        "login.html",
+        legacy_parse_csrf_token,
+        soup_parser.parse_csrf_token,
+    ),
+]
+
+
+def time_parser(parser, page: Response) -> float:
+    return min(timeit.repeat(lambda: parser(page), number=ITERATIONS, repeat=3))
+
+
+def main() -> None:
+    print(f"HTML parser: {soup_parser.HTML_PARSER}")
+    print(f"{'page':<20}{'legacy ms':>12}{'current ms':>12}{'speedup':>10}")
+
+    for name, filename, legacy_parser, current_parser in BENCHMARKS:
+        page = load_page(filename)
+        legacy = time_parser(legacy_parser, page) * 1000 / ITERATIONS
+        current = time_parser(current_parser, page) * 1000 / ITERATIONS
+        print(f"{name:<20}{legacy:>12.3f}{current:>12.3f}{legacy / current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark how long the CLI takes to start for lightweight invocations.
+
+Times `python3 __main__.py <args>` against a bare interpreter and lists the
+heavy dependencies each invocation imported, so regressions in lazy loading
+show up as both extra milliseconds and unexpected modules.
+Run with: python3 -m benchmarks.startup
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MAIN = os.path.join(os.path.dirname(__file__), "../__main__.py")
+
+REPEAT = 10
+
+HEAVY_MODULES = ["bs4", "git", "keyring", "requests", "bugfixpy.jira", "bugfixpy.cms"]
+
+INVOCATIONS = [
+    ("interpreter", ["-c", "pass"]),
+    ("--help", [MAIN, "--help"]),
+    ("invalid flags", [MAIN, "--view", "--auto"]),
+]
+
+MODULES_MARKER = "IMPORTED:"
+
+# Prints the heavy modules that are loaded once the CLI has exited
+IMPORTED_MODULES_PROBE = (
+    "import atexit, runpy, sys\n"
+    "atexit.register(lambda: print({marker!r},"
+    " *[m for m in {modules} if m in sys.modules], file=sys.stderr))\n"
+    "sys.argv = {argv}\n"
+    "try:\n"
+    "    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+def time_invocation(args: list[str]) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=False)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def get_imported_heavy_modules(args: list[str]) -> list[str]:
+    if args[0] != MAIN:
+        return []
+
+    probe = IMPORTED_MODULES_PROBE.format(
+        marker=MODULES_MARKER, modules=HEAVY_MODULES, argv=args
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=False
+    )
+
+    for line in result.stderr.splitlines():
+        if line.startswith(MODULES_MARKER):
+            return line.split()[1:]
+
+    return []
+
+
+def main() -> None:
+    print(f"{'invocation':<15}{'median ms':>12}  heavy modules imported")
+
+    for name, args in INVOCATIONS:
+        elapsed = time_invocation(args) * 1000
+        modules = ", ".join(get_imported_heavy_modules(args)) or "-"
+        print(f"{name:<15}{elapsed:>12.1f}  {modules}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from .job import BatchJob, JobResult, load_jobs
+from .runner import BatchRunner, run_job
+from . import constants
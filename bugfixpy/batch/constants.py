@@ -0,0 +1,37 @@
+import os
+
+from bugfixpy.git import constants as git_constants
+
+# Working copies of batch jobs, one directory per job so workers never share one
+BATCH_REPO_DIR = os.path.join(git_constants.REPO_DIR, ".batch")
+
+# Number of jobs run at the same time, each in its own process
+BATCH_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Fix message used when a job does not describe its fix
+DEFAULT_FIX_MESSAGE = "Applied fix from batch job"
+
+# File the content verifiers are listed in, the same one the interactive modes use
+REVIEWERS_FILE = os.path.join(os.path.dirname(__file__), "../reviewers.json")
+
+# Fields a job in the manifest may have
+JOB_FIELDS = (
+    "challenge_id",
+    "application",
+    "chlrq",
+    "patch",
+    "script",
+    "message",
+    "reviewer",
+    "push",
+    "transition",
+)
+
+# Suffixes of the results file and the log directory written next to the manifest
+RESULTS_SUFFIX = ".results.jsonl"
+LOGS_SUFFIX = ".logs"
+
+# Status of a finished job
+JOB_SUCCEEDED = "succeeded"
+JOB_CONFLICTED = "conflicted"
+JOB_FAILED = "failed"
@@ -0,0 +1,149 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from bugfixpy.exceptions import InvalidIssueIdError, InvalidJobError
+from bugfixpy.jira import ChallengeRequestIssue
+
+from . import constants
+
+
+@dataclass
+class BatchJob:
+    index: int
+    chlrq: str
+    challenge_id: Optional[str] = None
+    application: Optional[str] = None
+    patch: Optional[str] = None
+    script: Optional[str] = None
+    message: str = constants.DEFAULT_FIX_MESSAGE
+    reviewer: Optional[str] = None
+    push: bool = False
+    transition: bool = False
+
+    def get_name(self) -> str:
+        return self.challenge_id or self.application or ""
+
+    def get_challenge_request_issue(self) -> ChallengeRequestIssue:
+        return ChallengeRequestIssue(self.chlrq)
+
+    def get_reviewer_id(self) -> Optional[str]:
+        # Reviewers are named as in reviewers.json, anything else is taken as an id
+        try:
+            with open(constants.REVIEWERS_FILE, encoding="utf-8") as reviewer_file:
+                users = json.load(reviewer_file)["users"]
+        except (OSError, ValueError, KeyError):
+            return self.reviewer
+
+        for user in users:
+            if self.reviewer and self.reviewer.lower() == user["name"].lower():
+                return user["id"]
+
+        return self.reviewer
+
+
+@dataclass
+class JobResult:
+    job: int
+    name: str
+    status: str = constants.JOB_FAILED
+    error: Optional[str] = None
+    repository: Optional[str] = None
+    fix_commits: dict[str, str] = field(default_factory=dict)
+    picked_branches: list[str] = field(default_factory=list)
+    unchanged_branches: list[str] = field(default_factory=list)
+    conflicted_branches: dict[str, list[str]] = field(default_factory=dict)
+    failed_branches: dict[str, str] = field(default_factory=dict)
+    pushed: bool = False
+    push_results: list[dict[str, str]] = field(default_factory=list)
+    transitioned: bool = False
+    elapsed: float = 0
+    log: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+def load_jobs(manifest_path: str) -> list[BatchJob]:
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs: list[BatchJob] = []
+
+    try:
+        with open(manifest_path, encoding="utf-8") as manifest:
+            lines = manifest.readlines()
+    except OSError as err:
+        raise InvalidJobError(f"Cannot read manifest: {err}") from err
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            fields = json.loads(line)
+        except ValueError as err:
+            raise InvalidJobError(f"Line {line_number}: {err}") from err
+
+        try:
+            jobs.append(parse_job(len(jobs), fields, manifest_dir))
+        except InvalidJobError as err:
+            raise InvalidJobError(f"Line {line_number}: {err}") from err
+
+    return jobs
+
+
+def parse_job(index: int, fields: Any, manifest_dir: str) -> BatchJob:
+    if not isinstance(fields, dict):
+        raise InvalidJobError("A job must be a JSON object")
+
+    unknown_fields = [name for name in fields if name not in constants.JOB_FIELDS]
+    if unknown_fields:
+        raise InvalidJobError(f"Unknown fields: {', '.join(unknown_fields)}")
+
+    if bool(fields.get("challenge_id")) == bool(fields.get("application")):
+        raise InvalidJobError("A job needs either a challenge_id or an application")
+
+    if bool(fields.get("patch")) == bool(fields.get("script")):
+        raise InvalidJobError("A job needs either a patch or a script")
+
+    for flag in ("push", "transition"):
+        if not isinstance(fields.get(flag, False), bool):
+            raise InvalidJobError(f"{flag} must be true or false")
+
+    if fields.get("transition") and not fields.get("push"):
+        raise InvalidJobError("transition needs push, issues move after the fix")
+
+    if fields.get("transition") and not fields.get("reviewer"):
+        raise InvalidJobError("transition needs a reviewer")
+
+    job = BatchJob(
+        index,
+        str(fields.get("chlrq", "")),
+        challenge_id=fields.get("challenge_id"),
+        application=fields.get("application"),
+        patch=__resolve_path(fields.get("patch"), manifest_dir),
+        script=__resolve_path(fields.get("script"), manifest_dir),
+        message=fields.get("message") or constants.DEFAULT_FIX_MESSAGE,
+        reviewer=fields.get("reviewer"),
+        push=fields.get("push", False),
+        transition=fields.get("transition", False),
+    )
+
+    try:
+        job.get_challenge_request_issue()
+    except InvalidIssueIdError as err:
+        raise InvalidJobError(f"Invalid chlrq: {job.chlrq!r}") from err
+
+    return job
+
+
+def __resolve_path(path: Optional[str], manifest_dir: str) -> Optional[str]:
+    if not path:
+        return None
+
+    # Paths are relative to the manifest, so it can be run from any directory
+    resolved_path = os.path.join(manifest_dir, os.path.expanduser(path))
+    if not os.path.isfile(resolved_path):
+        raise InvalidJobError(f"No such file: {path}")
+
+    return resolved_path
@@ -0,0 +1,338 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, Optional
+
+from bugfixpy.cms import (
+    ApplicationScreenData,
+    ApplicationScreenDataWithChallengeBranches,
+)
+from bugfixpy.git import Repository, constants as git_constants
+from bugfixpy.git.conflict_preflight import ConflictPreflight
+from bugfixpy.jira import ChallengeRequestIssue, TransitionIssueService
+from bugfixpy.modes.types import ScraperMode
+from bugfixpy.utils import formatter
+
+from .job import BatchJob, JobResult
+from . import constants
+
+
+@dataclass
+class FixTarget:
+    secure_branch: str
+    cherry_pick_branches: list[str]
+
+
+class JobRunner(ScraperMode):
+    """Fix one repository for a batch job, without asking the user anything"""
+
+    __job: BatchJob
+    __result: JobResult
+    __test_mode: bool
+    __clone_strategy: Optional[str]
+    __repository_name: str
+    __targets: list[FixTarget]
+    __transition: Callable[[TransitionIssueService, ChallengeRequestIssue, str], None]
+
+    def __init__(
+        self,
+        job: BatchJob,
+        result: JobResult,
+        test_mode: bool = False,
+        refresh_cache: bool = False,
+        clone_strategy: Optional[str] = None,
+    ) -> None:
+        self.__job = job
+        self.__result = result
+        self.__test_mode = test_mode
+        self.__clone_strategy = clone_strategy
+        self.__targets = []
+        self.set_refresh_cache(refresh_cache)
+
+    def run(self) -> None:
+        job = self.__job
+        result = self.__result
+        challenge_request_issue = job.get_challenge_request_issue()
+
+        if job.challenge_id:
+            self.__resolve_challenge(job.challenge_id)
+        else:
+            self.__resolve_application(job.get_name())
+        result.repository = self.__repository_name
+
+        repository = Repository(
+            self.__repository_name,
+            self.__clone_strategy or git_constants.CLONE_STRATEGY_FULL,
+            self.__get_clone_branches(),
+            repository_dir=os.path.join(
+                constants.BATCH_REPO_DIR, f"job-{job.index}", self.__repository_name
+            ),
+        )
+
+        fix_messages = []
+        for target in self.__targets:
+            fix_commit = self.__commit_fix(repository, target.secure_branch)
+            fix_messages.append(f"{target.secure_branch}: {job.message}")
+            self.__cherry_pick(repository, fix_commit, target)
+
+        if result.failed_branches:
+            raise RuntimeError(
+                f"Cherry-picking failed on {len(result.failed_branches)} branches"
+            )
+
+        if result.conflicted_branches:
+            result.status = constants.JOB_CONFLICTED
+            return
+
+        if job.push and not self.__test_mode:
+            self.__push(repository)
+
+        if job.transition and result.pushed:
+            service = TransitionIssueService()
+            service.transition_chrlq(
+                challenge_request_issue,
+                formatter.combine_messages_into_string(fix_messages),
+            )
+            self.__transition(
+                service, challenge_request_issue, job.get_reviewer_id() or ""
+            )
+            result.transitioned = True
+
+        result.status = constants.JOB_SUCCEEDED
+
+    def __resolve_challenge(self, challenge_id: str) -> None:
+        scraper_data = self.get_challenge_data(challenge_id)
+        challenge = scraper_data.challenge
+        application = scraper_data.application
+        # A scrape gives the application screen, the catalog gives the application
+        # with its challenge branches, both list the challenges
+        if not isinstance(
+            application,
+            (ApplicationScreenData, ApplicationScreenDataWithChallengeBranches),
+        ):
+            raise TypeError(
+                f"Expected application data, got {type(application).__name__}"
+            )
+        self.__repository_name = application.repository_name
+
+        if challenge.secure_branch == git_constants.FULL_APP_SECURE_BRANCH:
+            # The secure branch of a full app is merged into every challenge branch
+            branches = list(
+                dict.fromkeys(
+                    branch
+                    for app_challenge in application.challenges
+                    for branch in [
+                        app_challenge.secure_branch,
+                        *app_challenge.vulnerable_branches,
+                    ]
+                    if branch != challenge.secure_branch
+                )
+            )
+            self.__targets = [FixTarget(challenge.secure_branch, branches)]
+            self.__transition = (
+                lambda service, chlrq, verifier_id: service.transition_all_chlcs(
+                    application.chlc, chlrq, verifier_id
+                )
+            )
+            return
+
+        self.__targets = [
+            FixTarget(challenge.secure_branch, list(challenge.vulnerable_branches))
+        ]
+        self.__transition = (
+            lambda service, chlrq, verifier_id: service.transition_chlcs(
+                [challenge.chlc], chlrq, verifier_id
+            )
+        )
+
+    def __resolve_application(self, application_name: str) -> None:
+        application_data = self.get_application_data(application_name)
+        challenges = list(application_data.challenge_map.values())
+        self.__repository_name = application_data.repository_name
+
+        targets: dict[str, list[str]] = {}
+        for challenge in challenges:
+            targets.setdefault(challenge.secure_branch, [])
+            for branch in challenge.vulnerable_branches:
+                if branch not in targets[challenge.secure_branch]:
+                    targets[challenge.secure_branch].append(branch)
+
+        if git_constants.FULL_APP_SECURE_BRANCH in targets:
+            # A full app is fixed once on its secure branch, every challenge branch
+            # gets the fix from there
+            branches = list(
+                dict.fromkeys(
+                    branch
+                    for secure_branch, vulnerable_branches in targets.items()
+                    for branch in [secure_branch, *vulnerable_branches]
+                    if branch != git_constants.FULL_APP_SECURE_BRANCH
+                )
+            )
+            targets = {git_constants.FULL_APP_SECURE_BRANCH: branches}
+
+        self.__targets = [
+            FixTarget(secure_branch, branches)
+            for secure_branch, branches in targets.items()
+        ]
+        self.__transition = (
+            lambda service, chlrq, verifier_id: service.transition_all_chlcs(
+                application_data.chlc, chlrq, verifier_id
+            )
+        )
+
+    def __get_clone_branches(self) -> list[str]:
+        return list(
+            dict.fromkeys(
+                branch
+                for target in self.__targets
+                for branch in [target.secure_branch, *target.cherry_pick_branches]
+            )
+        )
+
+    def __commit_fix(self, repository: Repository, branch: str) -> str:
+        job = self.__job
+        print(f"Fixing {branch}")
+        repository.checkout_to_branch(branch)
+
+        if job.patch:
+            repository.apply_patch(job.patch)
+        elif job.script:
+            repository.run_fix_script(job.script, branch)
+            repository.add_all_changes()
+
+        if not repository.has_staged_changes():
+            raise ValueError(f"The fix made no changes on {branch}")
+
+        repository.commit_changes_with_message(
+            f"{job.get_challenge_request_issue().get_issue_id()}: {job.message}"
+        )
+        fix_commit = repository.get_last_commit_id()
+        repository.mark_branch_advanced(branch)
+        repository.get_journal().record_fix(
+            branch, fix_commit, f"{branch}: {job.message}"
+        )
+        self.__result.fix_commits[branch] = fix_commit
+
+        return fix_commit
+
+    def __cherry_pick(
+        self, repository: Repository, fix_commit: str, target: FixTarget
+    ) -> None:
+        result = self.__result
+        existing_branches = set(repository.get_branches())
+        branches = []
+        for branch in target.cherry_pick_branches:
+            if branch in existing_branches:
+                branches.append(branch)
+            else:
+                result.failed_branches[branch] = "Branch does not exist"
+
+        repository.create_local_branches(branches)
+
+        # Nobody is there to resolve conflicts, so conflicting branches are
+        # reported and left alone instead of stopping for a merge
+        for simulation in ConflictPreflight(repository, fix_commit).run(branches):
+            branch = simulation.branch
+            print(f"Cherry-picking onto {branch}")
+
+            if simulation.conflicted_files:
+                result.conflicted_branches[branch] = simulation.conflicted_files
+            elif not simulation.is_clean():
+                result.failed_branches[branch] = simulation.error or "Unknown error"
+            elif repository.cherry_pick_without_checkout(
+                fix_commit, branch, simulation
+            ):
+                repository.mark_branch_advanced(branch)
+                result.picked_branches.append(branch)
+            else:
+                result.unchanged_branches.append(branch)
+
+    def __push(self, repository: Repository) -> None:
+        result = self.__result
+        report = repository.push_advanced_branches()
+        result.push_results = [asdict(ref_result) for ref_result in report.results]
+        result.pushed = report.succeeded()
+
+        if result.pushed:
+            repository.get_journal().delete()
+        else:
+            raise RuntimeError(report.error or "GitHub rejected the push")
+
+
+def run_job(
+    job: BatchJob,
+    log_path: str,
+    test_mode: bool = False,
+    refresh_cache: bool = False,
+    clone_strategy: Optional[str] = None,
+) -> JobResult:
+    start = time.perf_counter()
+    result = JobResult(job.index, job.get_name(), log=log_path)
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+    with open(log_path, "w", encoding="utf-8") as log_file, redirect_stdout(
+        log_file
+    ), redirect_stderr(log_file):
+        try:
+            JobRunner(job, result, test_mode, refresh_cache, clone_strategy).run()
+        except (Exception, SystemExit) as err:
+            result.status = constants.JOB_FAILED
+            result.error = f"{type(err).__name__}: {err}"
+            print(result.error)
+
+    result.elapsed = time.perf_counter() - start
+
+    return result
+
+
+class BatchRunner:
+    """Run batch jobs in worker processes and write their results as they finish"""
+
+    __results_path: str
+    __max_workers: int
+    __test_mode: bool
+    __refresh_cache: bool
+    __clone_strategy: Optional[str]
+
+    def __init__(
+        self,
+        results_path: str,
+        max_workers: int = constants.BATCH_MAX_WORKERS,
+        test_mode: bool = False,
+        refresh_cache: bool = False,
+        clone_strategy: Optional[str] = None,
+    ) -> None:
+        self.__results_path = results_path
+        self.__max_workers = max(1, max_workers)
+        self.__test_mode = test_mode
+        self.__refresh_cache = refresh_cache
+        self.__clone_strategy = clone_strategy
+
+    def get_logs_dir(self) -> str:
+        return f"{self.__results_path}{constants.LOGS_SUFFIX}"
+
+    def run(self, jobs: list[BatchJob]) -> Iterator[JobResult]:
+        with open(
+            self.__results_path, "w", encoding="utf-8"
+        ) as results_file, ProcessPoolExecutor(self.__max_workers) as executor:
+            futures = [
+                executor.submit(
+                    run_job,
+                    job,
+                    os.path.join(self.get_logs_dir(), f"job-{job.index}.log"),
+                    self.__test_mode,
+                    self.__refresh_cache,
+                    self.__clone_strategy,
+                )
+                for job in jobs
+            ]
+
+            # Written as soon as a job finishes, so an interrupted batch still
+            # reports the jobs that ran
+            for future in as_completed(futures):
+                result = future.result()
+                results_file.write(f"{result.to_json()}\n")
+                results_file.flush()
+                yield result
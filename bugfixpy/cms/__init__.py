@@ -4,5 +4,8 @@ from .scraper_data import (
     ApplicationScreenData,
     ApplicationScreenDataWithChallengeBranches,
     ChallengeScreenData,
+    ApplicationListing,
 )
+from .scrape_cache import ScrapeCache, CacheEntry
+from .catalog import Catalog
 from . import constants
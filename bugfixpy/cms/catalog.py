@@ -0,0 +1,273 @@
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Optional
+
+from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
+
+from .scraper_data import (
+    ApplicationListing,
+    ApplicationScreenData,
+    ApplicationScreenDataWithChallengeBranches,
+    Challenge,
+    ChallengeScreenData,
+    ScraperData,
+)
+from . import constants
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    url TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    chlc TEXT NOT NULL,
+    repository_name TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS challenges (
+    url TEXT PRIMARY KEY,
+    challenge_id TEXT NOT NULL,
+    application_url TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    chlc TEXT NOT NULL,
+    secure_branch TEXT NOT NULL,
+    vulnerable_branches TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_runs (
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    full_sync INTEGER NOT NULL,
+    applications INTEGER NOT NULL,
+    pages_fetched INTEGER NOT NULL,
+    pages_skipped INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_name ON applications (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS applications_repository_name
+    ON applications (repository_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS challenges_challenge_id ON challenges (challenge_id);
+CREATE INDEX IF NOT EXISTS challenges_application_url ON challenges (application_url);
+"""
+
+
+class Catalog:
+    __connection: sqlite3.Connection
+    __ttl: int
+
+    def __init__(
+        self,
+        catalog_file: str = constants.CATALOG_FILE,
+        ttl: int = constants.CATALOG_TTL,
+    ) -> None:
+        os.makedirs(os.path.dirname(catalog_file), exist_ok=True)
+        self.__connection = sqlite3.connect(catalog_file)
+        self.__connection.row_factory = sqlite3.Row
+        self.__connection.executescript(SCHEMA)
+        self.__ttl = ttl
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def save_application(
+        self, application: ApplicationListing, application_data: ApplicationScreenData
+    ) -> None:
+        application_url = self.get_application_path(application.url)
+
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO applications VALUES (?, ?, ?, ?, ?)",
+                (
+                    application_url,
+                    application.name,
+                    application_data.chlc.get_issue_id(),
+                    application_data.repository_name,
+                    time.time(),
+                ),
+            )
+            self.__connection.execute(
+                "DELETE FROM challenges WHERE application_url = ?", (application_url,)
+            )
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO challenges VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        challenge.url,
+                        self.get_challenge_id(challenge.url),
+                        application_url,
+                        position,
+                        challenge.name,
+                        challenge.status,
+                        challenge.chlc.get_issue_id() if challenge.chlc else "",
+                        challenge.secure_branch,
+                        json.dumps(challenge.vulnerable_branches),
+                    )
+                    for position, challenge in enumerate(
+                        application_data.listed_challenges
+                    )
+                ],
+            )
+
+    def reuse_unchanged_challenges(
+        self, application: ApplicationListing, application_data: ApplicationScreenData
+    ) -> list[Challenge]:
+        application_url = self.get_application_path(application.url)
+        application_row = self.__connection.execute(
+            "SELECT * FROM applications WHERE url = ?", (application_url,)
+        ).fetchone()
+
+        if not application_row or not self.__is_fresh(application_row):
+            return list(application_data.challenges)
+
+        challenge_rows = {
+            challenge_row["url"]: challenge_row
+            for challenge_row in self.__connection.execute(
+                "SELECT * FROM challenges WHERE application_url = ?",
+                (application_url,),
+            )
+        }
+        changed_challenges = []
+
+        for challenge in application_data.challenges:
+            challenge_row = challenge_rows.get(challenge.url)
+
+            if not self.__is_unchanged(challenge_row, challenge):
+                changed_challenges.append(challenge)
+                continue
+
+            stored_challenge = self.__create_challenge(challenge_row)
+            challenge.secure_branch = stored_challenge.secure_branch
+            challenge.vulnerable_branches = stored_challenge.vulnerable_branches
+            challenge.chlc = stored_challenge.chlc
+
+        return changed_challenges
+
+    def record_sync_run(
+        self,
+        started_at: float,
+        full_sync: bool,
+        applications: int,
+        pages_fetched: int,
+        pages_skipped: int,
+    ) -> None:
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT INTO sync_runs VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    started_at,
+                    time.time(),
+                    int(full_sync),
+                    applications,
+                    pages_fetched,
+                    pages_skipped,
+                ),
+            )
+
+    def find_challenge_data(self, challenge_id: str) -> Optional[ScraperData]:
+        challenge_row = self.__connection.execute(
+            "SELECT * FROM challenges WHERE challenge_id = ?", (challenge_id,)
+        ).fetchone()
+
+        if not challenge_row or not challenge_row["chlc"]:
+            return None
+
+        application_data = self.__find_application_data_by_path(
+            challenge_row["application_url"]
+        )
+
+        if not application_data:
+            return None
+
+        challenge = self.__create_challenge(challenge_row)
+        challenge_screen_data = ChallengeScreenData(
+            challenge_row["application_url"],
+            challenge.chlc,
+            challenge.secure_branch,
+            challenge.vulnerable_branches,
+        )
+
+        return ScraperData(challenge_screen_data, application_data)
+
+    def find_application_data(
+        self, application_name_or_url: str
+    ) -> Optional[ApplicationScreenDataWithChallengeBranches]:
+        application_path = self.get_application_path(application_name_or_url)
+
+        if application_path:
+            return self.__find_application_data_by_path(application_path)
+
+        application_rows = self.__connection.execute(
+            "SELECT url FROM applications"
+            " WHERE name = ? COLLATE NOCASE OR repository_name = ? COLLATE NOCASE",
+            (application_name_or_url, application_name_or_url),
+        ).fetchall()
+
+        if len(application_rows) != 1:
+            return None
+
+        return self.__find_application_data_by_path(application_rows[0]["url"])
+
+    def get_application_path(self, application_url: str) -> str:
+        match = re.search(constants.APPLICATION_PATH_PATTERN, application_url)
+
+        return f"{match.group(0)}/show" if match else ""
+
+    def get_challenge_id(self, challenge_url: str) -> str:
+        match = re.search("[a-z0-9]{24}", challenge_url)
+
+        return match.group(0) if match else ""
+
+    def __find_application_data_by_path(
+        self, application_path: str
+    ) -> Optional[ApplicationScreenDataWithChallengeBranches]:
+        application_row = self.__connection.execute(
+            "SELECT * FROM applications WHERE url = ?", (application_path,)
+        ).fetchone()
+
+        if not application_row or not self.__is_fresh(application_row):
+            return None
+
+        challenge_rows = self.__connection.execute(
+            "SELECT * FROM challenges WHERE application_url = ? ORDER BY position",
+            (application_path,),
+        ).fetchall()
+
+        challenges = [
+            self.__create_challenge(challenge_row)
+            for challenge_row in challenge_rows
+            if challenge_row["status"] not in constants.EXCLUDED_CHALLENGE_STATUSES
+        ]
+        challenge_map = {challenge.name: challenge for challenge in challenges}
+
+        return ApplicationScreenDataWithChallengeBranches(
+            ApplicationCreationIssue(application_row["chlc"]),
+            application_row["repository_name"],
+            challenges,
+            challenge_map,
+        )
+
+    def __create_challenge(self, challenge_row: sqlite3.Row) -> Challenge:
+        chlc = challenge_row["chlc"]
+
+        return Challenge(
+            challenge_row["name"],
+            challenge_row["url"],
+            challenge_row["secure_branch"],
+            json.loads(challenge_row["vulnerable_branches"]),
+            challenge_row["status"],
+            ChallengeCreationIssue(chlc) if chlc else None,
+        )
+
+    def __is_unchanged(
+        self, challenge_row: Optional[sqlite3.Row], challenge: Challenge
+    ) -> bool:
+        return bool(
+            challenge_row
+            and challenge_row["chlc"]
+            and challenge_row["name"] == challenge.name
+            and challenge_row["status"] == challenge.status
+        )
+
+    def __is_fresh(self, application_row: sqlite3.Row) -> bool:
+        return time.time() - application_row["synced_at"] < self.__ttl
@@ -1,5 +1,8 @@
 import re
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Callable, Optional
 from requests import Session, Response
 
 from bugfixpy.exceptions import RequestFailedError
@@ -7,12 +10,16 @@ from bugfixpy.jira import api
 from bugfixpy.utils import prompt_user, validate
 
 from .scraper_data import (
+    ApplicationListing,
     ApplicationScreenData,
     ApplicationScreenDataWithChallengeBranches,
+    Challenge,
     ChallengeScreenData,
+    LazyChallenge,
     ScraperData,
 )
 from . import soup_parser
+from . import session_store
 from . import constants
 
 
@@ -20,27 +27,39 @@ class CmsScraper:
     __session: Session
     __email: Optional[str]
     __password: Optional[str]
+    __max_workers: int
+    __page_validators: dict[str, dict[str, str]]
+    __login_lock: Lock
+    __login_count: int
 
     def __init__(
         self,
+        max_workers: int = constants.MAX_WORKERS,
     ) -> None:
         self.__session = Session()
         self.__email = constants.EMAIL
         self.__password = constants.PASSWORD
-        self.login_to_cms()
+        self.__max_workers = max(1, max_workers)
+        self.__page_validators = {}
+        self.__login_lock = Lock()
+        self.__login_count = 0
+        self.__login_with_stored_session_or_credentials()
 
     def __del__(self) -> None:
         self.__session.close()
 
-    def scrape_challenge_data(self, challenge_id: str) -> ScraperData:
+    def scrape_challenge_data(
+        self, challenge_id: str, lazy: bool = False
+    ) -> ScraperData:
         if not validate.is_valid_challenge_id(challenge_id):
             raise ValueError(f"Invalid challenge_id: {challenge_id}")
 
+        self.__page_validators = {}
         challenge_screen_data = self.scrape_challenge_screen(challenge_id)
 
         application_screen_data = (
             self.scrape_application_data_with_challenge_map_by_url(
-                challenge_screen_data.application_endpoint
+                challenge_screen_data.application_endpoint, lazy
             )
         )
 
@@ -55,8 +74,9 @@ class CmsScraper:
         return application_data
 
     def scrape_application_data_with_challenge_map(
-        self, application_name_or_url: str
+        self, application_name_or_url: str, lazy: bool = False
     ) -> ApplicationScreenDataWithChallengeBranches:
+        self.__page_validators = {}
         application_url = application_name_or_url
         if not validate.is_valid_application_url(application_name_or_url):
             application_url = self.get_cms_url(application_name_or_url)
@@ -69,11 +89,7 @@ class CmsScraper:
             else application_url
         )
 
-        application_data = self.scrape_application_screen_by_url(parsed_url)
-
-        return self.parse_application_screen_with_challenge_branches_response(
-            application_data
-        )
+        return self.scrape_application_data_with_challenge_map_by_url(parsed_url, lazy)
 
     def get_cms_url(self, application_name) -> str:
         response = api.query_for_challenge_creation_by_application_name(
@@ -98,14 +114,74 @@ class CmsScraper:
         return application_urls[url_index]
 
     def scrape_application_data_with_challenge_map_by_url(
-        self, application_url: str
+        self, application_url: str, lazy: bool = False
     ) -> ApplicationScreenDataWithChallengeBranches:
         application_data = self.scrape_application_screen_by_url(application_url)
 
+        if lazy:
+            return self.create_lazy_challenge_map(application_data)
+
         return self.parse_application_screen_with_challenge_branches_response(
             application_data
         )
 
+    def scrape_application_list(self) -> tuple[list[ApplicationListing], int]:
+        applications = []
+        visited_urls = set()
+        page_url = constants.APPLICATIONS_URL
+
+        while page_url and page_url not in visited_urls:
+            visited_urls.add(page_url)
+            response = self.get_application_list_page(page_url)
+            list_page = soup_parser.parse_application_list_page(response)
+            applications.extend(list_page.applications)
+            page_url = self.get_absolute_url(list_page.next_page_url)
+
+        return applications, len(visited_urls)
+
+    def get_application_list_page(self, page_url: str) -> Response:
+        response = self.__get_page(page_url)
+
+        if not response.ok:
+            raise RequestFailedError("Scraper Error: scraping application list failed")
+
+        return response
+
+    def get_absolute_url(self, url: str) -> str:
+        if url.startswith("/"):
+            return f"{constants.URL}{url}"
+
+        if url.startswith("?"):
+            return f"{constants.APPLICATIONS_URL}{url}"
+
+        return url
+
+    def get_page_validators(self) -> dict[str, dict[str, str]]:
+        return dict(self.__page_validators)
+
+    def are_pages_unchanged(self, page_validators: dict[str, dict[str, str]]) -> bool:
+        if not page_validators or not all(page_validators.values()):
+            return False
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            results = executor.map(
+                self.is_page_unchanged, page_validators.keys(), page_validators.values()
+            )
+
+        return all(list(results))
+
+    def is_page_unchanged(self, url: str, validators: dict[str, str]) -> bool:
+        headers = {}
+
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        response = self.__session.get(url, headers=headers, allow_redirects=False)
+
+        return response.status_code == 304
+
     def update_branches_for_application(self, application_endpoint) -> None:
         update_endpoint = self.get_update_endpoint(application_endpoint)
         result = self.__session.post(f"{constants.URL}{update_endpoint}")
@@ -116,16 +192,37 @@ class CmsScraper:
     def get_update_endpoint(self, application_endpoint) -> str:
         return application_endpoint.replace("show", "update-branches")
 
+    def __login_with_stored_session_or_credentials(self) -> None:
+        cookies = session_store.load_cookies(self.__email)
+
+        if cookies:
+            self.__session.cookies.update(cookies)
+        else:
+            self.login_to_cms()
+
     def login_to_cms(self) -> None:
         csrf_token = self.fetch_csrf_token()
 
         response = self.send_login_request(csrf_token)
 
         if self.did_login_fail(response):
+            session_store.delete_cookies()
             raise RequestFailedError(
                 "Scraper Error: Failed to login to CMS. Incorrect credentials"
             )
 
+        self.__login_count += 1
+        session_store.save_cookies(self.__email, self.__session.cookies)
+
+    def __login_again_if_not_already_done(self, login_count: int) -> None:
+        with self.__login_lock:
+            if self.__login_count == login_count:
+                self.__session.cookies.clear()
+                self.login_to_cms()
+
+    def did_session_expire(self, response: Response) -> bool:
+        return response.url.split("?")[0] == constants.LOGIN_URL
+
     def fetch_csrf_token(self) -> str:
         response = self.create_csrf_token()
 
@@ -190,7 +287,7 @@ class CmsScraper:
         return self.parse_application_screen_response(response)
 
     def get_cms_page_by_query_string(self, query: str) -> Response:
-        result = self.__session.get(f"{constants.SEARCH_URL}?q={query}")
+        result = self.__get_page(f"{constants.SEARCH_URL}?q={query}")
 
         if not result.content:
             raise RequestFailedError("Scraper Error: scraping application page failed")
@@ -198,7 +295,7 @@ class CmsScraper:
         return result
 
     def get_application_screen_by_url(self, application_url: str) -> Response:
-        response = self.__session.get(f"{constants.URL}{application_url}")
+        response = self.__get_page(f"{constants.URL}{application_url}")
 
         if not response.ok:
             raise RequestFailedError("Scraper Error: scraping application page failed")
@@ -206,7 +303,7 @@ class CmsScraper:
         return response
 
     def get_challenge_screen_by_url(self, challenge_url: str):
-        response = self.__session.get(f"{constants.URL}{challenge_url}")
+        response = self.__get_page(f"{constants.URL}{challenge_url}")
 
         if not response.ok:
             raise RequestFailedError(
@@ -215,6 +312,27 @@ class CmsScraper:
 
         return response
 
+    def scrape_challenge_screen_by_url(self, challenge_url: str) -> ChallengeScreenData:
+        response = self.get_challenge_screen_by_url(challenge_url)
+
+        return self.parse_challenge_screen_response(response)
+
+    def __get_page(self, url: str) -> Response:
+        login_count = self.__login_count
+        response = self.__session.get(url)
+
+        if self.did_session_expire(response):
+            self.__login_again_if_not_already_done(login_count)
+            response = self.__session.get(url)
+
+        self.__page_validators[url] = {
+            header: response.headers[header]
+            for header in ("ETag", "Last-Modified")
+            if header in response.headers
+        }
+
+        return response
+
     def parse_challenge_screen_response(self, response) -> ChallengeScreenData:
         return soup_parser.parse_challenge_screen_data(response)
 
@@ -224,21 +342,115 @@ class CmsScraper:
     def parse_application_screen_with_challenge_branches_response(
         self, application_data: ApplicationScreenData
     ) -> ApplicationScreenDataWithChallengeBranches:
-        challenge_map = {}
+        challenge_map = self.scrape_challenge_branches(application_data.challenges)
 
-        for challenge in application_data.challenges:
-            response = self.get_challenge_screen_by_url(challenge.url)
+        return ApplicationScreenDataWithChallengeBranches(
+            application_data.chlc,
+            application_data.repository_name,
+            application_data.challenges,
+            challenge_map,
+        )
 
-            challenge_data = self.parse_challenge_screen_response(response)
+    def create_lazy_challenge_map(
+        self, application_data: ApplicationScreenData, prefetch: bool = False
+    ) -> ApplicationScreenDataWithChallengeBranches:
+        loads: list[Callable[[], ChallengeScreenData]] = [
+            partial(self.scrape_challenge_screen_by_url, challenge.url)
+            for challenge in application_data.challenges
+        ]
 
-            challenge.vulnerable_branches = challenge_data.vulnerable_branches
-            challenge.secure_branch = challenge_data.secure_branch
+        if prefetch:
+            loads = self.__prefetch(loads)
 
-            challenge_map[challenge.name] = challenge
+        challenges = [
+            LazyChallenge(challenge.name, challenge.url, challenge.status, load)
+            for challenge, load in zip(application_data.challenges, loads)
+        ]
+
+        challenge_map: dict[str, Challenge] = {
+            challenge.name: challenge for challenge in challenges
+        }
 
         return ApplicationScreenDataWithChallengeBranches(
             application_data.chlc,
             application_data.repository_name,
-            application_data.challenges,
+            challenges,
             challenge_map,
         )
+
+    def load_challenges(self, challenges: list[Challenge]) -> None:
+        failures = []
+
+        for challenge in challenges:
+            if not isinstance(challenge, LazyChallenge):
+                continue
+
+            try:
+                challenge.load()
+            except Exception as err:
+                failures.append(f"{challenge.name}: {err}")
+
+        self.__raise_if_scraping_failed(failures, len(challenges))
+
+    def __prefetch(
+        self, loads: list[Callable[[], ChallengeScreenData]]
+    ) -> list[Callable[[], ChallengeScreenData]]:
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers)
+        futures = [executor.submit(load) for load in loads]
+        # The pool takes no more work, its threads exit once the queue is empty
+        executor.shutdown(wait=False)
+
+        return [
+            partial(self.__load_prefetched, future, load)
+            for future, load in zip(futures, loads)
+        ]
+
+    def __load_prefetched(
+        self,
+        future: Future[ChallengeScreenData],
+        load: Callable[[], ChallengeScreenData],
+    ) -> ChallengeScreenData:
+        # A challenge read before its prefetch started loads now instead of
+        # waiting behind the rest of the queue
+        if future.cancel():
+            return load()
+
+        return future.result()
+
+    def scrape_challenge_branches(
+        self, challenges: list[Challenge]
+    ) -> dict[str, Challenge]:
+        failures = []
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            futures = [
+                executor.submit(self.scrape_challenge_screen_by_url, challenge.url)
+                for challenge in challenges
+            ]
+
+        challenge_map = {}
+
+        for challenge, future in zip(challenges, futures):
+            try:
+                challenge_data = future.result()
+            except Exception as err:
+                failures.append(f"{challenge.name}: {err}")
+                continue
+
+            challenge.vulnerable_branches = challenge_data.vulnerable_branches
+            challenge.secure_branch = challenge_data.secure_branch
+            challenge.chlc = challenge_data.chlc
+
+            challenge_map[challenge.name] = challenge
+
+        self.__raise_if_scraping_failed(failures, len(challenges))
+
+        return challenge_map
+
+    def __raise_if_scraping_failed(self, failures: list[str], total: int) -> None:
+        if failures:
+            failed_challenges = "\n".join(failures)
+            raise RequestFailedError(
+                f"Scraper Error: scraping {len(failures)} of {total}"
+                f" challenges failed\n{failed_challenges}"
+            )
@@ -1,10 +1,13 @@
-import keyring
+import os
+from typing import Any
 
-# CMS email
-EMAIL = keyring.get_password("system", "CMS_EMAIL")
+from bugfixpy.utils import credentials
 
-# CMS password
-PASSWORD = keyring.get_password("system", "CMS_PASSWORD")
+# Keyring names of the CMS email and password, resolved on first use
+CREDENTIALS = {
+    "EMAIL": "CMS_EMAIL",
+    "PASSWORD": "CMS_PASSWORD",
+}
 
 # URL for CMS
 URL = "https://cms.securecodewarrior.com"
@@ -14,3 +17,40 @@ LOGIN_URL = f"{URL}/login"
 
 # URL to search for challenge in CMS
 SEARCH_URL = f"{URL}/search"
+
+# URL listing every application in CMS
+APPLICATIONS_URL = f"{URL}/applications"
+
+# Path of an application in CMS
+APPLICATION_PATH_PATTERN = (
+    r"/applications/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+    r"-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+# Challenge statuses that are skipped when fixing an application
+EXCLUDED_CHALLENGE_STATUSES = {"Deprecated", "Cancelled", "Todo", "Retired"}
+
+# Max number of challenge screens scraped concurrently for an application
+MAX_WORKERS = 8
+
+# File storing the authenticated CMS session cookies between runs
+SESSION_FILE = os.path.join(os.path.dirname(__file__), "../../data/session/cms_session")
+
+# Directory where scraped CMS data is cached between runs
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "../../data/cache/cms")
+
+# Seconds cached CMS data is used before it is revalidated against the CMS
+CACHE_TTL = 60 * 60 * 12
+
+# SQLite index of every application and challenge in the CMS
+CATALOG_FILE = os.path.join(os.path.dirname(__file__), "../../data/catalog.sqlite")
+
+# Seconds a synced catalog entry is used before it is scraped from the CMS again
+CATALOG_TTL = 60 * 60 * 24 * 7
+
+
+def __getattr__(name: str) -> Any:
+    if name in CREDENTIALS:
+        return credentials.get_password(CREDENTIALS[name])
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from . import constants
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    cached_at: float
+    page_validators: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+class ScrapeCache:
+    __cache_dir: str
+    __ttl: int
+
+    def __init__(
+        self, cache_dir: str = constants.CACHE_DIR, ttl: int = constants.CACHE_TTL
+    ) -> None:
+        self.__cache_dir = cache_dir
+        self.__ttl = ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self.__get_entry_path(key), "rb") as entry_file:
+                entry = pickle.load(entry_file)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+        ):
+            return None
+
+        if not isinstance(entry, CacheEntry):
+            return None
+
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        page_validators: Optional[dict[str, dict[str, str]]] = None,
+    ) -> None:
+        entry = CacheEntry(data, time.time(), page_validators or {})
+        self.__write_entry(key, entry)
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        entry.cached_at = time.time()
+        self.__write_entry(key, entry)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.cached_at < self.__ttl
+
+    def __write_entry(self, key: str, entry: CacheEntry) -> None:
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        path = self.__get_entry_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "wb") as entry_file:
+            pickle.dump(entry, entry_file)
+
+        os.replace(temp_path, path)
+
+    def __get_entry_path(self, key: str) -> str:
+        filename = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.__cache_dir, f"{filename}.pickle")
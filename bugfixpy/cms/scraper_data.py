@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Optional
 
 from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
 from bugfixpy.utils.text import colors
@@ -18,9 +20,17 @@ class Challenge:
     url: str
     secure_branch: str
     vulnerable_branches: list[str]
+    status: str
+    chlc: Optional[ChallengeCreationIssue]
 
     def __init__(
-        self, name=None, url=None, secure_branch=None, vulnerable_branches=None
+        self,
+        name=None,
+        url=None,
+        secure_branch=None,
+        vulnerable_branches=None,
+        status=None,
+        chlc=None,
     ) -> None:
         if name:
             self.name = name
@@ -38,21 +48,119 @@ class Challenge:
             self.vulnerable_branches = vulnerable_branches
         else:
             self.vulnerable_branches = []
+        if status:
+            self.status = status
+        else:
+            self.status = ""
+        self.chlc = chlc
+
+
+class LazyChallenge(Challenge):
+    __load: Optional[Callable[[], ChallengeScreenData]]
+    __lock: Lock
+    __secure_branch: str
+    __vulnerable_branches: list[str]
+    __chlc: Optional[ChallengeCreationIssue]
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        status: Optional[str] = None,
+        load: Optional[Callable[[], ChallengeScreenData]] = None,
+    ) -> None:
+        self.__load = None
+        self.__lock = Lock()
+        super().__init__(name, url, status=status)
+        self.__load = load
+
+    @property
+    def secure_branch(self) -> str:
+        self.load()
+        return self.__secure_branch
+
+    @secure_branch.setter
+    def secure_branch(self, secure_branch: str) -> None:
+        self.__secure_branch = secure_branch
+
+    @property
+    def vulnerable_branches(self) -> list[str]:
+        self.load()
+        return self.__vulnerable_branches
+
+    @vulnerable_branches.setter
+    def vulnerable_branches(self, vulnerable_branches: list[str]) -> None:
+        self.__vulnerable_branches = vulnerable_branches
+
+    @property
+    def chlc(self) -> Optional[ChallengeCreationIssue]:
+        self.load()
+        return self.__chlc
+
+    @chlc.setter
+    def chlc(self, chlc: Optional[ChallengeCreationIssue]) -> None:
+        self.__chlc = chlc
+
+    def is_loaded(self) -> bool:
+        return self.__load is None
+
+    def load(self) -> None:
+        with self.__lock:
+            if self.__load is None:
+                return
+
+            challenge_data = self.__load()
+            self.__secure_branch = challenge_data.secure_branch
+            self.__vulnerable_branches = challenge_data.vulnerable_branches
+            self.__chlc = challenge_data.chlc
+            self.__load = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        self.load()
+        state = self.__dict__.copy()
+        del state["_LazyChallenge__load"]
+        del state["_LazyChallenge__lock"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__load = None
+        self.__lock = Lock()
 
 
 @dataclass
 class ApplicationScreenData:
-    def __init__(self, chlc=None, repository_name=None, challenges=None) -> None:
+    def __init__(
+        self, chlc=None, repository_name=None, challenges=None, listed_challenges=None
+    ) -> None:
         if chlc:
             self.chlc = chlc
         if repository_name:
             self.repository_name = repository_name
         if challenges:
             self.challenges = challenges
+        if listed_challenges:
+            self.listed_challenges = listed_challenges
+        else:
+            self.listed_challenges = []
 
     chlc: ApplicationCreationIssue
     repository_name: str
     challenges: list[Challenge]
+    listed_challenges: list[Challenge]
+
+
+@dataclass
+class ApplicationListing:
+    name: str
+    url: str
+
+
+@dataclass
+class ApplicationListPage:
+    applications: list[ApplicationListing]
+    next_page_url: str
 
 
 @dataclass
@@ -75,7 +183,7 @@ class ApplicationScreenDataWithChallengeBranches:
 
     chlc: ApplicationCreationIssue
     repository_name: str
-    challenges: list[str]
+    challenges: list[Challenge]
     challenge_map: dict[str, Challenge]
 
 
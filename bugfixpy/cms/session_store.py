@@ -0,0 +1,51 @@
+import hashlib
+import os
+import pickle
+from typing import Optional
+
+from requests.cookies import RequestsCookieJar
+
+from . import constants
+
+
+def load_cookies(email: Optional[str]) -> Optional[RequestsCookieJar]:
+    try:
+        with open(constants.SESSION_FILE, "rb") as session_file:
+            stored_session = pickle.load(session_file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(stored_session, dict):
+        return None
+
+    if stored_session.get("account") != __hash_account(email):
+        return None
+
+    cookies = stored_session.get("cookies")
+
+    return cookies if isinstance(cookies, RequestsCookieJar) else None
+
+
+def save_cookies(email: Optional[str], cookies: RequestsCookieJar) -> None:
+    session_dir = os.path.dirname(constants.SESSION_FILE)
+    os.makedirs(session_dir, mode=0o700, exist_ok=True)
+    temp_path = f"{constants.SESSION_FILE}.{os.getpid()}.tmp"
+
+    file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(file_descriptor, "wb") as session_file:
+        pickle.dump(
+            {"account": __hash_account(email), "cookies": cookies}, session_file
+        )
+
+    os.replace(temp_path, constants.SESSION_FILE)
+
+
+def delete_cookies() -> None:
+    try:
+        os.remove(constants.SESSION_FILE)
+    except OSError:
+        pass
+
+
+def __hash_account(email: Optional[str]) -> str:
+    return hashlib.sha256(str(email).encode("utf-8")).hexdigest()
@@ -1,105 +1,140 @@
 import re
-from bs4 import BeautifulSoup
+from dataclasses import dataclass
+from importlib import util
+from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer
 from requests import Response
 
 from bugfixpy import git, jira
 from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
 from bugfixpy.cms.scraper_data import (
+    ApplicationListing,
+    ApplicationListPage,
     ApplicationScreenData,
     Challenge,
     ChallengeScreenData,
 )
 
+from . import constants
 
-def __create_soup(result: Response) -> BeautifulSoup:
-    return BeautifulSoup(result.content, "html.parser")
+HTML_PARSER = "lxml" if util.find_spec("lxml") else "html.parser"
 
+BRANCH_ICON = {"class": "fa fa-code-branch"}
 
-def __parse_chlc_number(soup: BeautifulSoup) -> str:
-    return __parse_value_from_link(soup, jira.constants.SCW_BROWSE_URL)
+BRANCH_CONTAINER_TAGS = ["span", "li", "td", "p", "small"]
 
+CSRF_TOKEN_STRAINER = SoupStrainer("input", {"name": "_csrf_token"})
 
-def __parse_git_repository(soup: BeautifulSoup) -> str:
-    return __parse_value_from_link(soup, git.constants.SCW_CONTENT_URL)
+LOGIN_FAILED_ALERT = {"class": "alert alert-danger alert-dismissible fade show"}
 
+LOGIN_FAILED_STRAINER = SoupStrainer("div", LOGIN_FAILED_ALERT)
 
-def __parse_value_from_link(soup: BeautifulSoup, url_pattern: str) -> str:
-    links = soup.findAll("a", href=True)
+CHALLENGE_SCREEN_STRAINER = SoupStrainer(["a", *BRANCH_CONTAINER_TAGS])
 
-    for link in links:
-        href = link["href"]
-        if url_pattern in href:
-            return href.split(url_pattern)[1]
+APPLICATION_SCREEN_STRAINER = SoupStrainer(["a", "table"])
 
-    return ""
+APPLICATION_LIST_STRAINER = SoupStrainer("a")
 
 
-def __parse_application_endpoint(soup: BeautifulSoup) -> str:
-    links = soup.findAll("a", href=True)
-    for link in links:
-        href = link["href"]
-        if re.search("/show$", href):
-            return href
+@dataclass
+class PageLinks:
+    chlc_number: str = ""
+    git_repository: str = ""
+    application_endpoint: str = ""
+
+
+def __create_soup(
+    result: Response, parse_only: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    return BeautifulSoup(result.content, HTML_PARSER, parse_only=parse_only)
+
+
+def __parse_links(soup: BeautifulSoup) -> PageLinks:
+    page_links = PageLinks()
 
-    return ""
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
 
+        if not page_links.chlc_number and jira.constants.SCW_BROWSE_URL in href:
+            page_links.chlc_number = href.split(jira.constants.SCW_BROWSE_URL)[1]
+        elif not page_links.git_repository and git.constants.SCW_CONTENT_URL in href:
+            page_links.git_repository = href.split(git.constants.SCW_CONTENT_URL)[1]
+        elif not page_links.application_endpoint and re.search("/show$", href):
+            page_links.application_endpoint = href
 
-def __parse_challenge_vulnerable_branches(soup: BeautifulSoup) -> list[str]:
-    branches = []
+    return page_links
 
-    divs = soup.find_all("i", {"class": "fa fa-code-branch"})
 
-    vulnerable = divs[0].parent.contents[1].strip()
-    incorrect_1 = divs[2].parent.contents[1].strip()
-    incorrect_2 = divs[3].parent.contents[1].strip()
-    incorrect_3 = divs[4].parent.contents[1].strip()
+def __parse_branch_names(soup: BeautifulSoup) -> list[str]:
+    icons = soup.find_all("i", BRANCH_ICON)
 
-    branches.append(vulnerable)
-    branches.append(incorrect_1)
-    branches.append(incorrect_2)
-    branches.append(incorrect_3)
+    return [
+        icon.parent.contents[1].strip()
+        for icon in icons
+        if len(icon.parent.contents) > 1
+    ]
 
-    return branches
 
+def __parse_challenge_vulnerable_branches(branches: list[str]) -> list[str]:
+    vulnerable = branches[0]
+    incorrect_1 = branches[2]
+    incorrect_2 = branches[3]
+    incorrect_3 = branches[4]
 
-def __parse_challenge_secure_branch(soup: BeautifulSoup) -> str:
-    secure_branch = "secure"
+    return [vulnerable, incorrect_1, incorrect_2, incorrect_3]
 
-    divs = soup.find_all("i", {"class": "fa fa-code-branch"})
-    secure_branch = divs[1].parent.contents[1].strip()
 
-    return secure_branch
+def __parse_challenge_secure_branch(branches: list[str]) -> str:
+    return branches[1]
 
 
-def __parse_challenges(soup: BeautifulSoup) -> list[Challenge]:
+def __parse_challenge_rows(soup: BeautifulSoup) -> list[Challenge]:
     challenges = []
-    tables = soup.findAll("table")
-    rows = tables[1].findAll("tr")
+    tables = soup.find_all("table")
+    rows = tables[1].find_all("tr")
 
     for table_row in rows[1:]:
-        cols = table_row.findAll("td")
+        cols = table_row.find_all("td")
         link = cols[0].find("a", href=True)
         url = link["href"]
         span = cols[2].find("span")
         name = link.contents[0].strip()
         status = span.contents[0].strip()
 
-        if (
-            status != "Deprecated"
-            and status != "Cancelled"
-            and status != "Todo"
-            and status != "Retired"
-        ):
-            challenges.append(
-                Challenge(
-                    name,
-                    url,
-                )
-            )
+        challenges.append(Challenge(name, url, status=status))
 
     return challenges
 
 
+def __parse_challenges(challenge_rows: list[Challenge]) -> list[Challenge]:
+    return [
+        challenge
+        for challenge in challenge_rows
+        if challenge.status not in constants.EXCLUDED_CHALLENGE_STATUSES
+    ]
+
+
+def __parse_application_links(soup: BeautifulSoup) -> list[ApplicationListing]:
+    applications = []
+    application_urls = set()
+
+    for link in soup.find_all("a", href=True):
+        url = link["href"].replace(constants.URL, "")
+
+        if re.fullmatch(f"{constants.APPLICATION_PATH_PATTERN}/show", url):
+            if url not in application_urls:
+                application_urls.add(url)
+                applications.append(ApplicationListing(link.get_text().strip(), url))
+
+    return applications
+
+
+def __parse_next_page_url(soup: BeautifulSoup) -> str:
+    next_link = soup.find("a", rel="next", href=True)
+
+    return str(next_link["href"]) if next_link else ""
+
+
 # def __parse_branches(soup: BeautifulSoup) -> list[str]:
 #     branches = []
 #     tables = soup.findAll("table")
@@ -130,7 +165,7 @@ def __parse_challenges(soup: BeautifulSoup) -> list[Challenge]:
 
 
 def parse_csrf_token(result: Response) -> str:
-    soup = __create_soup(result)
+    soup = __create_soup(result, CSRF_TOKEN_STRAINER)
 
     # Find input for csrf token
     csrf_input = soup.find("input", {"name": "_csrf_token"})
@@ -142,57 +177,59 @@ def parse_csrf_token(result: Response) -> str:
 
 
 def did_login_fail(result: Response) -> bool:
-    soup = __create_soup(result)
+    soup = __create_soup(result, LOGIN_FAILED_STRAINER)
 
-    login_failed = bool(
-        soup.find_all(
-            "div", {"class": "alert alert-danger alert-dismissible fade show"}
-        )
-    )
+    login_failed = bool(soup.find_all("div", LOGIN_FAILED_ALERT))
 
     return login_failed
 
 
 def parse_challenge_screen_data(result: Response) -> ChallengeScreenData:
-    soup = __create_soup(result)
-    challenge_creation_number = __parse_chlc_number(soup)
-    application_screen_endpoint = __parse_application_endpoint(soup)
-    vulnerable_branches = __parse_challenge_vulnerable_branches(soup)
-    secure_branch = __parse_challenge_secure_branch(soup)
+    soup = __create_soup(result, CHALLENGE_SCREEN_STRAINER)
+    branches = __parse_branch_names(soup)
+
+    # Branch icons outside of the expected containers require the full page
+    if len(branches) < 5:
+        soup = __create_soup(result)
+        branches = __parse_branch_names(soup)
+
+    page_links = __parse_links(soup)
+    vulnerable_branches = __parse_challenge_vulnerable_branches(branches)
+    secure_branch = __parse_challenge_secure_branch(branches)
 
     return ChallengeScreenData(
-        application_screen_endpoint,
-        ChallengeCreationIssue(challenge_creation_number),
+        page_links.application_endpoint,
+        ChallengeCreationIssue(page_links.chlc_number),
         secure_branch,
         vulnerable_branches,
     )
 
 
 def parse_application_screen_data(result: Response) -> ApplicationScreenData:
-    soup = __create_soup(result)
+    soup = __create_soup(result, APPLICATION_SCREEN_STRAINER)
 
-    application_creation_number = __parse_chlc_number(soup)
-    repository_name = __parse_git_repository(soup)
-    challenges = __parse_challenges(soup)
+    page_links = __parse_links(soup)
+    challenge_rows = __parse_challenge_rows(soup)
+    challenges = __parse_challenges(challenge_rows)
 
     return ApplicationScreenData(
-        ApplicationCreationIssue(application_creation_number),
-        repository_name,
+        ApplicationCreationIssue(page_links.chlc_number),
+        page_links.git_repository,
         challenges,
+        challenge_rows,
     )
 
 
 def parse_application_screen_with_challenges_data(
     result: Response,
 ) -> ApplicationScreenData:
-    soup = __create_soup(result)
+    return parse_application_screen_data(result)
 
-    application_creation_number = __parse_chlc_number(soup)
-    repository_name = __parse_git_repository(soup)
-    challenges = __parse_challenges(soup)
 
-    return ApplicationScreenData(
-        ApplicationCreationIssue(application_creation_number),
-        repository_name,
-        challenges,
+def parse_application_list_page(result: Response) -> ApplicationListPage:
+    soup = __create_soup(result, APPLICATION_LIST_STRAINER)
+
+    return ApplicationListPage(
+        __parse_application_links(soup),
+        __parse_next_page_url(soup),
     )
@@ -3,3 +3,5 @@ from .checkout_failed_error import CheckoutFailedError
 from .merge_conflict_error import MergeConflictError
 from .invalid_issue_id_error import InvalidIssueIdError
 from .continue_cherry_picking_failed_error import ContinueCherryPickingFailedError
+from .invalid_credentials_error import InvalidCredentialsError
+from .invalid_job_error import InvalidJobError
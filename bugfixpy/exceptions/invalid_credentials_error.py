@@ -0,0 +1,5 @@
+from .request_failed_error import RequestFailedError
+
+
+class InvalidCredentialsError(RequestFailedError):
+    """Raise error when Jira rejects the stored API credentials"""
@@ -0,0 +1,2 @@
+class InvalidJobError(Exception):
+    """Raise error when a batch job in the manifest is invalid"""
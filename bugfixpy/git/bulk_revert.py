@@ -0,0 +1,95 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .repository import Repository
+from . import constants
+
+
+@dataclass
+class RevertOutcome:
+    branch: str
+    elapsed: float = 0
+    branch_commit: Optional[str] = None
+    new_commit: Optional[str] = None
+    conflicted_files: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+    empty: bool = False
+
+    def needs_checkout(self) -> bool:
+        return self.new_commit is None and not self.empty
+
+
+class BulkRevert:
+    """Revert a commit on every branch that contains it without checking any out"""
+
+    __repository: Repository
+    __commit_id: str
+    __max_workers: int
+
+    def __init__(
+        self,
+        repository: Repository,
+        commit_id: str,
+        max_workers: int = constants.PREFLIGHT_MAX_WORKERS,
+    ) -> None:
+        self.__repository = repository
+        self.__commit_id = commit_id
+        self.__max_workers = max(1, max_workers)
+
+    def run(self) -> list[RevertOutcome]:
+        branches = self.__repository.get_branches_containing(self.__commit_id)
+        self.__repository.create_local_branches(branches)
+        current_branch = self.__repository.get_current_branch()
+
+        # Moving the checked out branch would leave its working tree behind
+        in_memory_branches = [branch for branch in branches if branch != current_branch]
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            reverted = dict(
+                zip(
+                    in_memory_branches,
+                    executor.map(self.__revert_in_memory, in_memory_branches),
+                )
+            )
+
+        outcomes = [
+            reverted.get(branch)
+            or RevertOutcome(branch, error="Checked out branch needs a checkout")
+            for branch in branches
+        ]
+        self.__update_branches(outcomes)
+
+        return outcomes
+
+    def __revert_in_memory(self, branch: str) -> RevertOutcome:
+        start = time.perf_counter()
+        simulation = self.__repository.simulate_revert(self.__commit_id, branch)
+        new_commit = self.__repository.commit_revert(self.__commit_id, simulation)
+
+        return RevertOutcome(
+            branch,
+            time.perf_counter() - start,
+            simulation.branch_commit,
+            new_commit,
+            simulation.conflicted_files,
+            simulation.error,
+            simulation.is_clean() and new_commit is None,
+        )
+
+    def __update_branches(self, outcomes: list[RevertOutcome]) -> None:
+        updates = {
+            outcome.branch: (outcome.new_commit, outcome.branch_commit)
+            for outcome in outcomes
+            if outcome.new_commit
+        }
+
+        if self.__repository.update_branches(updates, f"revert: {self.__commit_id}"):
+            return
+
+        # The transaction is all or nothing, so every branch goes through a checkout
+        for outcome in outcomes:
+            if outcome.branch in updates:
+                outcome.new_commit = None
+                outcome.error = "Branch moved while reverting"
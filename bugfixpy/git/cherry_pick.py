@@ -5,6 +5,11 @@ from bugfixpy.utils import prompt_user
 from bugfixpy.exceptions import CheckoutFailedError, MergeConflictError
 
 from .repository import Repository
+from .parallel_cherry_pick import ParallelCherryPick
+from .conflict_preflight import ConflictPreflight
+from .plumbing import CherryPickSimulation
+from .fix_journal import FixJournal
+from . import constants
 
 
 class CherryPick:
@@ -13,29 +18,152 @@ class CherryPick:
     __commit_id: str
     __branches: list[str]
     __is_manual: bool
+    __max_workers: int
+    __completed: int
+    __journal: FixJournal
 
     def __init__(
         self,
         repository: Repository,
         is_manual=False,
         branches: Optional[list[str]] = None,
+        max_workers: int = constants.CHERRY_PICK_MAX_WORKERS,
+        commit_id: Optional[str] = None,
     ) -> None:
         self.__repository = repository
-        self.__commit_id = repository.get_last_commit_id()
+        self.__commit_id = commit_id or repository.get_last_commit_id()
         self.__branches = branches if branches else self.__get_branches_without_secure()
         self.__is_manual = is_manual
+        self.__max_workers = max_workers
+        self.__completed = 0
+        self.__journal = repository.get_journal()
 
     def across_all_branches(self) -> None:
-        for i, branch in enumerate(self.__branches):
-            self.__checkout_to_and_cherrypick_branch(branch)
-            self.__display_percentage_complete(i)
+        self.__repository.scope_sparse_checkout_to_commit(self.__commit_id)
+
+        try:
+            branches = self.__get_unfinished_branches()
+            self.__repository.create_local_branches(branches)
+            simulations = self.__run_conflict_preflight(branches)
+            conflicting_branches = [
+                branch for branch in branches if simulations[branch].conflicted_files
+            ]
+            # Each branch takes the cheapest path that can pick it. A cherry-pick
+            # the preflight simulated cleanly is committed without a checkout. One
+            # it could not simulate, such as a merge commit, needs git cherry-pick
+            # and runs in parallel worktrees. Empty picks, the checked out branch
+            # and conflicts are left to a checkout, one branch at a time
+            remaining_branches = self.__cherry_pick_without_checkout(
+                [branch for branch in branches if branch not in conflicting_branches],
+                simulations,
+            )
+            unsimulated_branches = [
+                branch for branch in remaining_branches if simulations[branch].error
+            ]
+
+            if self.__max_workers > 1 and len(unsimulated_branches) > 1:
+                queued_branches = [
+                    branch
+                    for branch in remaining_branches
+                    if branch not in unsimulated_branches
+                ] + self.__cherry_pick_in_parallel(unsimulated_branches)
+            else:
+                queued_branches = remaining_branches
+
+            # Conflicts are resolved last, so every clean branch is done before
+            # the run waits for the user
+            self.__cherry_pick_with_checkout(queued_branches + conflicting_branches)
+        finally:
+            self.__repository.restore_full_checkout()
+
+    def __get_unfinished_branches(self) -> list[str]:
+        self.__journal.start_cherry_pick(self.__commit_id, self.__branches)
+        branches = [
+            branch
+            for branch in self.__branches
+            if not self.__journal.is_finished(branch, self.__commit_id)
+        ]
+
+        self.__completed = len(self.__branches) - len(branches)
+        if self.__completed:
+            print(f"Skipping {self.__completed} branches finished in the previous run")
+
+        return branches
+
+    def __run_conflict_preflight(
+        self, branches: list[str]
+    ) -> dict[str, CherryPickSimulation]:
+        preflight = ConflictPreflight(self.__repository, self.__commit_id)
+        simulations = preflight.run(branches)
+        preflight.display_report(simulations)
+
+        return {simulation.branch: simulation for simulation in simulations}
+
+    def __cherry_pick_without_checkout(
+        self, branches: list[str], simulations: dict[str, CherryPickSimulation]
+    ) -> list[str]:
+        current_branch = self.__repository.get_current_branch()
+        remaining_branches = []
+
+        # Updating the ref of the checked out branch would leave its working
+        # tree behind, so it always goes through a checkout
+        for branch in branches:
+            if branch != current_branch and (
+                self.__repository.cherry_pick_without_checkout(
+                    self.__commit_id, branch, simulations.get(branch)
+                )
+            ):
+                self.__complete_branch(branch)
+            else:
+                remaining_branches.append(branch)
+
+        return remaining_branches
+
+    def __cherry_pick_in_parallel(self, branches: list[str]) -> list[str]:
+        current_branch = self.__repository.get_current_branch()
+
+        # The checked out branch cannot be checked out in a worktree as well, so
+        # it is cherry-picked with the merge conflicts
+        queued_branches = [branch for branch in branches if branch == current_branch]
+        failed_checkouts = []
+
+        for outcome in ParallelCherryPick(
+            self.__repository, self.__commit_id, self.__max_workers
+        ).across_branches([branch for branch in branches if branch != current_branch]):
+            if outcome.conflicted:
+                queued_branches.append(outcome.branch)
+                print(
+                    f"{colors.WARNING}[ !!! ]{colors.ENDC} {outcome.branch}:"
+                    f" {colors.WARNING}MERGE CONFLICT, queued{colors.ENDC}"
+                )
+            elif outcome.error:
+                failed_checkouts.append(outcome.branch)
+                print(
+                    f"Exception occurred while checking out to branch: {outcome.error}"
+                )
+            else:
+                self.__complete_branch(outcome.branch)
+
+        if failed_checkouts:
+            prompt_user.if_they_want_to_continue()
+
+        return queued_branches
+
+    def __cherry_pick_with_checkout(self, branches: list[str]) -> None:
+        if branches:
+            print(f"Cherry picking {len(branches)} remaining branches...")
+
+        for branch in branches:
+            if self.__checkout_to_and_cherrypick_branch(branch):
+                self.__repository.mark_branch_advanced(branch)
+            self.__display_percentage_complete(branch)
 
     def __get_branches_without_secure(self) -> list[str]:
         branches = self.__repository.get_branches()
         branches.remove("secure")
         return branches
 
-    def __checkout_to_and_cherrypick_branch(self, branch: str) -> None:
+    def __checkout_to_and_cherrypick_branch(self, branch: str) -> bool:
         try:
             self.__repository.checkout_to_branch(branch)
             self.__cherry_pick_branch(branch)
@@ -43,14 +171,20 @@ class CherryPick:
         except CheckoutFailedError as err:
             print(f"Exception occurred while checking out to branch: {err}")
             prompt_user.if_they_want_to_continue()
+            return False
+
+        return True
 
     def __cherry_pick_branch(self, branch: str) -> None:
         try:
             self.__repository.cherry_pick(self.__commit_id)
+            self.__journal.set_branch_state(branch, constants.BRANCH_PICKED)
 
         except MergeConflictError:
+            self.__journal.set_branch_state(branch, constants.BRANCH_CONFLICTED)
             self.__alert_user_merge_conflict_occured(branch)
             self.__resolve_merge_conflict()
+            self.__journal.set_branch_state(branch, constants.BRANCH_RESOLVED)
 
     def __resolve_merge_conflict(self) -> None:
         self.__repository.open_code_in_editor()
@@ -72,9 +206,15 @@ class CherryPick:
             f"{colors.WARNING}[ !!! ]{colors.ENDC} {branch}: {colors.WARNING}MERGE CONFLICT"
         )
 
-    def __display_percentage_complete(self, current_index: int) -> None:
-        percentage = (current_index + 1) * 100 / len(self.__branches)
+    def __complete_branch(self, branch: str) -> None:
+        self.__repository.mark_branch_advanced(branch)
+        self.__journal.set_branch_state(branch, constants.BRANCH_PICKED)
+        self.__display_percentage_complete(branch)
+
+    def __display_percentage_complete(self, branch: str) -> None:
+        self.__completed += 1
+        percentage = self.__completed * 100 / len(self.__branches)
         print(
             f"[{colors.OKCYAN}{percentage:.1f}%{colors.ENDC}]{colors.ENDC}"
-            f" {self.__branches[current_index]}: {colors.OKGREEN}[COMPLETE]{colors.ENDC}"
+            f" {branch}: {colors.OKGREEN}[COMPLETE]{colors.ENDC}"
         )
@@ -0,0 +1,84 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+from git.repo import Repo
+
+from . import constants
+from . import mirror_cache
+
+
+@dataclass
+class CloneReport:
+    strategy: str
+    elapsed: float
+    transferred_bytes: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.strategy} clone, {self.transferred_bytes / 1024 / 1024:.1f} MiB"
+            f" transferred in {self.elapsed:.1f}s"
+        )
+
+
+def clone(
+    name: str,
+    git_url: str,
+    repository_dir: str,
+    strategy: str = constants.CLONE_STRATEGY_FULL,
+    branches: Optional[list[str]] = None,
+) -> tuple[Repo, CloneReport]:
+    start = time.perf_counter()
+
+    # Narrow clones need the branches reported by the CMS
+    if strategy == constants.CLONE_STRATEGY_NARROW and not branches:
+        strategy = constants.CLONE_STRATEGY_FULL
+
+    if strategy == constants.CLONE_STRATEGY_FULL:
+        mirror_size = get_object_size(mirror_cache.get_mirror_dir(name))
+        repository = mirror_cache.clone_from_mirror(name, git_url, repository_dir)
+        transferred_bytes = (
+            get_object_size(mirror_cache.get_mirror_dir(name)) - mirror_size
+        )
+    else:
+        if strategy == constants.CLONE_STRATEGY_NARROW:
+            repository = clone_narrow(git_url, repository_dir, branches or [])
+        else:
+            repository = clone_blobless(git_url, repository_dir)
+        transferred_bytes = get_object_size(repository.git_dir)
+
+    report = CloneReport(
+        strategy, time.perf_counter() - start, max(0, transferred_bytes)
+    )
+
+    return repository, report
+
+
+def clone_blobless(git_url: str, repository_dir: str) -> Repo:
+    # Blobs are only fetched when a branch that needs them is checked out
+    return Repo.clone_from(git_url, repository_dir, filter=constants.BLOBLESS_FILTER)
+
+
+def clone_narrow(git_url: str, repository_dir: str, branches: list[str]) -> Repo:
+    repository = Repo.clone_from(
+        git_url, repository_dir, single_branch=True, branch=branches[0]
+    )
+
+    if len(branches) > 1:
+        repository.git.remote("set-branches", "origin", *branches)
+        repository.remote().fetch()
+
+    return repository
+
+
+def get_object_size(git_dir: str) -> int:
+    try:
+        output = Repo(git_dir).git.count_objects("-v")
+    except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError):
+        return 0
+
+    # count-objects reports loose and packed object sizes in KiB
+    counts = dict(line.split(": ", 1) for line in output.splitlines())
+
+    return (int(counts.get("size", 0)) + int(counts.get("size-pack", 0))) * 1024
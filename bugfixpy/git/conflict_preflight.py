@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from bugfixpy.utils.text import colors
+
+from .repository import Repository
+from .plumbing import CherryPickSimulation
+from . import constants
+
+
+class ConflictPreflight:
+    """Simulate cherry-picking a commit onto every branch before touching any"""
+
+    __repository: Repository
+    __commit_id: str
+    __max_workers: int
+
+    def __init__(
+        self,
+        repository: Repository,
+        commit_id: str,
+        max_workers: int = constants.PREFLIGHT_MAX_WORKERS,
+    ) -> None:
+        self.__repository = repository
+        self.__commit_id = commit_id
+        self.__max_workers = max(1, max_workers)
+
+    def run(self, branches: list[str]) -> list[CherryPickSimulation]:
+        if not branches:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda branch: self.__repository.simulate_cherry_pick(
+                        self.__commit_id, branch
+                    ),
+                    branches,
+                )
+            )
+
+    def display_report(self, simulations: list[CherryPickSimulation]) -> None:
+        conflicts = [
+            simulation for simulation in simulations if simulation.conflicted_files
+        ]
+
+        if not conflicts:
+            print(
+                f"Conflict pre-flight: {colors.OKGREEN}no conflicts in"
+                f" {len(simulations)} branches{colors.ENDC}"
+            )
+            return
+
+        print(
+            f"Conflict pre-flight: {colors.WARNING}{len(conflicts)} of"
+            f" {len(simulations)} branches will conflict{colors.ENDC}"
+        )
+
+        for simulation in conflicts:
+            print(
+                f"{colors.WARNING}[ !!! ]{colors.ENDC} {simulation.branch}:"
+                f" {', '.join(simulation.conflicted_files)}"
+            )
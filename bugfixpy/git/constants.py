@@ -6,6 +6,63 @@ REPO_DIR = os.path.join(os.path.dirname(__file__), "../../data/repos")
 
 SCW_GIT_URL = "git@github.com:SCWContent"
 
+# Bare mirrors of the remote repositories that working copies are cloned from
+MIRROR_DIR = os.path.join(REPO_DIR, ".mirrors")
+
+# Worktrees the branches are cherry-picked in when cherry-picking in parallel
+WORKTREE_DIR = os.path.join(REPO_DIR, ".worktrees")
+
+# Suffix of the journal written next to a repository while it is being fixed
+JOURNAL_SUFFIX = ".journal.json"
+
+# States of a branch in the fix journal
+BRANCH_PENDING = "pending"
+BRANCH_PICKED = "picked"
+BRANCH_CONFLICTED = "conflicted"
+BRANCH_RESOLVED = "resolved"
+
+FINISHED_BRANCH_STATES = (BRANCH_PICKED, BRANCH_RESOLVED)
+
+# Clone strategy reported when a session resumes in the existing working copy
+CLONE_STRATEGY_RESUMED = "resumed"
+
+# Number of branches cherry-picked at the same time, each in its own worktree
+CHERRY_PICK_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Number of branches the conflict pre-flight simulates a cherry-pick on at once
+PREFLIGHT_MAX_WORKERS = 8
+
+# First git version whose merge-tree accepts an explicit --merge-base
+MERGE_TREE_MERGE_BASE_VERSION = (2, 40)
+
+# Refspec a mirror is updated with, so it only keeps the remote's branches
+MIRROR_FETCH_REFSPEC = "+refs/heads/*:refs/heads/*"
+
+# Clone every branch through the local mirror of the repository
+CLONE_STRATEGY_FULL = "full"
+
+# Partial clone that downloads blobs only when a checkout needs them
+CLONE_STRATEGY_BLOBLESS = "blobless"
+
+# Blobless clone whose checkout is scoped to the paths changed by the fix commit
+CLONE_STRATEGY_SPARSE = "sparse"
+
+# Clone that only fetches the secure and vulnerable branches of the challenges
+CLONE_STRATEGY_NARROW = "narrow"
+
+CLONE_STRATEGIES = (
+    CLONE_STRATEGY_FULL,
+    CLONE_STRATEGY_BLOBLESS,
+    CLONE_STRATEGY_SPARSE,
+    CLONE_STRATEGY_NARROW,
+)
+
+# Partial clone filter that leaves out every blob
+BLOBLESS_FILTER = "blob:none"
+
+# Flag git push --porcelain prints in front of a ref it did not update
+PUSH_REJECTED_FLAG = "!"
+
 FULL_APP_SECURE_BRANCH = "secure"
 
 IGNORE_BRANCHES = {"HEAD", "master", "review", "main", "temp", "empty"}
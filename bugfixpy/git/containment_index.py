@@ -0,0 +1,106 @@
+from typing import Optional
+
+from . import plumbing
+
+
+class ContainmentIndex:
+    """
+    Map commits to the branches that contain them. Every commit is looked up with
+    one for-each-ref --contains, after that the answer is kept up to date as
+    branches move instead of asking git again. Nothing is read from git before
+    the first lookup.
+    """
+
+    __repository_dir: str
+    __branch_refs: Optional[dict[str, tuple[str, str]]]
+    __containing: dict[str, set[str]]
+    __resolved: dict[str, Optional[str]]
+    __moved_branches: set[str]
+
+    def __init__(self, repository_dir: str) -> None:
+        self.__repository_dir = repository_dir
+        self.__containing = {}
+        self.__resolved = {}
+        self.__moved_branches = set()
+        self.__branch_refs = None
+
+    def get_branches_containing(self, commit_id: str) -> frozenset[str]:
+        commit = self.__resolve(commit_id)
+        if commit is None:
+            return frozenset()
+
+        branch_refs = self.__get_branch_refs()
+
+        if commit not in self.__containing:
+            refs = set(plumbing.get_refs_containing(self.__repository_dir, commit))
+            self.__containing[commit] = {
+                branch for branch, (ref, _) in branch_refs.items() if ref in refs
+            }
+
+        return frozenset(self.__containing[commit])
+
+    def branch_moved(self, branch: str) -> None:
+        # Branches are read on the first lookup, moves before it need no update
+        if self.__branch_refs is not None:
+            self.__moved_branches.add(branch)
+
+    def __get_branch_refs(self) -> dict[str, tuple[str, str]]:
+        if self.__branch_refs is None:
+            # A commit-graph lets --contains stop walking at commits older than the
+            # one it looks for, instead of walking every branch down to the root
+            plumbing.write_commit_graph(self.__repository_dir)
+            self.__branch_refs = plumbing.get_branch_refs(self.__repository_dir)
+        else:
+            self.__update_moved_branches()
+
+        return self.__branch_refs
+
+    def __resolve(self, commit_id: str) -> Optional[str]:
+        if commit_id not in self.__resolved:
+            self.__resolved[commit_id] = plumbing.resolve_commit(
+                self.__repository_dir, commit_id
+            )
+
+        return self.__resolved[commit_id]
+
+    def __update_moved_branches(self) -> None:
+        if not self.__moved_branches:
+            return
+
+        previous_refs = self.__branch_refs
+        self.__branch_refs = plumbing.get_branch_refs(self.__repository_dir)
+
+        for branch in self.__moved_branches:
+            old_commit = previous_refs.get(branch, (None, None))[1]
+            new_commit = self.__branch_refs.get(branch, (None, None))[1]
+
+            if old_commit != new_commit:
+                self.__update_branch(branch, old_commit, new_commit)
+
+        self.__moved_branches.clear()
+
+    def __update_branch(
+        self, branch: str, old_commit: Optional[str], new_commit: Optional[str]
+    ) -> None:
+        # A branch that moved forward still contains everything it did before, so
+        # only the commits it gained have to be added
+        if (
+            old_commit
+            and new_commit
+            and plumbing.is_ancestor(self.__repository_dir, old_commit, new_commit)
+        ):
+            gained_commits = plumbing.get_commits_between(
+                self.__repository_dir, old_commit, new_commit
+            )
+            for commit, branches in self.__containing.items():
+                if commit in gained_commits:
+                    branches.add(branch)
+            return
+
+        for commit, branches in self.__containing.items():
+            if new_commit and plumbing.is_ancestor(
+                self.__repository_dir, commit, new_commit
+            ):
+                branches.add(branch)
+            else:
+                branches.discard(branch)
@@ -8,6 +8,7 @@ from bugfixpy.utils import prompt_user
 from .repository import Repository
 from .cherry_pick import CherryPick
 from .fix_result import FixResult
+from .fix_journal import FixJournal
 from . import constants
 
 
@@ -18,6 +19,7 @@ class FixBranches:
     __fix_messages: list[str]
     __has_been_cherrypicked: bool
     __branches: Optional[list[str]]
+    __journal: FixJournal
 
     def __init__(
         self,
@@ -28,9 +30,15 @@ class FixBranches:
     ) -> None:
         self.__repository = repository
         self.__challenge_request_issue = challenge_request_issue
-        self.__fix_messages = []
+        self.__journal = repository.get_journal()
+        self.__fix_messages = self.__journal.get_fix_messages()
         self.__has_been_cherrypicked = False
-        self.__current_branch = self.__get_next_branch()
+        self.__current_branch = (
+            ""
+            if self.__journal.get_unfinished_cherry_picks()
+            or repository.is_fix_finished()
+            else self.__get_next_branch()
+        )
         self.__is_manual = is_manual
         self.__branches = branches
 
@@ -39,10 +47,21 @@ class FixBranches:
         return self.__get_fix_result()
 
     def run_fix(self) -> None:
+        if self.__repository.is_fix_finished():
+            print(instructions.FIX_FINISHED_IN_PREVIOUS_RUN)
+            self.__has_been_cherrypicked = self.__journal.has_cherry_picks()
+            return
+
+        if self.__journal.get_unfinished_cherry_picks():
+            self.__resume_cherry_picks()
+            self.__current_branch = self.__get_next_branch_or_continue()
+
         while self.__is_another_branch_to_fix():
             self.__make_fix_in_branch()
             self.__current_branch = self.__get_next_branch_or_continue()
 
+        self.__journal.finish_fix()
+
     def __is_another_branch_to_fix(self) -> bool:
         return self.__current_branch != ""
 
@@ -85,6 +104,22 @@ class FixBranches:
             self.__repository, is_manual=self.__is_manual, branches=self.__branches
         ).across_all_branches()
 
+    def __resume_cherry_picks(self) -> None:
+        self.__has_been_cherrypicked = True
+
+        unfinished_cherry_picks = self.__journal.get_unfinished_cherry_picks()
+        for fix_commit, branches in unfinished_cherry_picks.items():
+            print(
+                f"{colors.HEADER}Resuming cherry-pick of {fix_commit[:7]} onto"
+                f" {len(branches)} branches{colors.ENDC}"
+            )
+            CherryPick(
+                self.__repository,
+                is_manual=self.__is_manual,
+                branches=branches,
+                commit_id=fix_commit,
+            ).across_all_branches()
+
     def display_cherry_pick_to_user(self) -> None:
         input("Cherry picking required. Press [ENTER] to start")
 
@@ -108,7 +143,13 @@ class FixBranches:
         self.__repository.add_changes()
         message = self.__add_challenge_request_id_to_message(fix_message)
         self.__repository.commit_changes_with_message(message)
+        self.__repository.mark_branch_advanced(self.__current_branch)
         self.__fix_messages.append(f"{self.__current_branch}: {fix_message}")
+        self.__journal.record_fix(
+            self.__current_branch,
+            self.__repository.get_last_commit_id(),
+            self.__fix_messages[-1],
+        )
 
         return True
 
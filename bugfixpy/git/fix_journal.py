@@ -0,0 +1,149 @@
+import json
+import os
+import time
+from typing import Optional
+
+from . import constants
+
+
+class FixJournal:
+    """Progress of a fix session, written after every change so a run can resume"""
+
+    __repository_name: str
+    __path: str
+    __fixes: dict[str, str]
+    __fix_messages: list[str]
+    __branches: dict[str, dict[str, str]]
+    __fix_finished: bool
+
+    def __init__(
+        self, repository_name: str, repository_dir: Optional[str] = None
+    ) -> None:
+        self.__repository_name = repository_name
+        repository_dir = repository_dir or os.path.join(
+            constants.REPO_DIR, repository_name
+        )
+        self.__path = f"{repository_dir}{constants.JOURNAL_SUFFIX}"
+        self.__fixes = {}
+        self.__fix_messages = []
+        self.__branches = {}
+        self.__fix_finished = False
+
+    def load(self) -> bool:
+        try:
+            with open(self.get_path(), "r", encoding="utf-8") as journal_file:
+                journal = json.load(journal_file)
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(journal, dict):
+            return False
+
+        self.__fixes = journal.get("fixes", {})
+        self.__fix_messages = journal.get("fix_messages", [])
+        self.__branches = journal.get("branches", {})
+        self.__fix_finished = journal.get("fix_finished", False)
+
+        return True
+
+    def delete(self) -> None:
+        try:
+            os.remove(self.get_path())
+        except OSError:
+            pass
+
+    def get_path(self) -> str:
+        return self.__path
+
+    def record_fix(self, branch: str, fix_commit: str, fix_message: str) -> None:
+        self.__fixes[branch] = fix_commit
+        self.__fix_messages.append(fix_message)
+        self.__save()
+
+    def get_fix_commit(self, branch: str) -> Optional[str]:
+        return self.__fixes.get(branch)
+
+    def get_fix_messages(self) -> list[str]:
+        return list(self.__fix_messages)
+
+    def finish_fix(self) -> None:
+        self.__fix_finished = True
+        self.__save()
+
+    def is_fix_finished(self) -> bool:
+        return self.__fix_finished and not self.get_unfinished_cherry_picks()
+
+    def has_cherry_picks(self) -> bool:
+        return bool(self.__branches)
+
+    def start_cherry_pick(self, fix_commit: str, branches: list[str]) -> None:
+        for branch in branches:
+            if not self.is_finished(branch, fix_commit):
+                self.__branches[branch] = {
+                    "fix_commit": fix_commit,
+                    "state": constants.BRANCH_PENDING,
+                }
+        self.__save()
+
+    def set_branch_state(self, branch: str, state: str) -> None:
+        self.__branches[branch]["state"] = state
+        self.__save()
+
+    def get_branch_state(self, branch: str) -> Optional[str]:
+        return self.__branches.get(branch, {}).get("state")
+
+    def is_finished(self, branch: str, fix_commit: str) -> bool:
+        entry = self.__branches.get(branch, {})
+        return (
+            entry.get("fix_commit") == fix_commit
+            and entry.get("state") in constants.FINISHED_BRANCH_STATES
+        )
+
+    def get_finished_branches(self) -> list[str]:
+        finished_branches = list(self.__fixes)
+        for branch, entry in self.__branches.items():
+            if (
+                entry["state"] in constants.FINISHED_BRANCH_STATES
+                and branch not in finished_branches
+            ):
+                finished_branches.append(branch)
+
+        return finished_branches
+
+    def get_unfinished_cherry_picks(self) -> dict[str, list[str]]:
+        unfinished_cherry_picks: dict[str, list[str]] = {}
+        for branch, entry in self.__branches.items():
+            if entry["state"] not in constants.FINISHED_BRANCH_STATES:
+                unfinished_cherry_picks.setdefault(entry["fix_commit"], []).append(
+                    branch
+                )
+
+        return unfinished_cherry_picks
+
+    def reset_conflicted_branches(self) -> None:
+        # The resolution of a conflict the run stopped in was aborted with it
+        for entry in self.__branches.values():
+            if entry["state"] == constants.BRANCH_CONFLICTED:
+                entry["state"] = constants.BRANCH_PENDING
+        self.__save()
+
+    def __save(self) -> None:
+        path = self.get_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "w", encoding="utf-8") as journal_file:
+            json.dump(
+                {
+                    "repository": self.__repository_name,
+                    "updated_at": time.time(),
+                    "fixes": self.__fixes,
+                    "fix_messages": self.__fix_messages,
+                    "branches": self.__branches,
+                    "fix_finished": self.__fix_finished,
+                },
+                journal_file,
+                indent=2,
+            )
+
+        os.replace(temp_path, path)
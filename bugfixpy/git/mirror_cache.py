@@ -0,0 +1,71 @@
+import fcntl
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Iterator
+
+from git import GitCommandError, InvalidGitRepositoryError
+from git.repo import Repo
+
+from . import constants
+
+
+def update_mirror(name: str, git_url: str) -> str:
+    mirror_dir = get_mirror_dir(name)
+
+    if os.path.isdir(mirror_dir):
+        try:
+            Repo(mirror_dir).git.fetch("--prune", "origin")
+            return mirror_dir
+        except (GitCommandError, InvalidGitRepositoryError):
+            # An interrupted clone or fetch can leave the mirror unusable, so
+            # start over from the remote
+            delete_mirror(name)
+
+    __clone_mirror(git_url, mirror_dir)
+
+    return mirror_dir
+
+
+def clone_from_mirror(name: str, git_url: str, repository_dir: str) -> Repo:
+    # Runs in other processes share the mirror, so only one updates it at a time
+    with __lock_mirror(name):
+        mirror_dir = update_mirror(name, git_url)
+
+        # A local clone hard links the mirror's objects instead of copying them
+        repository = Repo.clone_from(mirror_dir, repository_dir)
+    repository.remote().set_url(git_url)
+
+    return repository
+
+
+def get_mirror_dir(name: str) -> str:
+    return os.path.join(constants.MIRROR_DIR, f"{name}.git")
+
+
+def delete_mirror(name: str) -> None:
+    shutil.rmtree(get_mirror_dir(name), ignore_errors=True)
+
+
+@contextmanager
+def __lock_mirror(name: str) -> Iterator[None]:
+    os.makedirs(constants.MIRROR_DIR, exist_ok=True)
+
+    with open(f"{get_mirror_dir(name)}.lock", "w", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def __clone_mirror(git_url: str, mirror_dir: str) -> None:
+    temp_dir = f"{mirror_dir}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+    mirror = Repo.clone_from(git_url, temp_dir, bare=True)
+
+    # Only track branches, GitHub also advertises refs such as refs/pull/*
+    mirror.git.config("remote.origin.fetch", constants.MIRROR_FETCH_REFSPEC)
+
+    os.replace(temp_dir, mirror_dir)
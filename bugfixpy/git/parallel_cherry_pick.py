@@ -0,0 +1,109 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import Queue
+from typing import Iterator, Optional
+
+from git import GitCommandError
+from git.repo import Repo
+
+from .repository import Repository
+from . import constants
+
+
+@dataclass
+class CherryPickOutcome:
+    branch: str
+    conflicted: bool = False
+    error: Optional[str] = None
+
+    def succeeded(self) -> bool:
+        return not self.conflicted and self.error is None
+
+
+class ParallelCherryPick:
+    """Cherry-pick a commit onto many branches at once, one worktree per worker"""
+
+    __repository: Repository
+    __commit_id: str
+    __max_workers: int
+
+    def __init__(
+        self,
+        repository: Repository,
+        commit_id: str,
+        max_workers: int = constants.CHERRY_PICK_MAX_WORKERS,
+    ) -> None:
+        self.__repository = repository
+        self.__commit_id = commit_id
+        self.__max_workers = max_workers
+
+    def across_branches(self, branches: list[str]) -> Iterator[CherryPickOutcome]:
+        worker_count = max(1, min(self.__max_workers, len(branches)))
+        worktree_dirs = [
+            os.path.join(constants.WORKTREE_DIR, f"{self.__repository.name}-{worker}")
+            for worker in range(worker_count)
+        ]
+
+        self.__repository.create_local_branches(branches)
+
+        try:
+            worktree_queue: Queue = Queue()
+            for worktree_dir in worktree_dirs:
+                self.__repository.add_worktree(worktree_dir)
+                worktree_queue.put(worktree_dir)
+
+            with ProcessPoolExecutor(
+                worker_count,
+                initializer=init_worker,
+                initargs=(worktree_queue,),
+            ) as executor:
+                futures = [
+                    executor.submit(cherry_pick_in_worktree, branch, self.__commit_id)
+                    for branch in branches
+                ]
+
+                for future in as_completed(futures):
+                    yield future.result()
+        finally:
+            for worktree_dir in worktree_dirs:
+                self.__repository.remove_worktree(worktree_dir)
+
+
+__worktree_dir: Optional[str] = None
+
+
+def init_worker(worktree_queue: Queue) -> None:
+    global __worktree_dir
+
+    # Each worker process owns one worktree for the whole run
+    __worktree_dir = worktree_queue.get()
+
+
+def cherry_pick_in_worktree(branch: str, commit_id: str) -> CherryPickOutcome:
+    worktree = Repo(__worktree_dir)
+
+    try:
+        worktree.git.checkout(branch)
+    except GitCommandError as err:
+        return CherryPickOutcome(branch, error=str(err))
+
+    try:
+        worktree.git.cherry_pick(commit_id)
+        outcome = CherryPickOutcome(branch)
+    except GitCommandError as err:
+        # Leave the branch untouched so it can be resolved in the main worktree
+        if worktree.git.rev_parse(
+            "-q", "--verify", "CHERRY_PICK_HEAD", with_exceptions=False
+        ):
+            worktree.git.cherry_pick("--abort")
+        outcome = (
+            CherryPickOutcome(branch, conflicted=True)
+            if err.status == 1
+            else CherryPickOutcome(branch, error=str(err))
+        )
+
+    # Release the branch, a branch can only be checked out in one worktree
+    worktree.git.checkout("--detach")
+
+    return outcome
@@ -0,0 +1,398 @@
+import os
+import re
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from . import constants
+
+
+@dataclass
+class CherryPickSimulation:
+    branch: str
+    branch_commit: Optional[str] = None
+    tree: Optional[str] = None
+    conflicted_files: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def is_clean(self) -> bool:
+        return self.tree is not None
+
+
+def simulate_cherry_pick(
+    repository_dir: str, commit_id: str, branch: str
+) -> CherryPickSimulation:
+    """
+    Merge a commit into a branch in memory. The working tree and index are not
+    touched, conflicts are reported with the files they occur in.
+    """
+    branch_commit = __rev_parse(repository_dir, f"refs/heads/{branch}")
+    if branch_commit is None:
+        return CherryPickSimulation(branch, error="Branch does not exist")
+
+    parent = __get_single_parent(repository_dir, commit_id)
+
+    # Merge commits need a mainline to cherry-pick, leave them to git cherry-pick
+    if parent is None:
+        return CherryPickSimulation(
+            branch, branch_commit, error="Only single parent commits are simulated"
+        )
+
+    return __merge_into_branch(
+        repository_dir, CherryPickSimulation(branch, branch_commit), parent, commit_id
+    )
+
+
+def simulate_revert(
+    repository_dir: str, commit_id: str, branch: str
+) -> CherryPickSimulation:
+    """
+    Revert a commit on a branch in memory. This is a cherry-pick of the commit's
+    parent with the commit itself as merge base, so the same simulation is used.
+    """
+    branch_commit = __rev_parse(repository_dir, f"refs/heads/{branch}")
+    if branch_commit is None:
+        return CherryPickSimulation(branch, error="Branch does not exist")
+
+    parent = __get_single_parent(repository_dir, commit_id)
+    if parent is None:
+        return CherryPickSimulation(
+            branch, branch_commit, error="Only single parent commits are simulated"
+        )
+
+    return __merge_into_branch(
+        repository_dir, CherryPickSimulation(branch, branch_commit), commit_id, parent
+    )
+
+
+def cherry_pick_onto_branch(
+    repository_dir: str,
+    commit_id: str,
+    branch: str,
+    simulation: Optional[CherryPickSimulation] = None,
+) -> Optional[str]:
+    """
+    Cherry-pick a commit onto a branch without checking it out. Returns the new
+    commit, or None when the commit does not apply cleanly and needs a checkout.
+    A simulation of the same cherry-pick is reused instead of merging again.
+    """
+    if simulation is None:
+        simulation = simulate_cherry_pick(repository_dir, commit_id, branch)
+
+    # A cherry-pick that changes nothing is left to git to report as empty
+    if not simulation.is_clean() or simulation.tree == __rev_parse(
+        repository_dir, f"{simulation.branch_commit}^{{tree}}"
+    ):
+        return None
+
+    new_commit = __commit_tree(
+        repository_dir,
+        simulation.tree,
+        simulation.branch_commit,
+        __get_commit_message(repository_dir, commit_id),
+        __get_author_env(repository_dir, commit_id),
+    )
+
+    # Only move the branch if nothing else updated it in the meantime
+    update = __git(
+        repository_dir,
+        "update-ref",
+        "-m",
+        f"cherry-pick: {commit_id}",
+        f"refs/heads/{branch}",
+        new_commit,
+        simulation.branch_commit,
+    )
+
+    return new_commit if update.returncode == 0 else None
+
+
+def commit_revert(
+    repository_dir: str, commit_id: str, simulation: CherryPickSimulation
+) -> Optional[str]:
+    """
+    Commit a clean revert simulation on top of its branch without moving the
+    branch, so the refs of many branches can be updated in one transaction.
+    Returns None when the revert does not apply cleanly or changes nothing.
+    """
+    if not simulation.is_clean() or simulation.tree == __rev_parse(
+        repository_dir, f"{simulation.branch_commit}^{{tree}}"
+    ):
+        return None
+
+    subject = __git(
+        repository_dir, "show", "-s", "--format=%s", commit_id
+    ).stdout.decode()
+    full_commit_id = __rev_parse(repository_dir, f"{commit_id}^{{commit}}")
+    message = f'Revert "{subject.strip()}"\n\nThis reverts commit {full_commit_id}.\n'
+
+    return __commit_tree(
+        repository_dir, simulation.tree, simulation.branch_commit, message.encode()
+    )
+
+
+def update_branches(
+    repository_dir: str, updates: dict[str, tuple[str, str]], message: str
+) -> bool:
+    """
+    Move every branch from its old commit to its new commit in one transaction.
+    Nothing is updated if any branch no longer points at its old commit.
+    """
+    if not updates:
+        return True
+
+    commands = "".join(
+        f"update refs/heads/{branch} {new_commit} {old_commit}\n"
+        for branch, (new_commit, old_commit) in updates.items()
+    )
+    update = __git(
+        repository_dir,
+        "update-ref",
+        "-m",
+        message,
+        "--stdin",
+        input=commands.encode(),
+    )
+
+    return update.returncode == 0
+
+
+def get_branch_refs(repository_dir: str) -> dict[str, tuple[str, str]]:
+    """
+    Map every branch to the ref it is read from and the commit it points at. A
+    local branch takes the place of the remote-tracking branch it was created from.
+    """
+    result = __git(
+        repository_dir,
+        "for-each-ref",
+        "--format=%(refname) %(objectname)",
+        "refs/remotes/origin",
+        "refs/heads",
+    )
+    branch_refs = {}
+
+    for line in result.stdout.decode().splitlines():
+        ref, commit = line.split(" ", 1)
+        branch = __get_branch_name(ref)
+        if branch != "HEAD" and (
+            branch not in branch_refs or ref.startswith("refs/heads/")
+        ):
+            branch_refs[branch] = (ref, commit)
+
+    return branch_refs
+
+
+def get_refs_containing(repository_dir: str, commit_id: str) -> list[str]:
+    result = __git(
+        repository_dir,
+        "for-each-ref",
+        "--format=%(refname)",
+        f"--contains={commit_id}",
+        "refs/remotes/origin",
+        "refs/heads",
+    )
+
+    return result.stdout.decode().split() if result.returncode == 0 else []
+
+
+def get_commits_between(
+    repository_dir: str, old_commit: str, new_commit: str
+) -> set[str]:
+    result = __git(repository_dir, "rev-list", f"{old_commit}..{new_commit}")
+    return set(result.stdout.decode().split())
+
+
+def is_ancestor(repository_dir: str, commit_id: str, descendant: str) -> bool:
+    result = __git(repository_dir, "merge-base", "--is-ancestor", commit_id, descendant)
+    return result.returncode == 0
+
+
+def resolve_commit(repository_dir: str, commit_id: str) -> Optional[str]:
+    return __rev_parse(repository_dir, f"{commit_id}^{{commit}}")
+
+
+def write_commit_graph(repository_dir: str) -> bool:
+    result = __git(repository_dir, "commit-graph", "write", "--reachable")
+    return result.returncode == 0
+
+
+def supports_merge_tree_merge_base() -> bool:
+    return get_git_version() >= constants.MERGE_TREE_MERGE_BASE_VERSION
+
+
+@lru_cache(maxsize=None)
+def get_git_version() -> tuple[int, ...]:
+    version = subprocess.run(
+        ["git", "version"], capture_output=True, text=True, check=False
+    ).stdout
+    match = re.search(r"(\d+)\.(\d+)", version)
+
+    return tuple(int(part) for part in match.groups()) if match else (0, 0)
+
+
+def __merge_into_branch(
+    repository_dir: str,
+    simulation: CherryPickSimulation,
+    merge_base: str,
+    commit_id: str,
+) -> CherryPickSimulation:
+    branch_commit = simulation.branch_commit
+
+    if supports_merge_tree_merge_base():
+        merge = __git(
+            repository_dir,
+            "merge-tree",
+            "--write-tree",
+            "--name-only",
+            "--no-messages",
+            f"--merge-base={merge_base}",
+            branch_commit,
+            commit_id,
+        )
+        lines = merge.stdout.decode().splitlines()
+
+        if merge.returncode == 0:
+            simulation.tree = lines[0]
+        elif merge.returncode == 1:
+            simulation.conflicted_files = list(dict.fromkeys(lines[1:]))
+        else:
+            simulation.error = merge.stderr.decode().strip()
+
+        return simulation
+
+    # Older git can only merge-tree from the merge base of both commits, so apply
+    # the diff from the merge base to the commit to the branch's tree in a
+    # temporary index instead.
+    # --3way falls back to a merge of the blobs when the context lines moved
+    patch = __git(
+        repository_dir,
+        "diff-tree",
+        "-p",
+        "--binary",
+        "--full-index",
+        merge_base,
+        commit_id,
+    )
+    if patch.returncode != 0 or not patch.stdout:
+        simulation.error = "Commit has no changes"
+        return simulation
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        env = {**os.environ, "GIT_INDEX_FILE": os.path.join(index_dir, "index")}
+        __git(repository_dir, "read-tree", branch_commit, env=env).check_returncode()
+
+        applied = __git(
+            repository_dir,
+            "apply",
+            "--cached",
+            "--3way",
+            input=patch.stdout,
+            env=env,
+        )
+
+        if applied.returncode != 0:
+            unmerged = __git(repository_dir, "ls-files", "--unmerged", env=env)
+            simulation.conflicted_files = list(
+                dict.fromkeys(
+                    line.split("\t", 1)[1]
+                    for line in unmerged.stdout.decode().splitlines()
+                )
+            )
+
+            if not simulation.conflicted_files:
+                simulation.error = applied.stderr.decode().strip()
+
+            return simulation
+
+        tree = __git(repository_dir, "write-tree", env=env)
+        tree.check_returncode()
+
+    simulation.tree = tree.stdout.decode().strip()
+
+    return simulation
+
+
+def __commit_tree(
+    repository_dir: str,
+    tree: str,
+    branch_commit: str,
+    message: bytes,
+    env: Optional[dict[str, str]] = None,
+) -> str:
+    commit = __git(
+        repository_dir,
+        "commit-tree",
+        tree,
+        "-p",
+        branch_commit,
+        input=message,
+        env=env,
+    )
+    commit.check_returncode()
+
+    return commit.stdout.decode().strip()
+
+
+def __get_commit_message(repository_dir: str, commit_id: str) -> bytes:
+    raw_commit = __git(repository_dir, "cat-file", "commit", commit_id).stdout
+    return raw_commit.split(b"\n\n", 1)[1]
+
+
+def __get_author_env(repository_dir: str, commit_id: str) -> dict[str, str]:
+    author = (
+        __git(
+            repository_dir,
+            "show",
+            "-s",
+            "--date=raw",
+            "--format=%an%x00%ae%x00%ad",
+            commit_id,
+        )
+        .stdout.decode()
+        .strip("\n")
+    )
+    name, email, date = author.split("\0")
+
+    # Keep the original author like git cherry-pick does
+    return {
+        **os.environ,
+        "GIT_AUTHOR_NAME": name,
+        "GIT_AUTHOR_EMAIL": email,
+        "GIT_AUTHOR_DATE": date,
+    }
+
+
+def __get_single_parent(repository_dir: str, commit_id: str) -> Optional[str]:
+    parents = __git(repository_dir, "rev-list", "--parents", "-n", "1", commit_id)
+    commit_and_parents = parents.stdout.decode().split()
+
+    if parents.returncode != 0 or len(commit_and_parents) != 2:
+        return None
+
+    return commit_and_parents[1]
+
+
+def __get_branch_name(ref: str) -> str:
+    return ref.removeprefix("refs/heads/").removeprefix("refs/remotes/origin/")
+
+
+def __rev_parse(repository_dir: str, revision: str) -> Optional[str]:
+    result = __git(repository_dir, "rev-parse", "-q", "--verify", revision)
+    return result.stdout.decode().strip() if result.returncode == 0 else None
+
+
+def __git(
+    repository_dir: str,
+    *args: str,
+    input: Optional[bytes] = None,  # pylint: disable=redefined-builtin
+    env: Optional[dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", "-C", repository_dir, *args],
+        input=input,
+        env=env,
+        capture_output=True,
+        check=False,
+    )
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+
+from . import constants
+
+
+@dataclass
+class RefPushResult:
+    branch: str
+    flag: str
+    summary: str
+
+    def succeeded(self) -> bool:
+        return self.flag != constants.PUSH_REJECTED_FLAG
+
+
+@dataclass
+class PushReport:
+    elapsed: float = 0
+    results: list[RefPushResult] = field(default_factory=list)
+    error: str = ""
+
+    def succeeded(self) -> bool:
+        return not self.error and all(result.succeeded() for result in self.results)
+
+
+def parse_porcelain_output(output: str) -> list[RefPushResult]:
+    results = []
+
+    # Ref lines look like "<flag>\t<from>:<to>\t<summary>"
+    for line in output.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 3 or len(parts[0]) != 1:
+            continue
+
+        flag, refspec, summary = parts
+        branch = refspec.split(":")[-1].removeprefix("refs/heads/")
+        results.append(RefPushResult(branch, flag, summary))
+
+    return results
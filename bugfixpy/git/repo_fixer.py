@@ -23,15 +23,29 @@ class RepoFixer:
         challenge_request_issue: ChallengeRequestIssue,
     ) -> FixResult:
         fix_message = "Fixed vulnerable packages per dependabot alerts"
-        self.repository.checkout_to_branch(branch_to_fix)
-        print(instructions.PROMPT_USER_TO_MAKE_FIX)
-        self.repository.open_code_in_editor()
+        fix_commit = None
+        if self.repository.was_resumed():
+            fix_commit = self.repository.get_journal().get_fix_commit(branch_to_fix)
+
+        # A resumed run only finishes cherry-picking a fix it already made
+        if fix_commit is None:
+            self.repository.checkout_to_branch(branch_to_fix)
+            print(instructions.PROMPT_USER_TO_MAKE_FIX)
+            self.repository.open_code_in_editor()
+
+            prompt_user.to_press_enter_after_making_changes()
+            self.__attempt_to_commit_until_successful(
+                fix_message, challenge_request_issue
+            )
+        else:
+            print(f"{branch_to_fix} was fixed in the previous run")
 
-        prompt_user.to_press_enter_after_making_changes()
-        self.__attempt_to_commit_until_successful(fix_message, challenge_request_issue)
         print("Cherry picking challenge...")
         CherryPick(
-            self.repository, is_manual=False, branches=cherry_pick_branches
+            self.repository,
+            is_manual=False,
+            branches=cherry_pick_branches,
+            commit_id=fix_commit,
         ).across_all_branches()
 
         return FixResult(
@@ -65,6 +79,12 @@ class RepoFixer:
             fix_message, challenge_request_issue
         )
         self.repository.commit_changes_with_message(message)
+        self.repository.mark_branch_advanced(self.repository.get_current_branch())
+        self.repository.get_journal().record_fix(
+            self.repository.get_current_branch(),
+            self.repository.get_last_commit_id(),
+            fix_message,
+        )
         issue_messages.append(f"{self.repository.get_current_branch()}: {fix_message}")
 
         return issue_messages
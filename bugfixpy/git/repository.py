@@ -1,9 +1,10 @@
 import os
-from typing import List
+import time
+from typing import List, Optional
 import subprocess
 import shutil
 
-from git import GitCommandError, GitError
+from git import GitCommandError, GitError, InvalidGitRepositoryError, NoSuchPathError
 from git.repo import Repo
 from bugfixpy import git
 from bugfixpy.exceptions import (
@@ -12,6 +13,12 @@ from bugfixpy.exceptions import (
     ContinueCherryPickingFailedError,
 )
 from . import constants
+from .clone import CloneReport, clone
+from . import plumbing
+from .plumbing import CherryPickSimulation
+from .push import PushReport, parse_porcelain_output
+from .containment_index import ContainmentIndex
+from .fix_journal import FixJournal
 
 
 class Repository:
@@ -20,13 +27,43 @@ class Repository:
     branches: list[str]
     fix_messages: List[str]
     has_cherrypicked: bool
-
-    def __init__(self, name: str) -> None:
+    clone_strategy: str
+    clone_report: CloneReport
+    __clone_branches: Optional[list[str]]
+    __repository_dir: str
+    __advanced_branches: dict[str, None]
+    __containment_index: ContainmentIndex
+    __journal: FixJournal
+    __resumed: bool
+
+    def __init__(
+        self,
+        name: str,
+        clone_strategy: str = constants.CLONE_STRATEGY_FULL,
+        clone_branches: Optional[list[str]] = None,
+        resume: bool = False,
+        repository_dir: Optional[str] = None,
+    ) -> None:
         self.name = name
+        self.__repository_dir = repository_dir or os.path.join(constants.REPO_DIR, name)
         self.fix_messages = []
         self.has_cherrypicked = False
-        self.__delete_local_and_clone_repository()
+        self.clone_strategy = clone_strategy
+        self.__clone_branches = clone_branches
+        self.__advanced_branches = {}
+        self.__journal = FixJournal(name, self.__repository_dir)
+        self.__resumed = resume and self.__resume_existing_repository()
+
+        if not self.__resumed:
+            self.__journal.delete()
+            self.__delete_local_and_clone_repository()
+
         self.branches = self.__get_filtered_branches()
+        self.__containment_index = ContainmentIndex(self.get_repository_dir())
+
+        # Branches finished before the run stopped were never pushed
+        for branch in self.__journal.get_finished_branches():
+            self.mark_branch_advanced(branch)
 
     def get_branches(self) -> list[str]:
         return self.branches
@@ -34,6 +71,36 @@ class Repository:
     def get_current_branch(self) -> str:
         return self.repository.active_branch.name
 
+    def get_journal(self) -> FixJournal:
+        return self.__journal
+
+    def was_resumed(self) -> bool:
+        return self.__resumed
+
+    def is_fix_finished(self) -> bool:
+        # Only the push and the transitions were left when the run stopped
+        return self.__resumed and self.__journal.is_fix_finished()
+
+    def __resume_existing_repository(self) -> bool:
+        if not self.__journal.load():
+            return False
+
+        try:
+            self.repository = Repo(self.get_repository_dir())
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            return False
+
+        # A cherry-pick or revert the run stopped in is started over
+        for command in (self.repository.git.cherry_pick, self.repository.git.revert):
+            try:
+                command("--abort")
+            except GitCommandError:
+                pass
+        self.__journal.reset_conflicted_branches()
+        self.clone_report = CloneReport(constants.CLONE_STRATEGY_RESUMED, 0, 0)
+
+        return True
+
     def __delete_local_and_clone_repository(self) -> None:
         self.__delete_repository_if_exists()
         self.repository = self.clone_repository()
@@ -45,6 +112,60 @@ class Repository:
         except OSError:
             pass
 
+    def get_clone_report(self) -> CloneReport:
+        return self.clone_report
+
+    def scope_sparse_checkout_to_commit(self, commit_id: str) -> None:
+        if self.clone_strategy != constants.CLONE_STRATEGY_SPARSE:
+            return
+
+        changed_paths = self.repository.git.diff_tree(
+            "--no-commit-id", "--name-only", "-r", commit_id
+        ).splitlines()
+
+        if not changed_paths:
+            return
+
+        # Anchored patterns only match the changed files, not same named files
+        # in other directories
+        self.repository.git.sparse_checkout(
+            "set", "--no-cone", *[f"/{path}" for path in changed_paths]
+        )
+
+    def restore_full_checkout(self) -> None:
+        if self.clone_strategy == constants.CLONE_STRATEGY_SPARSE:
+            self.repository.git.sparse_checkout("disable")
+
+    def create_local_branches(self, branches: list[str]) -> None:
+        local_branches = {head.name for head in self.repository.heads}
+        remote_branches = {
+            self.__parse_name_from_remote_branch(branch)
+            for branch in self.repository.remote().refs
+        }
+        commands = "".join(
+            f"create refs/heads/{branch} refs/remotes/origin/{branch}\n"
+            for branch in branches
+            if branch not in local_branches and branch in remote_branches
+        )
+
+        # Created in one transaction so checkouts in worktrees do not have to create
+        # tracking branches, which would write the shared config concurrently
+        if commands:
+            subprocess.run(
+                ["git", "-C", self.get_repository_dir(), "update-ref", "--stdin"],
+                input=commands,
+                text=True,
+                check=True,
+            )
+
+    def add_worktree(self, path: str) -> None:
+        self.remove_worktree(path)
+        self.repository.git.worktree("add", "--detach", path)
+
+    def remove_worktree(self, path: str) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        self.repository.git.worktree("prune")
+
     def get_num_branches(self) -> int:
         return len(self.branches)
 
@@ -103,8 +224,51 @@ class Repository:
 
         return modified_files
 
-    def push_all_branches(self) -> None:
-        self.repository.git.push(all=True)
+    def mark_branch_advanced(self, branch: str) -> None:
+        self.__advanced_branches[branch] = None
+        self.__containment_index.branch_moved(branch)
+
+    def get_advanced_branches(self) -> list[str]:
+        return list(self.__advanced_branches)
+
+    def push_advanced_branches(self) -> PushReport:
+        branches = self.get_advanced_branches()
+        if not branches:
+            return PushReport()
+
+        # Only update a branch on GitHub if it still points where it did when
+        # the repository was cloned
+        leases = [
+            f"--force-with-lease=refs/heads/{branch}:{self.__get_remote_commit(branch)}"
+            for branch in branches
+        ]
+        refspecs = [f"refs/heads/{branch}:refs/heads/{branch}" for branch in branches]
+
+        start = time.perf_counter()
+        status, output, error = self.repository.git.push(
+            "--atomic",
+            "--porcelain",
+            *leases,
+            "origin",
+            *refspecs,
+            with_extended_output=True,
+            with_exceptions=False,
+        )
+
+        return PushReport(
+            time.perf_counter() - start,
+            parse_porcelain_output(output),
+            error if status != 0 else "",
+        )
+
+    def __get_remote_commit(self, branch: str) -> str:
+        try:
+            return self.repository.git.rev_parse(
+                "-q", "--verify", f"refs/remotes/origin/{branch}"
+            )
+        except GitCommandError:
+            # An empty lease requires that the branch does not exist on GitHub yet
+            return ""
 
     def checkout_to_branch(self, branch: str) -> None:
         try:
@@ -115,6 +279,22 @@ class Repository:
     def add_changes(self) -> None:
         self.repository.git.add(u=True)
 
+    def add_all_changes(self) -> None:
+        self.repository.git.add(A=True)
+
+    def has_staged_changes(self) -> bool:
+        return bool(self.repository.git.diff("--cached", "--name-only"))
+
+    def apply_patch(self, patch_path: str) -> None:
+        self.repository.git.apply("--index", os.path.abspath(patch_path))
+
+    def run_fix_script(self, script_path: str, branch: str) -> None:
+        subprocess.run(
+            [os.path.abspath(script_path), branch],
+            cwd=self.get_repository_dir(),
+            check=True,
+        )
+
     def continue_cherrypicking(self) -> None:
         try:
             self.repository.git.cherry_pick("--continue")
@@ -139,7 +319,7 @@ class Repository:
                 raise MergeConflictError() from err
 
     def get_repository_dir(self) -> str:
-        return os.path.join(constants.REPO_DIR, self.name)
+        return self.__repository_dir
 
     def __is_not_excluded_branch(self, branch_name) -> bool:
         return branch_name not in constants.IGNORE_BRANCHES
@@ -160,25 +340,60 @@ class Repository:
         return str(self.repository.rev_parse("HEAD"))
 
     def branch_contains_commit_id(self, commit_id) -> bool:
-        try:
-            self.repository.git.branch("--contains", commit_id)
+        return bool(self.__containment_index.get_branches_containing(commit_id))
 
-        except GitCommandError:
-            return False
+    def get_branches_containing(self, commit_id: str) -> list[str]:
+        containing = self.__containment_index.get_branches_containing(commit_id)
+        return [branch for branch in self.branches if branch in containing]
 
-        return True
+    def get_branches_missing_commit(
+        self, commit_id: str, branches: list[str]
+    ) -> list[str]:
+        containing = self.__containment_index.get_branches_containing(commit_id)
+        return [branch for branch in branches if branch not in containing]
 
     def revert_commit(self, commit_id) -> None:
-        result = subprocess.check_output(
-            f"git -C {self.get_repository_dir()} revert {commit_id} &>/dev/null",
-            shell=True,
-        ).decode("utf-8")
+        try:
+            self.repository.git.revert("--no-edit", commit_id)
+
+        except GitCommandError as err:
+            if "exit code(1)" in str(err):
+                raise MergeConflictError("Merge conflict occurred") from err
+            raise GitError("Error reverting commit") from err
+
+    def simulate_revert(self, commit_id: str, branch: str) -> CherryPickSimulation:
+        return plumbing.simulate_revert(self.get_repository_dir(), commit_id, branch)
+
+    def commit_revert(
+        self, commit_id: str, simulation: CherryPickSimulation
+    ) -> Optional[str]:
+        return plumbing.commit_revert(self.get_repository_dir(), commit_id, simulation)
 
-        if not result:
-            raise GitError("Error reverting commit")
+    def update_branches(
+        self, updates: dict[str, tuple[str, str]], message: str
+    ) -> bool:
+        for branch in updates:
+            self.__containment_index.branch_moved(branch)
 
-        if "CONFLICT" in result:
-            raise MergeConflictError("Merge conflict occurred")
+        return plumbing.update_branches(self.get_repository_dir(), updates, message)
+
+    def simulate_cherry_pick(self, commit_id: str, branch: str) -> CherryPickSimulation:
+        return plumbing.simulate_cherry_pick(
+            self.get_repository_dir(), commit_id, branch
+        )
+
+    def cherry_pick_without_checkout(
+        self,
+        commit_id: str,
+        branch: str,
+        simulation: Optional[CherryPickSimulation] = None,
+    ) -> bool:
+        new_commit = plumbing.cherry_pick_onto_branch(
+            self.get_repository_dir(), commit_id, branch, simulation
+        )
+        self.__containment_index.branch_moved(branch)
+
+        return new_commit is not None
 
     def has_merge_conflict(self) -> bool:
         print(
@@ -202,7 +417,15 @@ class Repository:
         git_url = f"{constants.SCW_GIT_URL}/{self.name}.git"
         repository_dir = self.get_repository_dir()
 
-        return Repo.clone_from(git_url, repository_dir)
+        repository, self.clone_report = clone(
+            self.name,
+            git_url,
+            repository_dir,
+            self.clone_strategy,
+            self.__clone_branches,
+        )
+
+        return repository
 
     def __str__(self) -> str:
         return self.name
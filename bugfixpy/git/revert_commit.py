@@ -1,68 +1,117 @@
+import time
+
 from git import GitError
 
 from bugfixpy.utils.text import colors
-from bugfixpy.exceptions import MergeConflictError
+from bugfixpy.exceptions import CheckoutFailedError, MergeConflictError
 from bugfixpy.utils import prompt_user
 
 from .repository import Repository
+from .bulk_revert import BulkRevert, RevertOutcome
 
 
 class RevertCommit:
 
     __repository: Repository
     __commit_id: str
+    __completed: int
+    __total: int
 
     def __init__(self, repository, commit_id) -> None:
         self.__repository = repository
         self.__commit_id = commit_id
+        self.__completed = 0
+        self.__total = 0
 
     def run(self) -> None:
-        branches = self.__repository.get_branches()
+        self.__repository.scope_sparse_checkout_to_commit(self.__commit_id)
 
         try:
-            self.__repository.checkout_to_branch(branches[0])
+            outcomes = BulkRevert(self.__repository, self.__commit_id).run()
+            self.__total = len(outcomes)
+
+            if not outcomes:
+                print(f"{colors.WARNING}No branch contains {self.__commit_id}")
+                return
+
+            queued_outcomes = []
+            for outcome in outcomes:
+                if outcome.empty:
+                    self.__display_branch_complete(outcome.branch, outcome.elapsed)
+                elif outcome.needs_checkout():
+                    queued_outcomes.append(outcome)
+                    self.__display_branch_queued(outcome)
+                else:
+                    self.__repository.mark_branch_advanced(outcome.branch)
+                    self.__display_branch_complete(outcome.branch, outcome.elapsed)
+
+            self.__revert_with_checkout(queued_outcomes)
 
-        except Exception as err:
-            print("Exception has occured. Exiting...\n", err)
-            exit(1)
+        finally:
+            self.__repository.restore_full_checkout()
 
-        for i, branch in enumerate(branches):
-            successful_checkout = False
+    def __revert_with_checkout(self, outcomes: list[RevertOutcome]) -> None:
+        if outcomes:
+            print(f"Reverting {len(outcomes)} remaining branches...")
+
+        for outcome in outcomes:
+            start = time.perf_counter()
             try:
-                self.__repository.revert_commit(self.__commit_id)
+                self.__repository.checkout_to_branch(outcome.branch)
+                self.__revert_branch(outcome.branch)
+
+            except CheckoutFailedError as err:
+                print(f"Exception occurred while checking out to branch: {err}")
+                prompt_user.if_they_want_to_continue()
 
-            except MergeConflictError as err:
-                print("Merge conflict?", err)
             except GitError as err:
                 print("Error reverting fix:", err)
                 exit(1)
 
-            while not successful_checkout:
-                try:
-                    self.__repository.checkout_to_branch(branches[0])
-                except MergeConflictError:
-                    print(
-                        f"{colors.WARNING}[ !!! ]{colors.ENDC} {branch}: {colors.WARNING}MERGE CONFLICT"
-                    )
-                    self.__repository.open_code_in_editor()
-                    prompt_user.to_resolve_merge_conflict()
-
-                    try:
-                        self.__repository.add_changes()
-                        self.__repository.commit_changes_with_message(
-                            f"Revert commit {self.__commit_id}"
-                        )
-
-                    # Create empty commit if error occurs
-                    # TODO: figure out what exception is being thrown here
-                    except Exception as err:
-                        print("Error adding and committing changes:\n", err)
+            else:
+                self.__repository.mark_branch_advanced(outcome.branch)
 
-                else:
-                    successful_checkout = True
+            self.__display_branch_complete(
+                outcome.branch, outcome.elapsed + time.perf_counter() - start
+            )
+
+    def __revert_branch(self, branch: str) -> None:
+        try:
+            self.__repository.revert_commit(self.__commit_id)
 
-            # Inform user of successful cherry-pick, branch complete
+        except MergeConflictError:
             print(
-                f"[{colors.OKCYAN}{(i + 1) * 100 / len(branches):.1f}%{colors.ENDC}]{colors.ENDC}"
-                f" {branch}: {colors.OKGREEN}[COMPLETE]{colors.ENDC}"
+                f"{colors.WARNING}[ !!! ]{colors.ENDC} {branch}: {colors.WARNING}MERGE CONFLICT"
             )
+            self.__repository.open_code_in_editor()
+            prompt_user.to_resolve_merge_conflict()
+
+            try:
+                self.__repository.add_changes()
+                self.__repository.commit_changes_with_message(
+                    f"Revert commit {self.__commit_id}"
+                )
+
+            # Create empty commit if error occurs
+            # TODO: figure out what exception is being thrown here
+            except Exception as err:
+                print("Error adding and committing changes:\n", err)
+
+    def __display_branch_queued(self, outcome: RevertOutcome) -> None:
+        if outcome.conflicted_files:
+            reason = f"MERGE CONFLICT in {', '.join(outcome.conflicted_files)}"
+        else:
+            reason = outcome.error
+        print(
+            f"{colors.WARNING}[ !!! ]{colors.ENDC} {outcome.branch}:"
+            f" {colors.WARNING}{reason}, queued{colors.ENDC}"
+        )
+
+    def __display_branch_complete(self, branch: str, elapsed: float) -> None:
+        self.__completed += 1
+        percentage = self.__completed * 100 / self.__total
+        print(
+            f"[{colors.OKCYAN}{percentage:.1f}%{colors.ENDC}]{colors.ENDC}"
+            f" {branch}: {colors.OKGREEN}[COMPLETE]{colors.ENDC}"
+            f" {colors.OKCYAN}{elapsed:.2f}s{colors.ENDC}"
+        )
@@ -1,8 +1,10 @@
-from typing import List
+from datetime import date
+from typing import Iterator, List
 from urllib import parse
-import requests
 from requests import Response
 
+from bugfixpy.exceptions import RequestFailedError
+
 from bugfixpy.jira import (
     Issue,
     ChallengeRequestIssue,
@@ -11,34 +13,30 @@ from bugfixpy.jira import (
 )
 
 from .fix_version import FixVersion
+from . import fix_version_cache
+from . import session
 from . import utils
 from . import constants
 
 
-def __execute_get_query(endpoint: str) -> Response:
-    response = requests.get(
-        url=f"{constants.SCW_API_URL}/{endpoint}",
-        headers=constants.REQUEST_HEADERS,
-        auth=constants.AUTH,
+def __execute_get_query(endpoint: str, stream: bool = False) -> Response:
+    response = session.get_session().get(
+        url=f"{constants.SCW_API_URL}/{endpoint}", stream=stream
     )
     return response
 
 
 def __execute_post_query(endpoint: str, body: dict) -> Response:
-    response = requests.post(
+    response = session.get_session().post(
         url=f"{constants.SCW_API_URL}/{endpoint}",
-        headers=constants.REQUEST_HEADERS,
-        auth=constants.AUTH,
         json=body,
     )
     return response
 
 
 def __execute_put_query(endpoint: str, body: dict) -> Response:
-    response = requests.put(
+    response = session.get_session().put(
         url=f"{constants.SCW_API_URL}/{endpoint}",
-        headers=constants.REQUEST_HEADERS,
-        auth=constants.AUTH,
         json=body,
     )
     return response
@@ -53,6 +51,48 @@ def query_for_challenge_creation_by_application_name(application_name: str) -> R
     return __execute_get_query(endpoint)
 
 
+def search_issues(issues: List[Issue], fields: str, expand: str = "") -> Iterator[dict]:
+    issue_ids = list(dict.fromkeys(issue.get_issue_id() for issue in issues))
+
+    for start in range(0, len(issue_ids), constants.SEARCH_BATCH_SIZE):
+        yield from __search_issue_ids(
+            issue_ids[start : start + constants.SEARCH_BATCH_SIZE], fields, expand
+        )
+
+
+def __search_issue_ids(
+    issue_ids: List[str], fields: str, expand: str
+) -> Iterator[dict]:
+    query = parse.quote_plus(f"key in ({','.join(issue_ids)})")
+    start_at = 0
+
+    while True:
+        endpoint = (
+            f"search?jql={query}&fields={fields}&startAt={start_at}"
+            f"&maxResults={constants.SEARCH_PAGE_SIZE}"
+        )
+        if expand:
+            endpoint += f"&expand={expand}"
+
+        response = __execute_get_query(endpoint, stream=True)
+
+        if not response.ok:
+            response.close()
+            raise RequestFailedError(
+                f"Jira Error: searching issues failed [{response.reason}]"
+            )
+
+        page_size = 0
+        for issue in utils.iterate_issues_in_response(response):
+            page_size += 1
+            yield issue
+
+        if page_size < constants.SEARCH_PAGE_SIZE:
+            return
+
+        start_at += page_size
+
+
 def get_response_code_from_query_to_verify_credentials() -> int:
     challenge_creation: ChallengeCreationIssue = ChallengeCreationIssue("CHLC-1520")
     endpoint = challenge_creation.get_issue_endpoint()
@@ -62,14 +102,40 @@ def get_response_code_from_query_to_verify_credentials() -> int:
 
 
 def get_current_fix_version() -> FixVersion:
-    endpoint = constants.LINKED_ISSUES_ENDPOINT
-    response = __execute_get_query(endpoint)
+    return fix_version_cache.get_or_resolve(date.today(), find_fix_version)
+
+
+def find_fix_version(month: date) -> FixVersion:
+    query = parse.quote_plus(str(month.year))
+    start_at = 0
+
+    while True:
+        endpoint = (
+            f"{constants.VERSIONS_ENDPOINT}?orderBy=-sequence&query={query}"
+            f"&startAt={start_at}&maxResults={constants.VERSIONS_PAGE_SIZE}"
+        )
+        response = __execute_get_query(endpoint)
+
+        if not response.ok:
+            raise RequestFailedError(
+                f"Jira Error: fetching fix versions failed [{response.reason}]"
+            )
 
-    return utils.parse_fix_version_from_response(response)
+        page = response.json()
+        versions = page.get("values", [])
+        fix_version = utils.find_fix_version_in_page(versions, month)
+
+        if fix_version:
+            return fix_version
+
+        if page.get("isLast", True) or not versions:
+            return FixVersion(id_="", name="")
+
+        start_at += len(versions)
 
 
 def issue_exists(issue: Issue) -> bool:
-    endpoint = issue.get_issue_endpoint()
+    endpoint = f"{issue.get_issue_endpoint()}?fields={constants.ISSUE_EXISTS_FIELDS}"
     response = __execute_get_query(endpoint)
 
     return utils.project_type_exists_in_response(issue.get_project_type(), response)
@@ -109,7 +175,10 @@ def get_transition_to_in_progress_body() -> dict:
 def get_application_creation_related_to_challenge(
     challenge_creation_issue: ChallengeCreationIssue,
 ) -> ApplicationCreationIssue:
-    endpoint = challenge_creation_issue.get_issue_endpoint()
+    endpoint = (
+        f"{challenge_creation_issue.get_issue_endpoint()}"
+        f"?fields={constants.PARENT_FIELDS}"
+    )
     response = __execute_get_query(endpoint)
     application_creation_id = utils.parse_application_creation_from_response(response)
 
@@ -119,7 +188,10 @@ def get_application_creation_related_to_challenge(
 def get_challenge_creation_issues_linked_to_application(
     application_creation_issue: ApplicationCreationIssue,
 ) -> List[ChallengeCreationIssue]:
-    endpoint = application_creation_issue.get_issue_endpoint()
+    endpoint = (
+        f"{application_creation_issue.get_issue_endpoint()}"
+        f"?fields={constants.ISSUE_LINK_FIELDS}"
+    )
     response = __execute_get_query(endpoint)
     challenge_creation_ids = utils.parse_linked_challenges_from_response(response)
 
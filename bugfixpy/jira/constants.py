@@ -1,14 +1,14 @@
-import keyring
-from requests.auth import HTTPBasicAuth
+import os
+from typing import Any
 
-# Email to access Jira API
-API_EMAIL = keyring.get_password("system", "JIRA_API_EMAIL")
+from bugfixpy.utils import credentials
 
-# Jira API key
-API_KEY = keyring.get_password("system", "JIRA_API_KEY")
-
-# Create authentication object for API calls
-AUTH = HTTPBasicAuth(API_EMAIL, API_KEY)
+# Keyring names of the credentials resolved on first use:
+# API_EMAIL is the email to access Jira API, API_KEY is the Jira API key
+CREDENTIALS = {
+    "API_EMAIL": "JIRA_API_EMAIL",
+    "API_KEY": "JIRA_API_KEY",
+}
 
 # Account id for the person to link for approval in jira
 CONTENT_VERIFIER_ID = "5e546930a17f930c9b959d05"
@@ -51,6 +51,105 @@ BULK_TRANSITION_JQL_URL = "https://securecodewarrior.atlassian.net/browse/CHLC-{
 
 LINKED_ISSUES_ENDPOINT = "issueLink"
 
-LINKED_ISSUES_ENDPOINT = "project/CHLRQ/versions"
+# Paginated CHLRQ versions, which can be ordered and filtered by name
+VERSIONS_ENDPOINT = "project/CHLRQ/version"
+
+# Number of versions requested per page
+VERSIONS_PAGE_SIZE = 50
+
+# File the resolved fix version of each month is kept in between runs
+FIX_VERSION_CACHE_FILE = os.path.join(
+    os.path.dirname(__file__), "../../data/cache/jira/fix_versions.json"
+)
+
+# File the hash of the last credentials Jira accepted is kept in between runs
+CREDENTIAL_VALIDATION_CACHE_FILE = os.path.join(
+    os.path.dirname(__file__), "../../data/cache/jira/credentials.json"
+)
+
+# Seconds accepted credentials are trusted before a run checks them again
+CREDENTIAL_VALIDATION_TTL = 24 * 60 * 60
+
+# Response header Jira uses to explain why it did not authenticate a request
+LOGIN_REASON_HEADER = "X-Seraph-LoginReason"
+
+# Login reasons sent when Jira rejects the credentials, e.g. after a CAPTCHA lock
+REJECTED_LOGIN_REASONS = ("AUTHENTICATED_FAILED", "AUTHENTICATION_DENIED")
 
 TRANSITION_TO_CLOSED_ID = "191"
+
+# Transitions of a CHLRQ in workflow order, with the status each one leads to
+CHLRQ_WORKFLOW = [
+    ("Planned", TRANSITION_PLANNED),
+    ("In Progress", TRANSITION_IN_PROGRESS),
+    ("Closed", TRANSITION_TO_CLOSED_ID),
+]
+
+# Transitions of a CHLC in workflow order, with the status each one leads to
+CHLC_WORKFLOW = [
+    ("Feedback Open", TRANSITION_FEEDBACK_OPEN),
+    ("Feedback Review", TRANSITION_FEEDBACK_REVIEW),
+]
+
+# Step that assigns the content verifier and comments the CHLRQ on a CHLC
+ASSIGNEE_AND_COMMENT_STEP = "Assignee and comment"
+
+# Issue fields needed to plan transitions, comments show which CHLRQs were linked
+TRANSITION_PLAN_FIELDS = "status,assignee,comment"
+
+# Issue fields needed to find the CHLCs linked to an application CHLC
+ISSUE_LINK_FIELDS = "issuelinks"
+
+# Issue fields needed to find the application CHLC of a challenge CHLC
+PARENT_FIELDS = "parent"
+
+# Issue fields requested when only checking that an issue exists
+ISSUE_EXISTS_FIELDS = "status"
+
+# Number of issue keys resolved by one JQL search
+SEARCH_BATCH_SIZE = 50
+
+# Number of issues requested per page of a JQL search
+SEARCH_PAGE_SIZE = 50
+
+# Seconds to wait for Jira to accept a connection and to send a response
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Number of host connection pools kept by the Jira session
+POOL_CONNECTIONS = 4
+
+# Number of keep-alive connections kept per host
+POOL_MAXSIZE = 16
+
+# Number of times a failed Jira request is retried
+MAX_RETRIES = 3
+
+# Base delay in seconds for the exponential backoff between retries
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Response codes that are retried for idempotent requests
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Methods that can change an issue and are only retried when Jira refused them
+NON_IDEMPOTENT_METHODS = ("POST", "PUT")
+
+# Response codes where Jira did not process the request, so it is safe to resend
+NON_IDEMPOTENT_RETRY_STATUS_CODES = (429, 503)
+
+# Number of CHLCs transitioned at the same time
+TRANSITION_MAX_WORKERS = 8
+
+
+def __getattr__(name: str) -> Any:
+    if name in CREDENTIALS:
+        return credentials.get_password(CREDENTIALS[name])
+
+    # Create authentication object for API calls
+    if name == "AUTH":
+        from requests.auth import (  # pylint: disable=import-outside-toplevel
+            HTTPBasicAuth,
+        )
+
+        return HTTPBasicAuth(__getattr__("API_EMAIL"), __getattr__("API_KEY"))
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
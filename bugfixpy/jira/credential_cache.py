@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import time
+from threading import Lock
+from typing import Optional
+
+from . import constants
+
+__validated_credentials: Optional[str] = None
+__lock = Lock()
+
+
+def is_validated() -> bool:
+    global __validated_credentials
+
+    credentials_hash = __hash_credentials()
+
+    with __lock:
+        if __validated_credentials == credentials_hash:
+            return True
+
+        validation = __load_validation()
+
+        if (
+            validation.get("credentials") == credentials_hash
+            and isinstance(validation.get("validated_at"), (int, float))
+            and time.time() - validation["validated_at"]
+            < constants.CREDENTIAL_VALIDATION_TTL
+        ):
+            __validated_credentials = credentials_hash
+            return True
+
+        return False
+
+
+def record_valid() -> None:
+    global __validated_credentials
+
+    credentials_hash = __hash_credentials()
+
+    with __lock:
+        if __validated_credentials == credentials_hash:
+            return
+
+        __validated_credentials = credentials_hash
+        __save_validation(
+            {"credentials": credentials_hash, "validated_at": time.time()}
+        )
+
+
+def record_invalid() -> None:
+    global __validated_credentials
+
+    with __lock:
+        __validated_credentials = None
+
+        try:
+            os.remove(constants.CREDENTIAL_VALIDATION_CACHE_FILE)
+        except OSError:
+            pass
+
+
+def clear() -> None:
+    global __validated_credentials
+
+    with __lock:
+        __validated_credentials = None
+
+
+def __hash_credentials() -> str:
+    credentials = f"{constants.API_EMAIL}:{constants.API_KEY}"
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+
+def __load_validation() -> dict:
+    try:
+        with open(
+            constants.CREDENTIAL_VALIDATION_CACHE_FILE, encoding="utf-8"
+        ) as cache_file:
+            validation = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+    return validation if isinstance(validation, dict) else {}
+
+
+def __save_validation(validation: dict) -> None:
+    cache_dir = os.path.dirname(constants.CREDENTIAL_VALIDATION_CACHE_FILE)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    temp_path = f"{constants.CREDENTIAL_VALIDATION_CACHE_FILE}.{os.getpid()}.tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as cache_file:
+        json.dump(validation, cache_file)
+
+    os.replace(temp_path, constants.CREDENTIAL_VALIDATION_CACHE_FILE)
@@ -0,0 +1,71 @@
+import json
+import os
+from datetime import date
+from threading import Lock
+from typing import Callable
+
+from .fix_version import FixVersion
+from . import constants
+from . import utils
+
+__fix_versions: dict[str, FixVersion] = {}
+__lock = Lock()
+
+
+def get_or_resolve(month: date, resolve: Callable[[date], FixVersion]) -> FixVersion:
+    month_key = utils.get_fix_version_month(month)
+
+    with __lock:
+        if month_key not in __fix_versions:
+            __fix_versions.update(__load_fix_versions())
+
+        if month_key in __fix_versions:
+            return __fix_versions[month_key]
+
+        fix_version = resolve(month)
+
+        if fix_version.id_:
+            __fix_versions[month_key] = fix_version
+            __save_fix_versions()
+
+        return fix_version
+
+
+def clear() -> None:
+    with __lock:
+        __fix_versions.clear()
+
+
+def __load_fix_versions() -> dict[str, FixVersion]:
+    try:
+        with open(constants.FIX_VERSION_CACHE_FILE, encoding="utf-8") as cache_file:
+            stored_versions = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(stored_versions, dict):
+        return {}
+
+    return {
+        month_key: FixVersion(id_=version["id"], name=version["name"])
+        for month_key, version in stored_versions.items()
+        if isinstance(version, dict) and "id" in version and "name" in version
+    }
+
+
+def __save_fix_versions() -> None:
+    cache_dir = os.path.dirname(constants.FIX_VERSION_CACHE_FILE)
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{constants.FIX_VERSION_CACHE_FILE}.{os.getpid()}.tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as cache_file:
+        json.dump(
+            {
+                month_key: {"id": fix_version.id_, "name": fix_version.name}
+                for month_key, fix_version in __fix_versions.items()
+            },
+            cache_file,
+            indent=2,
+        )
+
+    os.replace(temp_path, constants.FIX_VERSION_CACHE_FILE)
@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class IssueState:
+    key: str
+    status: str
+    transition_ids: set[str] = field(default_factory=set)
+    assignee_id: str = ""
+    comments: list[str] = field(default_factory=list)
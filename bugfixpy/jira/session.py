@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Optional
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bugfixpy.exceptions import InvalidCredentialsError
+
+from . import constants
+from . import credential_cache
+from . import utils
+
+
+@dataclass
+class PoolStats:
+    connections_opened: int
+    requests_sent: int
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests_sent - self.connections_opened)
+
+
+class JiraRetry(Retry):
+    """Retry transitions and updates only when Jira refused to process them"""
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() in constants.NON_IDEMPOTENT_METHODS:
+            return (
+                bool(self.total)
+                and status_code in constants.NON_IDEMPOTENT_RETRY_STATUS_CODES
+            )
+
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    __timeout: Any
+
+    def __init__(self, timeout: Any = constants.REQUEST_TIMEOUT, **kwargs) -> None:
+        self.__timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.__timeout
+
+        return super().send(request, **kwargs)
+
+
+__session: Optional[Session] = None
+__adapter: Optional[TimeoutHTTPAdapter] = None
+__session_lock = Lock()
+
+
+def get_session() -> Session:
+    global __session, __adapter
+
+    with __session_lock:
+        if __session is None:
+            __adapter = create_adapter()
+            __session = Session()
+            __session.headers.update(constants.REQUEST_HEADERS)
+            __session.auth = constants.AUTH
+            __session.mount("https://", __adapter)
+            __session.mount("http://", __adapter)
+            __session.hooks["response"].append(check_credentials)
+
+        return __session
+
+
+def check_credentials(response: Response, *_args, **_kwargs) -> Response:
+    # Every Jira request validates the credentials, so runs do not need a
+    # dedicated request to check them up front
+    if utils.are_credentials_rejected(response):
+        credential_cache.record_invalid()
+        response.close()
+        raise InvalidCredentialsError(
+            "Invalid API credentials: Invalid email or permissions on account\n"
+            "Run: python3 bugfixpy --setup to change credentials"
+        )
+
+    if response.ok:
+        credential_cache.record_valid()
+
+    return response
+
+
+def create_adapter() -> TimeoutHTTPAdapter:
+    retry = JiraRetry(
+        total=constants.MAX_RETRIES,
+        backoff_factor=constants.RETRY_BACKOFF_FACTOR,
+        status_forcelist=constants.RETRY_STATUS_CODES,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+    return TimeoutHTTPAdapter(
+        pool_connections=constants.POOL_CONNECTIONS,
+        pool_maxsize=constants.POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def get_pool_stats() -> PoolStats:
+    if __adapter is None:
+        return PoolStats(0, 0)
+
+    pools = __adapter.poolmanager.pools
+    connection_pools = [pools[key] for key in pools.keys()]
+
+    return PoolStats(
+        sum(pool.num_connections for pool in connection_pools),
+        sum(pool.num_requests for pool in connection_pools),
+    )
+
+
+def close_session() -> None:
+    global __session, __adapter
+
+    with __session_lock:
+        if __session is not None:
+            __session.close()
+
+        __session = None
+        __adapter = None
@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from requests import Response
+
+from bugfixpy.utils.text import colors
+
+from .issue import ChallengeCreationIssue, ChallengeRequestIssue
+from .transition_planner import TransitionPlan
+from . import api
+from . import constants
+
+
+@dataclass
+class TransitionStepResult:
+    step: str
+    succeeded: bool
+    reason: str = ""
+    skipped: bool = False
+
+
+@dataclass
+class CreationIssueTransitionResult:
+    issue: ChallengeCreationIssue
+    steps: list[TransitionStepResult] = field(default_factory=list)
+
+    def succeeded(self) -> bool:
+        return all(step.succeeded for step in self.steps)
+
+
+class TransitionExecutor:
+    """Transition CHLCs in parallel, running the steps of each one in order"""
+
+    STEPS = [status for status, _ in constants.CHLC_WORKFLOW] + [
+        constants.ASSIGNEE_AND_COMMENT_STEP
+    ]
+
+    __challenge_request_issue: ChallengeRequestIssue
+    __verifier_id: str
+    __max_workers: int
+    __plans: Optional[dict[str, TransitionPlan]]
+
+    def __init__(
+        self,
+        challenge_request_issue: ChallengeRequestIssue,
+        verifier_id: str,
+        max_workers: int = constants.TRANSITION_MAX_WORKERS,
+        plans: Optional[dict[str, TransitionPlan]] = None,
+    ) -> None:
+        self.__challenge_request_issue = challenge_request_issue
+        self.__verifier_id = verifier_id
+        self.__max_workers = max(1, max_workers)
+        self.__plans = plans
+
+    def transition_all(
+        self, issues: list[ChallengeCreationIssue]
+    ) -> list[CreationIssueTransitionResult]:
+        if not issues:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            return list(executor.map(self.transition, issues))
+
+    def transition(
+        self, issue: ChallengeCreationIssue
+    ) -> CreationIssueTransitionResult:
+        result = CreationIssueTransitionResult(issue)
+        plan = self.__plans.get(issue.get_issue_id()) if self.__plans else None
+        steps: list[Callable[[], Response]] = [
+            lambda: api.transition_challenge_creation_to_feedback_open(issue),
+            lambda: api.transition_challenge_creation_to_feedback_review(issue),
+            lambda: api.update_challenge_creation_assignee_and_link_challenge_request(
+                issue, self.__challenge_request_issue, self.__verifier_id
+            ),
+        ]
+
+        for step, run_step in zip(self.STEPS, steps):
+            if plan and step not in plan.get_step_names():
+                result.steps.append(self.__skip_step(step, plan))
+            else:
+                result.steps.append(self.__run_step(step, run_step))
+
+        return result
+
+    def __skip_step(self, step: str, plan: TransitionPlan) -> TransitionStepResult:
+        if plan.blocked_reason and step != constants.ASSIGNEE_AND_COMMENT_STEP:
+            return TransitionStepResult(step, False, plan.blocked_reason)
+
+        return TransitionStepResult(step, True, skipped=True)
+
+    def __run_step(
+        self, step: str, run_step: Callable[[], Response]
+    ) -> TransitionStepResult:
+        try:
+            response = run_step()
+        except Exception as err:
+            return TransitionStepResult(step, False, str(err))
+
+        if response.status_code == 204:
+            return TransitionStepResult(step, True)
+
+        return TransitionStepResult(step, False, str(response.reason))
+
+    def display_results(self, results: list[CreationIssueTransitionResult]) -> None:
+        issue_width = max(
+            [len("CHLC")] + [len(result.issue.get_issue_id()) for result in results]
+        )
+        step_widths = [max(len(step), 4) for step in self.STEPS]
+
+        header = "  ".join(
+            [f"{'CHLC':<{issue_width}}"]
+            + [f"{step:<{width}}" for step, width in zip(self.STEPS, step_widths)]
+        )
+        print(f"{colors.HEADER}{header}{colors.ENDC}")
+
+        for result in results:
+            cells = [
+                self.__format_step_result(step_result, width)
+                for step_result, width in zip(result.steps, step_widths)
+            ]
+            print("  ".join([f"{result.issue.get_issue_id():<{issue_width}}"] + cells))
+
+        failures = [
+            f"{result.issue.get_issue_id()} {step.step}: {step.reason}"
+            for result in results
+            for step in result.steps
+            if not step.succeeded
+        ]
+        succeeded = len([result for result in results if result.succeeded()])
+        print(
+            f"{colors.OKGREEN}{succeeded}{colors.ENDC} of {len(results)}"
+            " CHLCs transitioned"
+        )
+
+        if failures:
+            failed_steps = "\n\t".join(failures)
+            print(f"{colors.FAIL}Failed steps:\n\t{failed_steps}{colors.ENDC}")
+
+    def __format_step_result(
+        self, step_result: TransitionStepResult, width: int
+    ) -> str:
+        if step_result.skipped:
+            return f"{colors.OKCYAN}{'SKIPPED':<{width}}{colors.ENDC}"
+
+        if step_result.succeeded:
+            return f"{colors.OKGREEN}{'OK':<{width}}{colors.ENDC}"
+
+        return f"{colors.FAIL}{'FAILED':<{width}}{colors.ENDC}"
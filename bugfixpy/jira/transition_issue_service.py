@@ -1,8 +1,13 @@
+from typing import Optional
+
 from requests import Response
 from bugfixpy.jira import api
 from bugfixpy.utils import prompt_user
 from bugfixpy.utils.text import colors
 from .fix_version import FixVersion
+from .transition_executor import TransitionExecutor
+from .transition_planner import TransitionPlanner
+from . import constants
 from .issue import (
     ApplicationCreationIssue,
     ChallengeCreationIssue,
@@ -11,29 +16,74 @@ from .issue import (
 
 
 class TransitionIssueService:
-    def __init__(self) -> None:
-        pass
+    __dry_run: bool
+
+    def __init__(self, dry_run: bool = False) -> None:
+        self.__dry_run = dry_run
 
     def transition_chrlq(
         self, challenge_request_issue: ChallengeRequestIssue, fix_message: str
     ) -> None:
-        fix_version = api.get_current_fix_version()
-        self.__transition_chlrq_to_planned(challenge_request_issue, fix_version)
-        self.__transition_chlrq_to_in_progress(challenge_request_issue)
-        self.__transition_chlrq_to_closed(challenge_request_issue, fix_message)
+        planner = TransitionPlanner()
+        planner.fetch_issue_states([challenge_request_issue])
+        plan = planner.plan_challenge_request(challenge_request_issue)
+
+        if self.__dry_run:
+            print(plan)
+            return
+
+        if plan.blocked_reason:
+            print(f"\t{colors.WARNING}{plan.blocked_reason}{colors.ENDC}")
+        elif not plan.steps:
+            print(f"\tAlready {plan.status}, nothing to transition")
+
+        for step in plan.steps:
+            self.__run_chlrq_transition(
+                str(step.transition_id), challenge_request_issue, fix_message
+            )
 
     def transition_all_chlcs(
         self,
         application_creation_issue: ApplicationCreationIssue,
         challenge_request_issue: ChallengeRequestIssue,
+        verifier_id: Optional[str] = None,
+        linked_creation_issues: Optional[list[ChallengeCreationIssue]] = None,
     ) -> None:
-        linked_creation_issues = self.__get_all_linked_creation_issues(
-            application_creation_issue
+        if linked_creation_issues is None:
+            linked_creation_issues = self.__get_all_linked_creation_issues(
+                application_creation_issue
+            )
+        self.transition_chlcs(
+            linked_creation_issues,
+            challenge_request_issue,
+            verifier_id or self.__choose_content_verifier(),
         )
-        verifier_id = self.__choose_content_verifier()
 
-        for creation_issue in linked_creation_issues:
-            self.transition_chlc(creation_issue, challenge_request_issue, verifier_id)
+    def transition_chlcs(
+        self,
+        creation_issues: list[ChallengeCreationIssue],
+        challenge_request_issue: ChallengeRequestIssue,
+        verifier_id: str,
+    ) -> None:
+        planner = TransitionPlanner()
+        planner.fetch_issue_states(list(creation_issues))
+        plans = {
+            issue.get_issue_id(): planner.plan_creation_issue(
+                issue, challenge_request_issue, verifier_id
+            )
+            for issue in creation_issues
+        }
+
+        if self.__dry_run:
+            for plan in plans.values():
+                print(plan)
+            return
+
+        transition_executor = TransitionExecutor(
+            challenge_request_issue, verifier_id, plans=plans
+        )
+        results = transition_executor.transition_all(creation_issues)
+        transition_executor.display_results(results)
 
     def transition_chlc(
         self,
@@ -47,6 +97,20 @@ class TransitionIssueService:
             challenge_creation_issue, challenge_request_issue, verifier_id
         )
 
+    def __run_chlrq_transition(
+        self,
+        transition_id: str,
+        challenge_request_issue: ChallengeRequestIssue,
+        fix_message: str,
+    ) -> None:
+        if transition_id == str(constants.TRANSITION_PLANNED):
+            fix_version = api.get_current_fix_version()
+            self.__transition_chlrq_to_planned(challenge_request_issue, fix_version)
+        elif transition_id == str(constants.TRANSITION_IN_PROGRESS):
+            self.__transition_chlrq_to_in_progress(challenge_request_issue)
+        elif transition_id == str(constants.TRANSITION_TO_CLOSED_ID):
+            self.__transition_chlrq_to_closed(challenge_request_issue, fix_message)
+
     def __transition_chlrq_to_planned(
         self, challenge_request_issue: ChallengeRequestIssue, fix_version: FixVersion
     ) -> None:
@@ -1,12 +1,18 @@
+from typing import Optional
+
 from requests import Response
 
 from bugfixpy.utils import formatter, prompt_user
 from bugfixpy.utils.text import colors
-from bugfixpy.cms import ScraperData
+from bugfixpy.cms.scraper_data import ScraperData
 from bugfixpy.git import FixResult
 from bugfixpy.jira import api
 
 from .fix_version import FixVersion
+from . import constants
+from . import session
+from .transition_executor import TransitionExecutor
+from .transition_planner import TransitionPlanner
 from .issue import (
     ApplicationCreationIssue,
     ChallengeCreationIssue,
@@ -23,25 +29,42 @@ class TransitionIssues:
     __fix_version: FixVersion
     __fix_message: str
     __verifier_id: str
+    __dry_run: bool
+    __planner: TransitionPlanner
 
     def __init__(
         self,
         fix_result: FixResult,
         challenge_data: ScraperData,
         challenge_request_issue: ChallengeRequestIssue,
+        dry_run: bool = False,
+        fix_version: Optional[FixVersion] = None,
+        linked_creation_issues: Optional[list[ChallengeCreationIssue]] = None,
     ) -> None:
         self.__challenge_request_issue = challenge_request_issue
         self.__challenge_creation_issue = challenge_data.challenge.chlc
         self.__application_creation_issue = challenge_data.application.chlc
         self.__repo_was_cherrypicked = fix_result.repo_was_cherrypicked
-        self.__fix_version = api.get_current_fix_version()
+        self.__fix_version = fix_version or api.get_current_fix_version()
         self.__fix_message = formatter.combine_messages_into_string(
             fix_result.fix_messages
         )
-        self.__creation_issues = self.__get_creation_issues_to_transition()
+        self.__creation_issues = self.__get_creation_issues_to_transition(
+            linked_creation_issues
+        )
         self.__verifier_id = self.__choose_content_verifier()
+        self.__dry_run = dry_run
+        self.__planner = TransitionPlanner()
 
     def run(self) -> None:
+        self.__planner.fetch_issue_states(
+            [self.__challenge_request_issue, *self.__creation_issues]
+        )
+
+        if self.__dry_run:
+            self.__display_plans()
+            return
+
         try:
             prompt_user.to_press_enter_to_transition_request_issue(
                 self.__challenge_request_issue
@@ -58,8 +81,15 @@ class TransitionIssues:
         except KeyboardInterrupt:
             print(f"\n{colors.FAIL}Skipped transitioning CHLRQ{colors.ENDC}")
 
-    def __get_creation_issues_to_transition(self) -> list[ChallengeCreationIssue]:
+        self.__display_pool_stats()
+
+    def __get_creation_issues_to_transition(
+        self, linked_creation_issues: Optional[list[ChallengeCreationIssue]]
+    ) -> list[ChallengeCreationIssue]:
         if self.__repo_was_cherrypicked:
+            if linked_creation_issues is not None:
+                return linked_creation_issues
+
             return api.get_challenge_creation_issues_linked_to_application(
                 self.__application_creation_issue
             )
@@ -70,9 +100,20 @@ class TransitionIssues:
         print(
             f"\nTransitioning {colors.OKCYAN}{self.__challenge_request_issue.get_issue_id()}{colors.ENDC}"
         )
-        self.__transition_to_planned()
-        self.__transition_to_in_progress()
-        self.__transition_to_closed()
+        plan = self.__planner.plan_challenge_request(self.__challenge_request_issue)
+        transitions = {
+            str(constants.TRANSITION_PLANNED): self.__transition_to_planned,
+            str(constants.TRANSITION_IN_PROGRESS): self.__transition_to_in_progress,
+            str(constants.TRANSITION_TO_CLOSED_ID): self.__transition_to_closed,
+        }
+
+        if plan.blocked_reason:
+            print(f"\t{colors.WARNING}{plan.blocked_reason}{colors.ENDC}")
+        elif not plan.steps:
+            print(f"\tAlready {plan.status}, nothing to transition")
+
+        for step in plan.steps:
+            transitions[str(step.transition_id)]()
 
     def __transition_to_planned(self) -> None:
         print(f"\tTo Planned [Fix Version: {self.__fix_version.name}]", end="")
@@ -97,24 +138,29 @@ class TransitionIssues:
         self.__display_transition_result(result)
 
     def __transition_creation_issues(self) -> None:
-        for issue in self.__creation_issues:
-            print(f"Transitioning {colors.HEADER}{issue.get_issue_id()}{colors.ENDC}:")
-            self.__transition_creation_issue(issue)
-
-    def __transition_creation_issue(self, issue: ChallengeCreationIssue) -> None:
-        self.__transition_to_feedback_open(issue)
-        self.__transition_to_feedback_review(issue)
-        self.__add_assignee_and_comment(issue, self.__verifier_id)
+        print(f"Transitioning {colors.HEADER}CHLCs{colors.ENDC}:")
+        plans = {
+            issue.get_issue_id(): self.__planner.plan_creation_issue(
+                issue, self.__challenge_request_issue, self.__verifier_id
+            )
+            for issue in self.__creation_issues
+        }
+        transition_executor = TransitionExecutor(
+            self.__challenge_request_issue, self.__verifier_id, plans=plans
+        )
+        results = transition_executor.transition_all(self.__creation_issues)
+        transition_executor.display_results(results)
 
-    def __transition_to_feedback_open(self, issue: ChallengeCreationIssue) -> None:
-        print("\tTo Feedback Open\t", end="")
-        result = api.transition_challenge_creation_to_feedback_open(issue)
-        self.__display_transition_result(result)
+    def __display_plans(self) -> None:
+        print(f"{colors.HEADER}Dry run: planned transitions{colors.ENDC}")
+        print(self.__planner.plan_challenge_request(self.__challenge_request_issue))
 
-    def __transition_to_feedback_review(self, issue: ChallengeCreationIssue) -> None:
-        print("\tTo Feedback Review\t", end="")
-        result = api.transition_challenge_creation_to_feedback_review(issue)
-        self.__display_transition_result(result)
+        for issue in self.__creation_issues:
+            print(
+                self.__planner.plan_creation_issue(
+                    issue, self.__challenge_request_issue, self.__verifier_id
+                )
+            )
 
     def __choose_content_verifier(self) -> str:
         verifier = prompt_user.to_select_content_verifier()
@@ -122,16 +168,13 @@ class TransitionIssues:
         print(f"\t{name} set as content verifier")
         return verifier["id"]
 
-    def __add_assignee_and_comment(
-        self, issue: ChallengeCreationIssue, content_verifier: str
-    ) -> None:
-        print("\tAdding assignee and comment", end="")
-        result = api.update_challenge_creation_assignee_and_link_challenge_request(
-            issue,
-            self.__challenge_request_issue,
-            content_verifier,
+    def __display_pool_stats(self) -> None:
+        pool_stats = session.get_pool_stats()
+        print(
+            f"Jira requests: {colors.OKCYAN}{pool_stats.requests_sent}{colors.ENDC}"
+            f" over {colors.OKCYAN}{pool_stats.connections_opened}{colors.ENDC}"
+            " connections"
         )
-        self.__display_transition_result(result)
 
     def __display_transition_result(self, result: Response) -> None:
         if result.status_code == 204:
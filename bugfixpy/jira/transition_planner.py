@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from bugfixpy.exceptions import InvalidCredentialsError
+from bugfixpy.utils.text import colors
+
+from .issue import ChallengeCreationIssue, ChallengeRequestIssue, Issue
+from .issue_state import IssueState
+from . import api
+from . import constants
+from . import utils
+
+
+@dataclass
+class PlannedStep:
+    name: str
+    transition_id: Optional[str] = None
+
+
+@dataclass
+class TransitionPlan:
+    issue: Issue
+    status: str
+    steps: list[PlannedStep] = field(default_factory=list)
+    blocked_reason: str = ""
+
+    def get_step_names(self) -> list[str]:
+        return [step.name for step in self.steps]
+
+    def __str__(self) -> str:
+        issue_id = f"{colors.OKCYAN}{self.issue.get_issue_id()}{colors.ENDC}"
+        status = self.status or "unknown status"
+        steps = " -> ".join(self.get_step_names()) or "nothing to do"
+        plan = f"{issue_id} [{status}]: {steps}"
+
+        if self.blocked_reason:
+            plan += f"\n\t{colors.WARNING}{self.blocked_reason}{colors.ENDC}"
+
+        return plan
+
+
+class TransitionPlanner:
+    """Plan the transitions still needed to bring issues to their target status"""
+
+    __issue_states: dict[str, IssueState]
+
+    def __init__(self) -> None:
+        self.__issue_states = {}
+
+    def fetch_issue_states(self, issues: list[Issue]) -> None:
+        if not issues:
+            return
+
+        try:
+            for issue in api.search_issues(
+                issues, constants.TRANSITION_PLAN_FIELDS, expand="transitions"
+            ):
+                issue_state = utils.parse_issue_state(issue)
+                self.__issue_states[issue_state.key] = issue_state
+        except InvalidCredentialsError:
+            raise
+        except Exception as err:
+            print(f"{colors.WARNING}Could not fetch issue statuses: {err}{colors.ENDC}")
+
+    def plan_challenge_request(
+        self, challenge_request_issue: ChallengeRequestIssue
+    ) -> TransitionPlan:
+        return self.__plan_workflow(challenge_request_issue, constants.CHLRQ_WORKFLOW)
+
+    def plan_creation_issue(
+        self,
+        challenge_creation_issue: ChallengeCreationIssue,
+        challenge_request_issue: ChallengeRequestIssue,
+        verifier_id: str,
+    ) -> TransitionPlan:
+        plan = self.__plan_workflow(challenge_creation_issue, constants.CHLC_WORKFLOW)
+        state = self.__issue_states.get(challenge_creation_issue.get_issue_id())
+
+        # The step also comments the CHLRQ, so a CHLC already assigned to the
+        # verifier still needs it for a CHLRQ it has not been linked to
+        is_done = (
+            state is not None
+            and state.assignee_id == verifier_id
+            and any(
+                challenge_request_issue.get_issue_id() in comment.split()
+                for comment in state.comments
+            )
+        )
+        if not is_done:
+            plan.steps.append(PlannedStep(constants.ASSIGNEE_AND_COMMENT_STEP))
+
+        return plan
+
+    def __plan_workflow(
+        self, issue: Issue, workflow: list[tuple[str, object]]
+    ) -> TransitionPlan:
+        steps = [
+            PlannedStep(status, str(transition_id))
+            for status, transition_id in workflow
+        ]
+        state = self.__issue_states.get(issue.get_issue_id())
+
+        if not state:
+            return TransitionPlan(issue, "", steps)
+
+        statuses = [status.lower() for status, _ in workflow]
+        if state.status.lower() in statuses:
+            steps = steps[statuses.index(state.status.lower()) + 1 :]
+
+        plan = TransitionPlan(issue, state.status, steps)
+
+        if steps and steps[0].transition_id not in state.transition_ids:
+            plan.blocked_reason = (
+                f"Transition to {steps[0].name} is not available"
+                f" from {state.status}"
+            )
+            plan.steps = []
+
+        return plan
@@ -1,8 +1,16 @@
 import json
-from datetime import datetime, date
-from typing import List
+from datetime import date
+from typing import Iterator, List, Optional
+
+from requests import Response
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from .fix_version import FixVersion
+from .issue_state import IssueState
 from . import constants
 
 INWARD_ISSUE = "outwardIssue"
@@ -10,6 +18,10 @@ OUTWARD_ISSUE = "inwardIssue"
 FIELDS = "fields"
 ISSUE_LINKS = "issuelinks"
 PARENT = "parent"
+ISSUES = "issues"
+TRANSITIONS = "transitions"
+COMMENT = "comment"
+COMMENTS = "comments"
 
 
 def append_project_type_if_not_present(
@@ -56,17 +68,52 @@ def parse_linked_challenges_from_response(response) -> List[str]:
     return parse_linked_issues(json_response[FIELDS][ISSUE_LINKS])
 
 
-def parse_fix_version_from_response(response) -> FixVersion:
-    json_response = json.loads(response.text)
-    version_id = ""
-    version_name = ""
-    today = date.today()
-    datetime_object = datetime.strptime(str(today.month), "%m")
-    month = datetime_object.strftime("%b")
-
-    for version in json_response:
-        if str(today.year) in version["name"] and month in version["name"]:
-            version_name = version["name"]
-            version_id = version["id"]
-
-    return FixVersion(id_=version_id, name=version_name)
+def iterate_issues_in_response(response: Response) -> Iterator[dict]:
+    if ijson is None:
+        yield from response.json().get(ISSUES, [])
+        return
+
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, f"{ISSUES}.item", use_float=True)
+    finally:
+        response.close()
+
+
+def parse_issue_state(issue: dict) -> IssueState:
+    fields = issue.get(FIELDS) or {}
+    status = fields.get("status") or {}
+    assignee = fields.get("assignee") or {}
+    comment_field = fields.get(COMMENT) or {}
+
+    return IssueState(
+        str(issue[constants.RESPONSE_KEY]),
+        str(status.get("name", "")),
+        {str(transition["id"]) for transition in issue.get(TRANSITIONS, [])},
+        str(assignee.get("accountId", "")),
+        [str(comment.get("body", "")) for comment in comment_field.get(COMMENTS, [])],
+    )
+
+
+def get_fix_version_month(month: date) -> str:
+    return month.strftime("%Y-%m")
+
+
+def is_fix_version_for_month(version_name: str, month: date) -> bool:
+    return str(month.year) in version_name and month.strftime("%b") in version_name
+
+
+def find_fix_version_in_page(versions: List[dict], month: date) -> Optional[FixVersion]:
+    for version in versions:
+        if is_fix_version_for_month(version["name"], month):
+            return FixVersion(id_=str(version["id"]), name=version["name"])
+
+    return None
+
+
+def are_credentials_rejected(response: Response) -> bool:
+    login_reason = response.headers.get(constants.LOGIN_REASON_HEADER, "")
+
+    return response.status_code == 401 or any(
+        reason in login_reason for reason in constants.REJECTED_LOGIN_REASONS
+    )
@@ -1,7 +1,23 @@
-from .view_repository import ViewRepository
-from .transition_mode import TransitionMode
-from .automatic_mode import AutomaticMode
-from .manual_mode import ManualMode
-from .setup_credentials import SetupCredentials
-from .revert_commit import RevertCommit
-from .alert_mode import AlertMode
+from importlib import import_module
+from typing import Any
+
+# Modes are imported on first use, so starting one mode does not load the
+# dependencies of every other mode
+MODES = {
+    "ViewRepository": ".view_repository",
+    "TransitionMode": ".transition_mode",
+    "AutomaticMode": ".automatic_mode",
+    "ManualMode": ".manual_mode",
+    "SetupCredentials": ".setup_credentials",
+    "RevertCommitMode": ".revert_commit",
+    "AlertMode": ".alert_mode",
+    "SyncCatalogMode": ".sync_catalog_mode",
+    "BatchMode": ".batch_mode",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in MODES:
+        return getattr(import_module(MODES[name], __name__), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
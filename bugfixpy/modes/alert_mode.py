@@ -1,15 +1,19 @@
+from typing import Optional
+
 from bugfixpy import git
 from bugfixpy.cms import (
     ApplicationScreenDataWithChallengeBranches,
 )
 from bugfixpy.git import FixResult, RepoFixer
 from bugfixpy.jira import (
+    ChallengeCreationIssue,
     TransitionIssueService,
     api,
+    credential_cache,
 )
 from bugfixpy.utils import prompt_user
 from bugfixpy.jira import ChallengeRequestIssue
-from bugfixpy.utils.text import colors
+from bugfixpy.utils.text import colors, instructions
 
 from .types import RunnableMode, ScraperMode, RepositoryMode
 
@@ -20,17 +24,39 @@ class AlertMode(RunnableMode, RepositoryMode, ScraperMode):
     MODE = "ALERT"
 
     __fix_result: FixResult
+    __dry_run: bool
+    __linked_creation_issues: Optional[list[ChallengeCreationIssue]]
 
-    def __init__(self, test_mode) -> None:
+    def __init__(
+        self,
+        test_mode,
+        refresh_cache=False,
+        dry_run=False,
+        clone_strategy=None,
+        resume=False,
+    ) -> None:
         super().__init__(self.MODE, test_mode)
+        self.set_refresh_cache(refresh_cache)
+        self.set_clone_strategy(clone_strategy)
+        self.set_resume(resume)
+        self.__dry_run = dry_run
+        self.__linked_creation_issues = None
 
     def run(self) -> None:
         test_mode = self.get_test_mode()
         application_data = self.scrape_application_data()
         self.clone_repository_from_scraper_data(application_data)
         challenge_request_issue = prompt_user.get_challenge_request_issue()
+        # Credentials Jira has not accepted recently are checked by the linked CHLC
+        # lookup before the fix, so a rejection cannot strand a pushed fix
+        if not credential_cache.is_validated():
+            self.__linked_creation_issues = (
+                api.get_challenge_creation_issues_linked_to_application(
+                    application_data.chlc
+                )
+            )
         self.fix_branches_in_repository(application_data, challenge_request_issue)
-        self.push_fix_to_github_if_not_in_test_mode(test_mode)
+        self.push_fix_to_github_if_not_in_test_mode(test_mode, self.__dry_run)
         self.transition_challenge_issues_with_results(
             challenge_request_issue, application_data
         )
@@ -39,16 +65,30 @@ class AlertMode(RunnableMode, RepositoryMode, ScraperMode):
         self, application_data: ApplicationScreenDataWithChallengeBranches
     ) -> None:
         repository_name = application_data.repository_name
-        self.clone_repository(repository_name)
+        branches: list[str] = []
+        for challenge in application_data.challenge_map.values():
+            if challenge.secure_branch not in branches:
+                branches.append(challenge.secure_branch)
+            branches.extend(challenge.vulnerable_branches)
+
+        self.clone_repository(repository_name, branches)
 
     def fix_branches_in_repository(
         self,
         application_data: ApplicationScreenDataWithChallengeBranches,
         challenge_request_issue: ChallengeRequestIssue,
     ) -> None:
-        repo_fixer = RepoFixer(
-            self.get_repository(),
-        )
+        repository = self.get_repository()
+        if repository.is_fix_finished():
+            print(instructions.FIX_FINISHED_IN_PREVIOUS_RUN)
+            self.__fix_result = FixResult(
+                repository.get_journal().get_fix_messages(),
+                repository.get_journal().has_cherry_picks(),
+                False,
+            )
+            return
+
+        repo_fixer = RepoFixer(repository)
 
         is_full_app = False
 
@@ -104,19 +144,23 @@ class AlertMode(RunnableMode, RepositoryMode, ScraperMode):
                 except KeyboardInterrupt:
                     print(f"Skipping changes on {secure_branch}")
 
+        repository.get_journal().finish_fix()
+
     def transition_challenge_issues_with_results(
         self,
         challenge_request_issue: ChallengeRequestIssue,
         application_data: ApplicationScreenDataWithChallengeBranches,
     ) -> None:
-        transition_service = TransitionIssueService()
+        transition_service = TransitionIssueService(self.__dry_run)
 
         transition_service.transition_chrlq(
             challenge_request_issue, "Fixed vulnerable packages per dependabot alerts"
         )
 
         transition_service.transition_all_chlcs(
-            application_data.chlc, challenge_request_issue
+            application_data.chlc,
+            challenge_request_issue,
+            linked_creation_issues=self.__linked_creation_issues,
         )
 
     def display_results(self) -> None:
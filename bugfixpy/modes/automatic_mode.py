@@ -1,7 +1,8 @@
 from bugfixpy.cms import ScraperData
 from bugfixpy.git import FixResult, FixBranches
 from bugfixpy.utils import prompt_user
-from bugfixpy.jira import ChallengeRequestIssue, TransitionIssues
+from bugfixpy.utils.task_graph import TaskGraph
+from bugfixpy.jira import ChallengeRequestIssue, TransitionIssues, api, credential_cache
 
 from .types import RunnableMode, ScraperMode, RepositoryMode
 
@@ -13,46 +14,115 @@ class AutomaticMode(RunnableMode, RepositoryMode, ScraperMode):
 
     __fix_result: FixResult
     __challenge_request_issue: ChallengeRequestIssue
+    __dry_run: bool
 
-    def __init__(self, test_mode) -> None:
+    def __init__(
+        self,
+        test_mode,
+        refresh_cache=False,
+        dry_run=False,
+        clone_strategy=None,
+        resume=False,
+    ) -> None:
         super().__init__(self.MODE, test_mode)
+        self.set_refresh_cache(refresh_cache)
+        self.set_clone_strategy(clone_strategy)
+        self.set_resume(resume)
+        self.__dry_run = dry_run
 
     def run(self) -> None:
         test_mode = self.get_test_mode()
-        challenge_data = self.scrape_challenge_data()
-        self.clone_repository_from_scraper_data(challenge_data)
-        self.prompt_user_for_challenge_request_issue()
-        self.fix_branches_in_repository(challenge_data)
-        self.push_fix_to_github_if_not_in_test_mode(test_mode)
-        self.transition_challenge_issues_with_results(challenge_data)
+        task_graph = TaskGraph()
+
+        try:
+            challenge_data = task_graph.run("scrape CMS", self.scrape_challenge_data)
+
+            # The clone and the Jira lookups run while the user enters the CHLRQ
+            # and makes the fix
+            task_graph.add(
+                "clone",
+                lambda: self.clone_repository_from_scraper_data(challenge_data),
+            )
+            task_graph.add("fix version", api.get_current_fix_version)
+            task_graph.add(
+                "linked CHLCs",
+                lambda: api.get_challenge_creation_issues_linked_to_application(
+                    challenge_data.application.chlc
+                ),
+            )
+
+            task_graph.run("CHLRQ prompt", self.prompt_user_for_challenge_request_issue)
+            # Credentials Jira has not accepted recently are checked by the linked
+            # CHLC lookup before the fix, so a rejection cannot strand a pushed fix
+            if not credential_cache.is_validated():
+                task_graph.result("linked CHLCs")
+            self.wait_for_clone(task_graph)
+            task_graph.run(
+                "fix", lambda: self.fix_branches_in_repository(challenge_data)
+            )
+            task_graph.run(
+                "push",
+                lambda: self.push_fix_to_github_if_not_in_test_mode(
+                    test_mode, self.__dry_run
+                ),
+            )
+            task_graph.run(
+                "transition",
+                lambda: self.transition_challenge_issues_with_results(
+                    challenge_data, task_graph
+                ),
+            )
+        finally:
+            task_graph.shutdown()
+
+        task_graph.display_timeline()
 
     def clone_repository_from_scraper_data(self, challenge_data: ScraperData) -> None:
         repository_name = challenge_data.application.repository_name
-        self.clone_repository(repository_name)
+        branches = self.get_challenge_branches(challenge_data)
+        self.clone_repository_quietly(repository_name, branches)
+
+    def wait_for_clone(self, task_graph: TaskGraph) -> None:
+        if not task_graph.is_done("clone"):
+            print("Waiting for the clone to finish...")
+
+        task_graph.result("clone")
+        print("Cloning Repository...", end="")
+        self.print_repository_details()
 
     def prompt_user_for_challenge_request_issue(self) -> None:
         self.__challenge_request_issue = prompt_user.get_challenge_request_issue()
 
     def fix_branches_in_repository(self, challenge_data: ScraperData) -> None:
+        self.__fix_result = FixBranches(
+            self.get_repository(),
+            self.__challenge_request_issue,
+            branches=self.get_challenge_branches(challenge_data),
+        ).get_results()
+
+    def get_challenge_branches(self, challenge_data: ScraperData) -> list[str]:
         branches: list[str] = []
         for challenge in challenge_data.application.challenges:
             if challenge.secure_branch not in branches:
                 branches.append(challenge.secure_branch)
             branches.extend(challenge.vulnerable_branches)
 
-        self.__fix_result = FixBranches(
-            self.get_repository(),
-            self.__challenge_request_issue,
-            branches=branches,
-        ).get_results()
+        return branches
 
     def transition_challenge_issues_with_results(
-        self, challenge_data: ScraperData
+        self, challenge_data: ScraperData, task_graph: TaskGraph
     ) -> None:
         TransitionIssues(
             self.__fix_result,
             challenge_data,
             self.__challenge_request_issue,
+            self.__dry_run,
+            fix_version=task_graph.result("fix version"),
+            linked_creation_issues=(
+                task_graph.result("linked CHLCs")
+                if self.__fix_result.repo_was_cherrypicked
+                else None
+            ),
         ).run()
 
     def display_results(self) -> None:
@@ -0,0 +1,93 @@
+from typing import Optional
+
+from bugfixpy.batch import BatchJob, BatchRunner, JobResult, constants, load_jobs
+from bugfixpy.exceptions import InvalidJobError
+from bugfixpy.jira import api, credential_cache
+from bugfixpy.utils.text import colors
+
+from .types import RunnableMode
+
+
+class BatchMode(RunnableMode):
+
+    MODE = "BATCH"
+
+    __manifest_path: str
+    __results_path: str
+    __runner: BatchRunner
+    __results: list[JobResult]
+
+    def __init__(
+        self,
+        manifest_path: str,
+        results_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        test_mode: bool = False,
+        refresh_cache: bool = False,
+        clone_strategy: Optional[str] = None,
+    ) -> None:
+        super().__init__(self.MODE, test_mode)
+        self.__manifest_path = manifest_path
+        self.__results_path = (
+            results_path or f"{manifest_path}{constants.RESULTS_SUFFIX}"
+        )
+        self.__runner = BatchRunner(
+            self.__results_path,
+            max_workers or constants.BATCH_MAX_WORKERS,
+            test_mode,
+            refresh_cache,
+            clone_strategy,
+        )
+        self.__results = []
+
+    def run(self) -> None:
+        jobs = load_jobs(self.__manifest_path)
+        # Jobs push before their first Jira request, so credentials Jira has not
+        # accepted recently are checked with the CHLRQs before any job runs
+        if not self.get_test_mode() and not credential_cache.is_validated():
+            self.verify_challenge_request_issues(jobs)
+
+        print(f"Running {colors.OKCYAN}{len(jobs)}{colors.ENDC} jobs")
+
+        for result in self.__runner.run(jobs):
+            self.__results.append(result)
+            self.display_result(result)
+
+    def verify_challenge_request_issues(self, jobs: list[BatchJob]) -> None:
+        for job in jobs:
+            challenge_request_issue = job.get_challenge_request_issue()
+            if job.transition and not api.issue_exists(challenge_request_issue):
+                raise InvalidJobError(
+                    f"Job {job.index}: {challenge_request_issue.get_issue_id()}"
+                    " does not exist"
+                )
+
+    def display_result(self, result: JobResult) -> None:
+        if result.status == constants.JOB_SUCCEEDED:
+            status = f"{colors.OKGREEN}[ OK ]{colors.ENDC}"
+        elif result.status == constants.JOB_CONFLICTED:
+            status = f"{colors.WARNING}[ !!! ]{colors.ENDC}"
+        else:
+            status = f"{colors.FAIL}[ FAIL ]{colors.ENDC}"
+
+        details = result.error or (
+            f"{len(result.picked_branches)} picked,"
+            f" {len(result.conflicted_branches)} conflicted"
+        )
+        print(
+            f"{status} job {result.job} {result.name}: {details}"
+            f" ({result.elapsed:.1f}s)"
+        )
+
+    def display_results(self) -> None:
+        succeeded = [
+            result
+            for result in self.__results
+            if result.status == constants.JOB_SUCCEEDED
+        ]
+        print(
+            f"{colors.OKGREEN}{len(succeeded)} of {len(self.__results)} jobs"
+            f" succeeded{colors.ENDC}"
+        )
+        print(f"Results: {colors.OKCYAN}{self.__results_path}{colors.ENDC}")
+        print(f"Logs: {colors.OKCYAN}{self.__runner.get_logs_dir()}{colors.ENDC}")
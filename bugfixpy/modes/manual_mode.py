@@ -14,8 +14,10 @@ class ManualMode(RunnableMode, RepositoryMode):
 
     __challenge_request_issue: ChallengeRequestIssue
 
-    def __init__(self, test_mode: bool) -> None:
+    def __init__(self, test_mode: bool, clone_strategy=None, resume=False) -> None:
         super().__init__(self.MODE, test_mode)
+        self.set_clone_strategy(clone_strategy)
+        self.set_resume(resume)
 
     def run(self) -> None:
         test_mode = self.get_test_mode()
@@ -1,47 +1,33 @@
 from bugfixpy.utils import validate
-from bugfixpy.git import Repository, RevertCommit
-from bugfixpy.utils.text import colors, instructions, headers
+from bugfixpy.git import RevertCommit
+from bugfixpy.utils.text import colors
 
-from . import utils
+from .types import RunnableMode, RepositoryMode, ScraperMode
 
 
-class RevertCommitMode:
+class RevertCommitMode(RunnableMode, RepositoryMode, ScraperMode):
 
-    test_mode: bool
-    repository: Repository
+    MODE = "REVERT"
 
-    def __init__(self, test_mode) -> None:
-        self.test_mode = test_mode
+    def __init__(self, test_mode, refresh_cache=False, clone_strategy=None) -> None:
+        super().__init__(self.MODE, test_mode)
+        self.set_refresh_cache(refresh_cache)
+        self.set_clone_strategy(clone_strategy)
 
-    @classmethod
-    def run(cls, test_mode) -> None:
-        revert_commit = cls(test_mode)
-        revert_commit.display_revert_mode_headers()
-        revert_commit.clone_repository_from_challenge_id_or_repository_name()
-        revert_commit.get_commit_id_and_revert_commit()
-        revert_commit.push_fix_to_github_if_not_in_test_mode()
-
-        print("Revert Complete.")
+    def run(self) -> None:
+        self.clone_repository_from_challenge_id_or_repository_name()
+        self.get_commit_id_and_revert_commit()
+        self.push_fix_to_github_if_not_in_test_mode(self.get_test_mode())
 
     def get_commit_id_and_revert_commit(self) -> None:
+        repository = self.get_repository()
         commit_id = None
         while not commit_id:
             commit_id = input("Enter commit ID: ")
-            if not self.repository.branch_contains_commit_id(commit_id):
+            if not repository.branch_contains_commit_id(commit_id):
                 commit_id = None
 
-        RevertCommit(self.repository, commit_id).run()
-
-    # TODO: duplicate in automatic_fix
-    def push_fix_to_github_if_not_in_test_mode(self) -> None:
-        try:
-            if self.test_mode:
-                print(f"{colors.HEADER}Test mode enabled. Push skipped{colors.ENDC}")
-            else:
-                input(instructions.PROMPT_FOR_ENTER_PUSH_ENABLED)
-                self.repository.push_all_branches()
-        except KeyboardInterrupt:
-            print(f"\n{colors.FAIL}Skipped push to repository{colors.ENDC}")
+        RevertCommit(repository, commit_id).run()
 
     # TODO: duplicate in view_repository
     def clone_repository_from_challenge_id_or_repository_name(self) -> None:
@@ -50,17 +36,13 @@ class RevertCommitMode:
 
         if validate.is_valid_challenge_id(name_or_id):
             print("Challenge ID entered")
-            challenge_data = utils.scrape_challenge_data_from_cms(name_or_id)
-            repo_name = challenge_data.application.repository_name
+            challenge_data = self.get_challenge_data(name_or_id, lazy=True)
+            repository_name = challenge_data.application.repository_name
         else:
             print("Repository name entered")
-            repo_name = name_or_id
+            repository_name = name_or_id
 
-        self.repository = utils.clone_the_challenge_repository(repo_name)
+        self.clone_repository(repository_name)
 
-    # TODO: semi duplicate in modes/utils.py
-    def display_revert_mode_headers(self) -> None:
-        print(f"{colors.HEADER}Revert mode enabled{colors.ENDC}")
-
-        if self.test_mode:
-            print(colors.HEADER, headers.TEST_MODE, colors.ENDC, sep="")
+    def display_results(self) -> None:
+        print("Revert Complete.")
@@ -1,8 +1,8 @@
 import sys
 from getpass import getpass
-import keyring
 
 from bugfixpy import cms, jira
+from bugfixpy.utils import credentials
 from bugfixpy.utils.text import colors
 
 from .types import RunnableMode
@@ -54,10 +54,10 @@ class SetupCredentials(RunnableMode):
         while not cms_password:
             cms_password = getpass(prompt="Enter CMS Password: ")
 
-        keyring.set_password("system", "JIRA_API_EMAIL", api_email)
-        keyring.set_password("system", "JIRA_API_KEY", api_key)
-        keyring.set_password("system", "CMS_EMAIL", cms_email)
-        keyring.set_password("system", "CMS_PASSWORD", cms_password)
+        credentials.set_password(jira.constants.CREDENTIALS["API_EMAIL"], api_email)
+        credentials.set_password(jira.constants.CREDENTIALS["API_KEY"], api_key)
+        credentials.set_password(cms.constants.CREDENTIALS["EMAIL"], cms_email)
+        credentials.set_password(cms.constants.CREDENTIALS["PASSWORD"], cms_password)
 
         print("Setup complete.")
 
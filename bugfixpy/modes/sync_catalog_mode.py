@@ -0,0 +1,113 @@
+import time
+
+from bugfixpy.cms import ApplicationListing, Catalog
+from bugfixpy.exceptions import RequestFailedError
+from bugfixpy.utils.text import colors
+
+from .types import RunnableMode, ScraperMode
+
+
+class SyncCatalogMode(RunnableMode, ScraperMode):
+
+    MODE = "SYNC CATALOG"
+
+    __full_sync: bool
+    __synced_applications: int
+    __failed_applications: list[str]
+    __pages_fetched: int
+    __pages_skipped: int
+
+    def __init__(self, full_sync=False) -> None:
+        super().__init__(self.MODE, test_mode=False)
+        self.__full_sync = full_sync
+        self.__synced_applications = 0
+        self.__failed_applications = []
+        self.__pages_fetched = 0
+        self.__pages_skipped = 0
+
+    def run(self) -> None:
+        started_at = time.time()
+        cms_scraper = self.get_cms_scraper()
+
+        print("Collecting application list from CMS...", end="")
+        applications, list_pages = cms_scraper.scrape_application_list()
+        self.__pages_fetched += list_pages
+        print(f" {colors.OKCYAN}{len(applications)}{colors.ENDC} applications")
+
+        catalog = Catalog()
+        try:
+            for i, application in enumerate(applications):
+                was_synced = self.sync_application(catalog, application)
+                self.display_percentage_complete(i, applications, was_synced)
+
+            catalog.record_sync_run(
+                started_at,
+                self.__full_sync,
+                len(applications),
+                self.__pages_fetched,
+                self.__pages_skipped,
+            )
+        finally:
+            catalog.close()
+
+    def sync_application(
+        self, catalog: Catalog, application: ApplicationListing
+    ) -> bool:
+        cms_scraper = self.get_cms_scraper()
+
+        try:
+            application_data = cms_scraper.scrape_application_screen_by_url(
+                catalog.get_application_path(application.url)
+            )
+            self.__pages_fetched += 1
+
+            changed_challenges = (
+                application_data.challenges
+                if self.__full_sync
+                else catalog.reuse_unchanged_challenges(application, application_data)
+            )
+            cms_scraper.scrape_challenge_branches(changed_challenges)
+            self.__pages_fetched += len(changed_challenges)
+            self.__pages_skipped += len(application_data.challenges) - len(
+                changed_challenges
+            )
+            catalog.save_application(application, application_data)
+            self.__synced_applications += 1
+
+        except RequestFailedError as err:
+            self.__failed_applications.append(f"{application.name} ({err})")
+            return False
+        except Exception as err:
+            self.__failed_applications.append(
+                f"{application.name} (Unknown Error: {err})"
+            )
+            return False
+
+        return True
+
+    def display_percentage_complete(
+        self,
+        current_index: int,
+        applications: list[ApplicationListing],
+        was_synced: bool,
+    ) -> None:
+        percentage = (current_index + 1) * 100 / len(applications)
+        result = f"{colors.OKGREEN}[SYNCED]" if was_synced else f"{colors.FAIL}[FAILED]"
+        print(
+            f"[{colors.OKCYAN}{percentage:.1f}%{colors.ENDC}]{colors.ENDC}"
+            f" {applications[current_index].name}: {result}{colors.ENDC}"
+        )
+
+    def display_results(self) -> None:
+        print(
+            f"{colors.OKGREEN}Synced {self.__synced_applications} applications"
+            f"{colors.ENDC}"
+        )
+        print(
+            f"CMS pages fetched: {colors.OKCYAN}{self.__pages_fetched}{colors.ENDC},"
+            f" skipped: {colors.OKCYAN}{self.__pages_skipped}{colors.ENDC}"
+        )
+
+        if self.__failed_applications:
+            failed_applications = "\n\t".join(self.__failed_applications)
+            print(f"{colors.FAIL}Failed to sync:\n\t{failed_applications}{colors.ENDC}")
@@ -9,8 +9,12 @@ class TransitionMode(RunnableMode, ScraperMode):
 
     MODE = "TRANSITION"
 
-    def __init__(self) -> None:
+    __dry_run: bool
+
+    def __init__(self, refresh_cache=False, dry_run=False) -> None:
         super().__init__(self.MODE, test_mode=False)
+        self.set_refresh_cache(refresh_cache)
+        self.__dry_run = dry_run
 
     def run(self) -> None:
         challenge_data = self.scrape_challenge_data()
@@ -24,6 +28,7 @@ class TransitionMode(RunnableMode, ScraperMode):
             FixResult([fix_message], is_bulk_transition_required, False),
             challenge_data,
             challenge_request_issue,
+            self.__dry_run,
         ).run()
 
     def display_results(self) -> None:
@@ -1,22 +1,40 @@
 import sys
+from typing import Optional
 
-from bugfixpy.git import Repository
+from bugfixpy.git import Repository, constants
 from bugfixpy.utils import prompt_user
 from bugfixpy.utils.text import colors, instructions
 
 
 class RepositoryMode:
     __repository: Repository
+    __clone_strategy: str = constants.CLONE_STRATEGY_FULL
+    __resume: bool = False
 
     def get_repository(self) -> Repository:
         return self.__repository
 
-    def clone_repository(self, repository_name: str) -> None:
-        try:
-            print("Cloning Repository...", end="")
-            self.__repository = Repository(repository_name)
+    def set_clone_strategy(self, clone_strategy: Optional[str]) -> None:
+        if clone_strategy:
+            self.__clone_strategy = clone_strategy
+
+    def set_resume(self, resume: bool) -> None:
+        self.__resume = resume
+
+    def clone_repository(
+        self, repository_name: str, branches: Optional[list[str]] = None
+    ) -> None:
+        print("Cloning Repository...", end="")
+        self.clone_repository_quietly(repository_name, branches)
+        self.print_repository_details()
 
-            self.print_repository_details()
+    def clone_repository_quietly(
+        self, repository_name: str, branches: Optional[list[str]] = None
+    ) -> None:
+        try:
+            self.__repository = Repository(
+                repository_name, self.__clone_strategy, branches, self.__resume
+            )
         except ValueError:
             print(f"{colors.FAIL}Error getting repository")
             sys.exit(1)
@@ -29,22 +47,62 @@ class RepositoryMode:
         num_branches = len(self.__repository.get_branches())
         print(instructions.DONE)
         print(f"Branches: {colors.OKCYAN}{num_branches}{colors.ENDC}")
+        clone_report = self.__repository.get_clone_report()
+        print(f"Clone: {colors.OKCYAN}{clone_report}{colors.ENDC}")
+
+        if self.__repository.was_resumed():
+            finished_branches = self.__repository.get_advanced_branches()
+            print(
+                f"Resumed: {colors.OKCYAN}{len(finished_branches)} branches"
+                f" finished{colors.ENDC}"
+            )
+        elif self.__resume:
+            print(f"{colors.WARNING}No session to resume, started over{colors.ENDC}")
 
         if self.__repository.is_full_app():
             print(f"Type {colors.OKCYAN}Full App{colors.ENDC}")
         else:
             print(f"Type: {colors.OKCYAN}Minified App{colors.ENDC}")
 
-    def push_fix_to_github_if_not_in_test_mode(self, test_mode: bool) -> None:
+    def push_fix_to_github_if_not_in_test_mode(
+        self, test_mode: bool, dry_run: bool = False
+    ) -> None:
         try:
-            if test_mode:
+            if dry_run:
+                print(f"{colors.HEADER}Dry run enabled. Push skipped{colors.ENDC}")
+            elif test_mode:
                 print(f"{colors.HEADER}Test mode enabled. Push skipped{colors.ENDC}")
             else:
                 input(instructions.PROMPT_FOR_ENTER_PUSH_ENABLED)
-                self.__repository.push_all_branches()
-                print("Pushed successfully")
+                self.push_advanced_branches()
         except KeyboardInterrupt:
             print(f"\n{colors.FAIL}Skipped push to repository{colors.ENDC}")
 
+    def push_advanced_branches(self) -> None:
+        if not self.__repository.get_advanced_branches():
+            print(
+                f"{colors.HEADER}No branches were changed. Nothing to push{colors.ENDC}"
+            )
+            return
+
+        push_report = self.__repository.push_advanced_branches()
+
+        for result in push_report.results:
+            color = colors.OKGREEN if result.succeeded() else colors.FAIL
+            print(
+                f"{color}[{result.flag}]{colors.ENDC} {result.branch}: {result.summary}"
+            )
+
+        if push_report.succeeded():
+            self.__repository.get_journal().delete()
+            print(
+                f"Pushed {len(push_report.results)} branches successfully"
+                f" ({colors.OKCYAN}{push_report.elapsed:.1f}s{colors.ENDC})"
+            )
+        else:
+            print(f"{colors.FAIL}Push rejected, no branches were updated{colors.ENDC}")
+            if push_report.error:
+                print(push_report.error)
+
     def is_repo_full_app(self) -> bool:
         return self.__repository.is_full_app()
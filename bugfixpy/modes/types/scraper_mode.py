@@ -1,38 +1,97 @@
+import os
 import sys
+from typing import Any, Callable, Optional
 
 from bugfixpy.cms import (
     ScraperData,
     CmsScraper,
     ApplicationScreenDataWithChallengeBranches,
+    ScrapeCache,
+    Catalog,
+    constants,
 )
-from bugfixpy.exceptions import RequestFailedError
+from bugfixpy.exceptions import InvalidCredentialsError, RequestFailedError
 from bugfixpy.utils.text import colors, instructions
 from bugfixpy.utils import prompt_user
 
 
 class ScraperMode:
-    cms_scraper: CmsScraper
+    cms_scraper: Optional[CmsScraper] = None
+    __refresh_cache: bool = False
 
-    def get_challenge_data(self, challenge_id: str) -> ScraperData:
-        cms_scraper = CmsScraper()
+    def set_refresh_cache(self, refresh_cache: bool) -> None:
+        self.__refresh_cache = refresh_cache
+
+    def get_challenge_data(self, challenge_id: str, lazy: bool = False) -> ScraperData:
         print("Collecting challenge data from CMS...", end="")
-        scraper_data = cms_scraper.scrape_challenge_data(challenge_id)
+        scraper_data = self.find_in_catalog(
+            lambda catalog: catalog.find_challenge_data(challenge_id)
+        ) or self.get_cached_or_scrape(
+            f"challenge:{challenge_id}",
+            lambda cms_scraper: cms_scraper.scrape_challenge_data(challenge_id, lazy),
+            lazy,
+        )
         print(instructions.DONE)
 
         return scraper_data
 
     def get_application_data(
-        self, application_name_or_url: str
+        self, application_name_or_url: str, lazy: bool = False
     ) -> ApplicationScreenDataWithChallengeBranches:
-        cms_scraper = CmsScraper()
         print("Collecting application data from CMS...", end="")
-        application_data = cms_scraper.scrape_application_data_with_challenge_map(
-            application_name_or_url
+        application_data = self.find_in_catalog(
+            lambda catalog: catalog.find_application_data(application_name_or_url)
+        ) or self.get_cached_or_scrape(
+            f"application:{application_name_or_url}",
+            lambda cms_scraper: cms_scraper.scrape_application_data_with_challenge_map(
+                application_name_or_url, lazy
+            ),
+            lazy,
         )
         print(instructions.DONE)
 
         return application_data
 
+    def find_in_catalog(self, find: Callable[[Catalog], Any]) -> Any:
+        if self.__refresh_cache or not os.path.exists(constants.CATALOG_FILE):
+            return None
+
+        catalog = Catalog()
+        try:
+            return find(catalog)
+        finally:
+            catalog.close()
+
+    def get_cached_or_scrape(
+        self, key: str, scrape: Callable[[CmsScraper], Any], lazy: bool = False
+    ) -> Any:
+        cache = ScrapeCache()
+        entry = None if self.__refresh_cache else cache.get(key)
+
+        if entry and cache.is_fresh(entry):
+            return entry.data
+
+        cms_scraper = self.get_cms_scraper()
+
+        # Caching or revalidating lazy data would scrape every challenge screen
+        if lazy:
+            return scrape(cms_scraper)
+
+        if entry and cms_scraper.are_pages_unchanged(entry.page_validators):
+            cache.touch(key, entry)
+            return entry.data
+
+        data = scrape(cms_scraper)
+        cache.put(key, data, cms_scraper.get_page_validators())
+
+        return data
+
+    def get_cms_scraper(self) -> CmsScraper:
+        if not self.cms_scraper:
+            self.cms_scraper = CmsScraper()
+
+        return self.cms_scraper
+
     def scrape_challenge_data(self) -> ScraperData:
         challenge_data = ScraperData()
         try:
@@ -41,6 +100,9 @@ class ScraperMode:
         except RequestFailedError as err:
             print(f"{colors.FAIL}[Failed]\n{err}{colors.ENDC}")
             sys.exit(1)
+        except InvalidCredentialsError:
+            # Reported by __main__ with the --setup hint
+            raise
         except Exception as err:
             print(f"{colors.FAIL}[Failed]\nUnknown Error: {err}{colors.ENDC}")
 
@@ -54,6 +116,9 @@ class ScraperMode:
         except RequestFailedError as err:
             print(f"{colors.FAIL}[Failed]\n{err}{colors.ENDC}")
             sys.exit(1)
+        except InvalidCredentialsError:
+            # Reported by __main__ with the --setup hint
+            raise
         except Exception as err:
             print(f"{colors.FAIL}[Failed]\nUnknown Error: {err}{colors.ENDC}")
 
@@ -8,8 +8,10 @@ class ViewRepository(RunnableMode, RepositoryMode, ScraperMode):
 
     MODE = "VIEW"
 
-    def __init__(self) -> None:
+    def __init__(self, refresh_cache=False, clone_strategy=None) -> None:
         super().__init__(self.MODE, False)
+        self.set_refresh_cache(refresh_cache)
+        self.set_clone_strategy(clone_strategy)
 
     def run(self) -> None:
         self.clone_repository_from_challenge_id_or_repository_name()
@@ -27,12 +29,12 @@ class ViewRepository(RunnableMode, RepositoryMode, ScraperMode):
 
         if validate.is_valid_challenge_id(name_or_id):
             print("Challenge ID entered")
-            challenge_data = self.get_challenge_data(name_or_id)
+            challenge_data = self.get_challenge_data(name_or_id, lazy=True)
             repository_name = challenge_data.application.repository_name
             self.clone_repository(repository_name)
         else:
             print("Repository name entered")
-            application_data = self.get_application_data(name_or_id)
+            application_data = self.get_application_data(name_or_id, lazy=True)
             self.clone_repository(application_data.repository_name)
 
     def display_results(self) -> None:
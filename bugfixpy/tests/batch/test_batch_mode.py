@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.exceptions import InvalidCredentialsError, InvalidJobError
+from bugfixpy.modes.batch_mode import BatchMode
+
+
+class TestBatchMode(unittest.TestCase):
+    """Test checking credentials before the jobs of a batch run"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "jobs.jsonl")
+        with open(
+            os.path.join(self.temp_dir.name, "fix.patch"), "w", encoding="utf-8"
+        ) as patch_file:
+            patch_file.write("")
+
+        job = {"application": "opentasks", "chlrq": "42", "patch": "fix.patch"}
+        with open(self.manifest_path, "w", encoding="utf-8") as manifest:
+            manifest.write(f"{json.dumps(job)}\n")
+            transition_job = {
+                **job,
+                "chlrq": "43",
+                "reviewer": "Oscar",
+                "push": True,
+                "transition": True,
+            }
+            manifest.write(f"{json.dumps(transition_job)}\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    @patch("bugfixpy.batch.BatchRunner.run", return_value=iter([]))
+    @patch("bugfixpy.jira.credential_cache.is_validated", return_value=False)
+    @patch("bugfixpy.jira.api.issue_exists", return_value=True)
+    def test_unvalidated_credentials_are_checked_with_transitioned_chlrqs(
+        self, issue_exists, _is_validated, run
+    ) -> None:
+        BatchMode(self.manifest_path).run()
+
+        self.assertEqual(
+            [call.args[0].get_issue_id() for call in issue_exists.call_args_list],
+            ["CHLRQ-43"],
+        )
+        run.assert_called_once()
+
+    @patch("bugfixpy.batch.BatchRunner.run")
+    @patch("bugfixpy.jira.credential_cache.is_validated", return_value=False)
+    @patch("bugfixpy.jira.api.issue_exists")
+    def test_no_job_runs_when_the_check_fails(
+        self, issue_exists, _is_validated, run
+    ) -> None:
+        def reject_credentials(_issue):
+            raise InvalidCredentialsError()
+
+        for side_effect, error in [
+            (reject_credentials, InvalidCredentialsError),
+            (lambda _issue: False, InvalidJobError),
+        ]:
+            with self.subTest(error=error.__name__):
+                issue_exists.side_effect = side_effect
+
+                with self.assertRaises(error):
+                    BatchMode(self.manifest_path).run()
+
+                run.assert_not_called()
+
+    @patch("bugfixpy.batch.BatchRunner.run", return_value=iter([]))
+    @patch("bugfixpy.jira.credential_cache.is_validated", return_value=True)
+    @patch("bugfixpy.jira.api.issue_exists")
+    def test_recently_accepted_credentials_are_not_checked(
+        self, issue_exists, _is_validated, _run
+    ) -> None:
+        BatchMode(self.manifest_path).run()
+
+        issue_exists.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+
+import bugfixpy
+from bugfixpy.batch import constants, load_jobs
+from bugfixpy.exceptions import InvalidJobError
+
+
+class TestLoadJobs(unittest.TestCase):
+    """Test reading and validating the jobs of a batch manifest"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "jobs.jsonl")
+        with open(
+            os.path.join(self.temp_dir.name, "fix.patch"), "w", encoding="utf-8"
+        ) as patch_file:
+            patch_file.write("")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write_manifest(self, *jobs) -> None:
+        with open(self.manifest_path, "w", encoding="utf-8") as manifest:
+            for job in jobs:
+                manifest.write(job if isinstance(job, str) else json.dumps(job))
+                manifest.write("\n")
+
+    def test_jobs_are_loaded(self) -> None:
+        self.write_manifest(
+            {"challenge_id": "abc123", "chlrq": "1234", "patch": "fix.patch"},
+            "",
+            {
+                "application": "opentasks",
+                "chlrq": "CHLRQ-42",
+                "patch": "fix.patch",
+                "message": "Escape search input",
+                "reviewer": "Oscar",
+                "push": True,
+                "transition": True,
+            },
+        )
+
+        first_job, second_job = load_jobs(self.manifest_path)
+
+        self.assertEqual(first_job.index, 0)
+        self.assertEqual(first_job.get_name(), "abc123")
+        self.assertEqual(
+            first_job.get_challenge_request_issue().get_issue_id(), "CHLRQ-1234"
+        )
+        self.assertEqual(first_job.patch, os.path.join(self.temp_dir.name, "fix.patch"))
+        self.assertEqual(first_job.message, constants.DEFAULT_FIX_MESSAGE)
+        self.assertFalse(first_job.push)
+        self.assertEqual(second_job.index, 1)
+        self.assertEqual(second_job.get_name(), "opentasks")
+        self.assertTrue(second_job.transition)
+
+    def test_invalid_jobs_are_rejected(self) -> None:
+        job = {"application": "opentasks", "chlrq": "42", "patch": "fix.patch"}
+        invalid_jobs = [
+            "{not json",
+            ["opentasks"],
+            {**job, "branch": "secure"},
+            {**job, "challenge_id": "abc123"},
+            {"application": "opentasks", "chlrq": "42"},
+            {**job, "script": "fix.patch"},
+            {**job, "patch": "missing.patch"},
+            {**job, "chlrq": "CHLC-42"},
+            {**job, "push": "yes"},
+            {**job, "reviewer": "Oscar", "transition": True},
+            {**job, "push": True, "transition": True},
+        ]
+
+        for invalid_job in invalid_jobs:
+            with self.subTest(job=invalid_job):
+                self.write_manifest(job, invalid_job)
+
+                with self.assertRaisesRegex(InvalidJobError, "^Line 2: "):
+                    load_jobs(self.manifest_path)
+
+    def test_reviewers_file_does_not_depend_on_working_directory(self) -> None:
+        self.assertEqual(
+            os.path.abspath(constants.REVIEWERS_FILE),
+            os.path.join(os.path.dirname(bugfixpy.__file__), "reviewers.json"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+import json
+import os
+import stat
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.batch import BatchJob, BatchRunner, constants, run_job
+from bugfixpy.cms import (
+    ApplicationScreenData,
+    ApplicationScreenDataWithChallengeBranches,
+    ChallengeScreenData,
+    ScraperData,
+)
+from bugfixpy.cms.scraper_data import Challenge
+from bugfixpy.tests.git.fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+FIX_PATCH = """diff --git a/login.py b/login.py
+--- a/login.py
++++ b/login.py
+@@ -1 +1 @@
+-query = 'SELECT *'
++query = 'SELECT ?'
+"""
+
+
+class TestBatchRunner(RemoteRepositoryTestCase):
+    """Test running batch jobs without prompts"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.start_patcher(
+            patch(
+                "bugfixpy.batch.constants.BATCH_REPO_DIR",
+                os.path.join(self.repo_dir, ".batch"),
+            )
+        )
+        # Jobs commit in fresh clones, which have no user configured
+        self.start_patcher(
+            patch.dict(
+                os.environ,
+                {
+                    "GIT_AUTHOR_NAME": "Tester",
+                    "GIT_AUTHOR_EMAIL": "tester@securecodewarrior.com",
+                    "GIT_COMMITTER_NAME": "Tester",
+                    "GIT_COMMITTER_EMAIL": "tester@securecodewarrior.com",
+                },
+            )
+        )
+
+        self.write_file(self.source, "login.py", "query = 'SELECT *'\n")
+        self.source.git.add(A=True)
+        self.source.git.commit("-m", "Initial commit")
+        self.source.git.branch("-M", "secure")
+        self.source.git.branch("sqli_login")
+        self.source.git.branch("xss_search")
+        self.source.git.checkout("-b", "csrf_form")
+        self.write_file(self.source, "login.py", "query = 'csrf'\n")
+        self.source.git.commit("-am", "Change login on csrf_form")
+        self.push_source()
+
+        self.patch_path = self.write_job_file("fix.patch", FIX_PATCH)
+        self.log_path = os.path.join(self.temp_dir.name, "logs", "job-0.log")
+
+    def write_job_file(self, name: str, contents: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(contents)
+
+        return path
+
+    def get_application_data(
+        self, vulnerable_branches: list[str]
+    ) -> ApplicationScreenDataWithChallengeBranches:
+        challenge_map = {
+            branch: Challenge(
+                branch, secure_branch="secure", vulnerable_branches=[branch]
+            )
+            for branch in vulnerable_branches
+        }
+        return ApplicationScreenDataWithChallengeBranches(
+            repository_name=REPOSITORY_NAME, challenge_map=challenge_map
+        )
+
+    def run_application_job(self, job: BatchJob, vulnerable_branches: list[str]):
+        with patch(
+            "bugfixpy.batch.runner.JobRunner.get_application_data",
+            return_value=self.get_application_data(vulnerable_branches),
+        ):
+            return run_job(job, self.log_path)
+
+    def test_fix_is_applied_cherry_picked_and_pushed(self) -> None:
+        job = BatchJob(
+            0, "42", application=REPOSITORY_NAME, patch=self.patch_path, push=True
+        )
+
+        result = self.run_application_job(job, ["sqli_login", "xss_search"])
+
+        self.assertEqual(result.status, constants.JOB_SUCCEEDED, result.error)
+        self.assertEqual(result.repository, REPOSITORY_NAME)
+        self.assertEqual(list(result.fix_commits), ["secure"])
+        self.assertCountEqual(result.picked_branches, ["sqli_login", "xss_search"])
+        self.assertTrue(result.pushed)
+        for branch in ["secure", "sqli_login", "xss_search"]:
+            self.assertEqual(
+                self.remote.git.show(f"{branch}:login.py"), "query = 'SELECT ?'"
+            )
+        self.assertIn(
+            f"CHLRQ-42: {constants.DEFAULT_FIX_MESSAGE}",
+            self.remote.git.log("-1", "--format=%s", "secure"),
+        )
+        self.assertTrue(os.path.exists(self.log_path))
+
+    def test_conflict_is_reported_without_pushing(self) -> None:
+        job = BatchJob(
+            0, "42", application=REPOSITORY_NAME, patch=self.patch_path, push=True
+        )
+
+        result = self.run_application_job(job, ["sqli_login", "csrf_form"])
+
+        self.assertEqual(result.status, constants.JOB_CONFLICTED)
+        self.assertEqual(result.picked_branches, ["sqli_login"])
+        self.assertEqual(result.conflicted_branches, {"csrf_form": ["login.py"]})
+        self.assertFalse(result.pushed)
+        self.assertEqual(self.remote.git.show("secure:login.py"), "query = 'SELECT *'")
+
+    def test_fix_without_changes_fails_job(self) -> None:
+        script_path = self.write_job_file("fix.sh", "#!/bin/sh\ntrue\n")
+        os.chmod(script_path, os.stat(script_path).st_mode | stat.S_IEXEC)
+        job = BatchJob(0, "42", application=REPOSITORY_NAME, script=script_path)
+
+        result = self.run_application_job(job, ["sqli_login"])
+
+        self.assertEqual(result.status, constants.JOB_FAILED)
+        self.assertIn("made no changes on secure", result.error)
+
+    def run_full_app_challenge_job(self, application: object):
+        job = BatchJob(0, "42", challenge_id="abc123", patch=self.patch_path)
+        scraper_data = ScraperData(
+            ChallengeScreenData("", None, "secure", []), application
+        )
+
+        with patch(
+            "bugfixpy.batch.runner.JobRunner.get_challenge_data",
+            return_value=scraper_data,
+        ):
+            return run_job(job, self.log_path, test_mode=True)
+
+    def test_full_app_challenge_fixes_every_challenge_branch(self) -> None:
+        challenges = [
+            Challenge(
+                "SQLi", secure_branch="secure", vulnerable_branches=["sqli_login"]
+            ),
+            Challenge(
+                "XSS", secure_branch="secure", vulnerable_branches=["xss_search"]
+            ),
+        ]
+        applications = [
+            ApplicationScreenData(
+                repository_name=REPOSITORY_NAME, challenges=challenges
+            ),
+            ApplicationScreenDataWithChallengeBranches(
+                repository_name=REPOSITORY_NAME, challenges=challenges
+            ),
+        ]
+
+        for application in applications:
+            with self.subTest(application=type(application).__name__):
+                result = self.run_full_app_challenge_job(application)
+
+                self.assertEqual(result.status, constants.JOB_SUCCEEDED, result.error)
+                self.assertCountEqual(
+                    result.picked_branches, ["sqli_login", "xss_search"]
+                )
+
+    def test_unexpected_application_data_fails_job(self) -> None:
+        result = self.run_full_app_challenge_job(
+            Challenge(REPOSITORY_NAME, secure_branch="secure")
+        )
+
+        self.assertEqual(result.status, constants.JOB_FAILED)
+        self.assertIn("TypeError", result.error)
+
+    def test_results_are_written_as_jobs_finish(self) -> None:
+        results_path = os.path.join(self.temp_dir.name, "jobs.results.jsonl")
+        jobs = [
+            BatchJob(0, "42", application=REPOSITORY_NAME, patch=self.patch_path),
+            BatchJob(1, "43", application="unknown", patch=self.patch_path),
+        ]
+
+        def get_application_data(name):
+            if name != REPOSITORY_NAME:
+                raise ValueError(f"No application {name}")
+            return self.get_application_data(["sqli_login"])
+
+        # Workers are forked, so they see the patched CMS lookup
+        with patch(
+            "bugfixpy.batch.runner.JobRunner.get_application_data",
+            side_effect=get_application_data,
+        ):
+            runner = BatchRunner(results_path, max_workers=2, test_mode=True)
+            results = list(runner.run(jobs))
+
+        with open(results_path, encoding="utf-8") as results_file:
+            written_results = [json.loads(line) for line in results_file]
+
+        self.assertEqual(len(results), 2)
+        self.assertCountEqual(
+            [(result["job"], result["status"]) for result in written_results],
+            [(0, constants.JOB_SUCCEEDED), (1, constants.JOB_FAILED)],
+        )
+        for result in written_results:
+            self.assertTrue(os.path.exists(result["log"]))
+            self.assertTrue(result["log"].startswith(runner.get_logs_dir()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+
+from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
+from bugfixpy.cms import ApplicationListing, ApplicationScreenData, Catalog
+from bugfixpy.cms.scraper_data import Challenge
+
+APPLICATION_URL = "/applications/4b0e6f1c-8a55-4c1a-9a5e-2f3c7d9e1a20/show"
+CHALLENGE_ID = "5dfb305304d5c305ad11fe63"
+DEPRECATED_CHALLENGE_ID = "5dfb305304d5c305ad11fe64"
+
+
+class TestCatalog(unittest.TestCase):
+    """Test the local index of CMS applications and challenges"""
+
+    def setUp(self) -> None:
+        self.catalog_dir = tempfile.TemporaryDirectory()
+        self.catalog_file = os.path.join(self.catalog_dir.name, "catalog.sqlite")
+
+    def tearDown(self) -> None:
+        self.catalog_dir.cleanup()
+
+    def save_application(self, catalog: Catalog) -> None:
+        secure_challenge = Challenge(
+            "sqli_login",
+            f"/challenges/{CHALLENGE_ID}/show",
+            "secure",
+            ["sqli_login", "sqli_login_incorrect_0"],
+            "Done",
+            ChallengeCreationIssue("CHLC-1234"),
+        )
+        deprecated_challenge = Challenge(
+            "xss_search",
+            f"/challenges/{DEPRECATED_CHALLENGE_ID}/show",
+            status="Deprecated",
+        )
+        catalog.save_application(
+            ApplicationListing("OpenTasks", APPLICATION_URL),
+            ApplicationScreenData(
+                ApplicationCreationIssue("CHLC-5678"),
+                "opentasks",
+                [secure_challenge],
+                [secure_challenge, deprecated_challenge],
+            ),
+        )
+
+    def test_find_challenge_data(self) -> None:
+        catalog = Catalog(self.catalog_file)
+        self.save_application(catalog)
+
+        scraper_data = catalog.find_challenge_data(CHALLENGE_ID)
+
+        self.assertEqual(scraper_data.challenge.chlc.get_issue_id(), "CHLC-1234")
+        self.assertEqual(scraper_data.challenge.application_endpoint, APPLICATION_URL)
+        self.assertEqual(scraper_data.challenge.secure_branch, "secure")
+        self.assertEqual(scraper_data.application.chlc.get_issue_id(), "CHLC-5678")
+        self.assertEqual(scraper_data.application.repository_name, "opentasks")
+        self.assertIsNone(catalog.find_challenge_data(DEPRECATED_CHALLENGE_ID))
+        catalog.close()
+
+    def test_find_application_data(self) -> None:
+        catalog = Catalog(self.catalog_file)
+        self.save_application(catalog)
+
+        for name_or_url in [
+            "opentasks",
+            "OPENTASKS",
+            f"https://cms.securecodewarrior.com{APPLICATION_URL}",
+            APPLICATION_URL.replace("/show", ""),
+        ]:
+            application_data = catalog.find_application_data(name_or_url)
+            self.assertEqual(application_data.repository_name, "opentasks")
+            self.assertEqual(list(application_data.challenge_map), ["sqli_login"])
+            self.assertEqual(
+                application_data.challenge_map["sqli_login"].vulnerable_branches,
+                ["sqli_login", "sqli_login_incorrect_0"],
+            )
+
+        self.assertIsNone(catalog.find_application_data("bankingapp"))
+        catalog.close()
+
+    def test_stale_entries_are_not_used(self) -> None:
+        self.save_application(Catalog(self.catalog_file))
+
+        catalog = Catalog(self.catalog_file, ttl=0)
+
+        self.assertIsNone(catalog.find_challenge_data(CHALLENGE_ID))
+        self.assertIsNone(catalog.find_application_data("opentasks"))
+        catalog.close()
+
+    def test_reuse_unchanged_challenges(self) -> None:
+        catalog = Catalog(self.catalog_file)
+        self.save_application(catalog)
+        unchanged_challenge = Challenge(
+            "sqli_login", f"/challenges/{CHALLENGE_ID}/show", status="Done"
+        )
+        restored_challenge = Challenge(
+            "xss_search", f"/challenges/{DEPRECATED_CHALLENGE_ID}/show", status="Done"
+        )
+        new_challenge = Challenge(
+            "path_traversal", "/challenges/5dfb305304d5c305ad11fe65/show", status="Done"
+        )
+
+        changed_challenges = catalog.reuse_unchanged_challenges(
+            ApplicationListing("OpenTasks", APPLICATION_URL),
+            ApplicationScreenData(
+                ApplicationCreationIssue("CHLC-5678"),
+                "opentasks",
+                [unchanged_challenge, restored_challenge, new_challenge],
+            ),
+        )
+
+        self.assertEqual(changed_challenges, [restored_challenge, new_challenge])
+        self.assertEqual(unchanged_challenge.secure_branch, "secure")
+        self.assertEqual(unchanged_challenge.chlc.get_issue_id(), "CHLC-1234")
+        catalog.close()
+
+    def test_changed_status_is_scraped_again(self) -> None:
+        catalog = Catalog(self.catalog_file)
+        self.save_application(catalog)
+        challenge = Challenge(
+            "sqli_login", f"/challenges/{CHALLENGE_ID}/show", status="In Review"
+        )
+
+        changed_challenges = catalog.reuse_unchanged_challenges(
+            ApplicationListing("OpenTasks", APPLICATION_URL),
+            ApplicationScreenData(
+                ApplicationCreationIssue("CHLC-5678"), "opentasks", [challenge]
+            ),
+        )
+
+        self.assertEqual(changed_challenges, [challenge])
+        self.assertEqual(challenge.secure_branch, "")
+        catalog.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
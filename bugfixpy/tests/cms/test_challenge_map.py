@@ -0,0 +1,194 @@
+import pickle
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
+from bugfixpy.exceptions import RequestFailedError
+from bugfixpy.cms import CmsScraper, ApplicationScreenData, ChallengeScreenData
+from bugfixpy.cms.scraper_data import Challenge
+
+CHALLENGE_NAMES = [f"challenge_{i}" for i in range(10)]
+
+
+def mock_scrape_challenge_screen_by_url(challenge_url: str) -> ChallengeScreenData:
+    # Finish the challenges out of order to prove results are merged by position
+    time.sleep(0.01 * (len(CHALLENGE_NAMES) - int(challenge_url.split("_")[-1])))
+
+    if challenge_url.endswith("_3") or challenge_url.endswith("_7"):
+        raise RequestFailedError(f"Scraping challenge '{challenge_url}' failed")
+
+    return ChallengeScreenData(
+        "/applications/show",
+        ChallengeCreationIssue("CHLC-1234"),
+        f"{challenge_url}_secure",
+        [f"{challenge_url}_vulnerable"],
+    )
+
+
+@patch.object(CmsScraper, "login_to_cms")
+class TestChallengeMap(unittest.TestCase):
+    """Test concurrent scraping of the challenge screens of an application"""
+
+    def get_application_data(self, names: list[str]) -> ApplicationScreenData:
+        return ApplicationScreenData(
+            ApplicationCreationIssue("CHLC-5678"),
+            "opentasks",
+            [Challenge(name, f"/challenges/{name}") for name in names],
+        )
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_challenge_map_is_in_application_order(self, _, __) -> None:
+        names = [name for name in CHALLENGE_NAMES if name[-1] not in "37"]
+        scraper = CmsScraper(max_workers=4)
+
+        data = scraper.parse_application_screen_with_challenge_branches_response(
+            self.get_application_data(names)
+        )
+
+        self.assertEqual(list(data.challenge_map.keys()), names)
+        for name in names:
+            challenge = data.challenge_map[name]
+            self.assertEqual(challenge.secure_branch, f"/challenges/{name}_secure")
+            self.assertEqual(
+                challenge.vulnerable_branches, [f"/challenges/{name}_vulnerable"]
+            )
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_failures_are_reported_together(self, mock_scrape, _) -> None:
+        scraper = CmsScraper(max_workers=4)
+
+        with self.assertRaises(RequestFailedError) as context:
+            scraper.parse_application_screen_with_challenge_branches_response(
+                self.get_application_data(CHALLENGE_NAMES)
+            )
+
+        message = str(context.exception)
+        self.assertIn("2 of 10", message)
+        self.assertIn("challenge_3", message)
+        self.assertIn("challenge_7", message)
+        self.assertEqual(mock_scrape.call_count, len(CHALLENGE_NAMES))
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_lazy_challenges_are_scraped_on_first_read(self, mock_scrape, _) -> None:
+        scraper = CmsScraper(max_workers=4)
+
+        data = scraper.create_lazy_challenge_map(
+            self.get_application_data(CHALLENGE_NAMES)
+        )
+
+        self.assertEqual(list(data.challenge_map.keys()), CHALLENGE_NAMES)
+        self.assertEqual(mock_scrape.call_count, 0)
+
+        challenge = data.challenge_map["challenge_1"]
+        self.assertEqual(challenge.secure_branch, "/challenges/challenge_1_secure")
+        self.assertEqual(
+            challenge.vulnerable_branches, ["/challenges/challenge_1_vulnerable"]
+        )
+        self.assertEqual(mock_scrape.call_count, 1)
+
+        with self.assertRaises(RequestFailedError):
+            data.challenge_map["challenge_3"].load()
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_lazy_challenges_are_loaded_when_pickled(self, mock_scrape, _) -> None:
+        names = [name for name in CHALLENGE_NAMES if name[-1] not in "37"]
+        scraper = CmsScraper(max_workers=4)
+
+        data = scraper.create_lazy_challenge_map(self.get_application_data(names))
+        data = pickle.loads(pickle.dumps(data))
+
+        self.assertEqual(mock_scrape.call_count, len(names))
+        for name in names:
+            self.assertTrue(data.challenge_map[name].is_loaded())
+            self.assertEqual(
+                data.challenge_map[name].secure_branch, f"/challenges/{name}_secure"
+            )
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_prefetched_challenges_can_be_pickled(self, mock_scrape, _) -> None:
+        names = [name for name in CHALLENGE_NAMES if name[-1] not in "37"]
+        scraper = CmsScraper(max_workers=4)
+
+        data = scraper.create_lazy_challenge_map(
+            self.get_application_data(names), prefetch=True
+        )
+        data = pickle.loads(pickle.dumps(data))
+
+        self.assertEqual(mock_scrape.call_count, len(names))
+        for name in names:
+            self.assertEqual(
+                data.challenge_map[name].secure_branch, f"/challenges/{name}_secure"
+            )
+
+    @patch.object(
+        CmsScraper,
+        "scrape_challenge_screen_by_url",
+        side_effect=mock_scrape_challenge_screen_by_url,
+    )
+    def test_failed_prefetches_are_reported_together(self, _, __) -> None:
+        scraper = CmsScraper(max_workers=4)
+        data = scraper.create_lazy_challenge_map(
+            self.get_application_data(CHALLENGE_NAMES), prefetch=True
+        )
+
+        with self.assertRaises(RequestFailedError) as context:
+            scraper.load_challenges(data.challenges)
+
+        self.assertIn("2 of 10", str(context.exception))
+
+    @patch.object(CmsScraper, "scrape_challenge_screen_by_url")
+    def test_challenge_read_before_its_prefetch_loads_directly(
+        self, mock_scrape, _
+    ) -> None:
+        first_scrape_started = threading.Event()
+        release_first_scrape = threading.Event()
+
+        def scrape(challenge_url: str) -> ChallengeScreenData:
+            if challenge_url.endswith("_0") and not first_scrape_started.is_set():
+                first_scrape_started.set()
+                release_first_scrape.wait(5)
+
+            return ChallengeScreenData(
+                "/applications/show", None, f"{challenge_url}_secure", []
+            )
+
+        mock_scrape.side_effect = scrape
+        scraper = CmsScraper(max_workers=1)
+        data = scraper.create_lazy_challenge_map(
+            self.get_application_data(CHALLENGE_NAMES[:3]), prefetch=True
+        )
+        first_scrape_started.wait(5)
+
+        # The only worker is busy, so the last challenge is read without waiting
+        challenge = data.challenge_map["challenge_2"]
+        self.assertEqual(challenge.secure_branch, "/challenges/challenge_2_secure")
+        release_first_scrape.set()
+
+        scraper.load_challenges(data.challenges)
+        self.assertEqual(mock_scrape.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+
+from bugfixpy.jira import ApplicationCreationIssue, ChallengeCreationIssue
+from bugfixpy.cms import (
+    ApplicationScreenData,
+    ChallengeScreenData,
+    ScrapeCache,
+    ScraperData,
+)
+
+CHALLENGE_KEY = "challenge:5dfb305304d5c305ad11fe63"
+PAGE_VALIDATORS = {
+    "https://cms.securecodewarrior.com/search?q=5dfb305304d5c305ad11fe63": {
+        "ETag": '"abc123"'
+    }
+}
+
+
+class TestScrapeCache(unittest.TestCase):
+    """Test the on-disk cache of scraped CMS data"""
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
+    def get_scraper_data(self) -> ScraperData:
+        return ScraperData(
+            ChallengeScreenData(
+                "/applications/show",
+                ChallengeCreationIssue("CHLC-1234"),
+                "secure",
+                ["vulnerable", "incorrect_1"],
+            ),
+            ApplicationScreenData(ApplicationCreationIssue("CHLC-5678"), "opentasks"),
+        )
+
+    def test_missing_entry(self) -> None:
+        cache = ScrapeCache(self.cache_dir.name)
+        self.assertIsNone(cache.get(CHALLENGE_KEY))
+
+    def test_put_and_get(self) -> None:
+        cache = ScrapeCache(self.cache_dir.name)
+        cache.put(CHALLENGE_KEY, self.get_scraper_data(), PAGE_VALIDATORS)
+
+        entry = cache.get(CHALLENGE_KEY)
+
+        self.assertIsNotNone(entry)
+        self.assertTrue(cache.is_fresh(entry))
+        self.assertEqual(entry.page_validators, PAGE_VALIDATORS)
+        self.assertEqual(entry.data.challenge.chlc.get_issue_id(), "CHLC-1234")
+        self.assertEqual(entry.data.challenge.vulnerable_branches[1], "incorrect_1")
+        self.assertEqual(entry.data.application.repository_name, "opentasks")
+
+    def test_expired_entry_is_kept_for_revalidation(self) -> None:
+        cache = ScrapeCache(self.cache_dir.name, ttl=0)
+        cache.put(CHALLENGE_KEY, self.get_scraper_data(), PAGE_VALIDATORS)
+
+        entry = cache.get(CHALLENGE_KEY)
+
+        self.assertIsNotNone(entry)
+        self.assertFalse(cache.is_fresh(entry))
+
+        ScrapeCache(self.cache_dir.name).touch(CHALLENGE_KEY, entry)
+        self.assertTrue(ScrapeCache(self.cache_dir.name).is_fresh(entry))
+
+
+if __name__ == "__main__":
+    unittest.main()
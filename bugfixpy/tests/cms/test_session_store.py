@@ -0,0 +1,64 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from requests.cookies import RequestsCookieJar
+
+from bugfixpy.cms import session_store
+
+EMAIL = "tester@securecodewarrior.com"
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test persisting the authenticated CMS session between runs"""
+
+    def setUp(self) -> None:
+        self.session_dir = tempfile.TemporaryDirectory()
+        session_file = os.path.join(self.session_dir.name, "session", "cms_session")
+        self.patcher = patch("bugfixpy.cms.constants.SESSION_FILE", session_file)
+        self.patcher.start()
+        self.session_file = session_file
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+        self.session_dir.cleanup()
+
+    def get_cookies(self) -> RequestsCookieJar:
+        cookies = RequestsCookieJar()
+        cookies.set("PHPSESSID", "session-id", domain="cms.securecodewarrior.com")
+        return cookies
+
+    def test_no_stored_session(self) -> None:
+        self.assertIsNone(session_store.load_cookies(EMAIL))
+
+    def test_save_and_load_cookies(self) -> None:
+        session_store.save_cookies(EMAIL, self.get_cookies())
+
+        cookies = session_store.load_cookies(EMAIL)
+
+        self.assertIsNotNone(cookies)
+        self.assertEqual(cookies.get("PHPSESSID"), "session-id")
+
+    def test_session_file_is_private(self) -> None:
+        session_store.save_cookies(EMAIL, self.get_cookies())
+
+        mode = stat.S_IMODE(os.stat(self.session_file).st_mode)
+
+        self.assertEqual(mode, 0o600)
+
+    def test_session_of_other_account_is_ignored(self) -> None:
+        session_store.save_cookies(EMAIL, self.get_cookies())
+
+        self.assertIsNone(session_store.load_cookies("other@securecodewarrior.com"))
+
+    def test_delete_cookies(self) -> None:
+        session_store.save_cookies(EMAIL, self.get_cookies())
+        session_store.delete_cookies()
+
+        self.assertIsNone(session_store.load_cookies(EMAIL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import unittest
+
+from requests import Response
+
+from bugfixpy.cms import soup_parser
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "pages")
+
+
+def load_page(filename: str) -> Response:
+    response = Response()
+    with open(os.path.join(PAGES_DIR, filename), "rb") as page:
+        response._content = page.read()  # pylint: disable=protected-access
+    return response
+
+
+class TestSoupParser(unittest.TestCase):
+    """Test parsing recorded CMS pages"""
+
+    def test_parse_csrf_token(self) -> None:
+        csrf_token = soup_parser.parse_csrf_token(load_page("login.html"))
+        self.assertEqual(csrf_token, "Jx7p0cZl9oGq3uV1m2n4b6v8c0x2z4a6s8d0f2g4h6j")
+
+    def test_did_login_fail(self) -> None:
+        self.assertFalse(soup_parser.did_login_fail(load_page("login.html")))
+        self.assertTrue(soup_parser.did_login_fail(load_page("login_failed.html")))
+
+    def test_parse_challenge_screen_data(self) -> None:
+        data = soup_parser.parse_challenge_screen_data(
+            load_page("challenge_screen.html")
+        )
+
+        self.assertEqual(
+            data.application_endpoint,
+            "/applications/4b0e6f1c-8a55-4c1a-9a5e-2f3c7d9e1a20/show",
+        )
+        self.assertEqual(data.chlc.get_issue_id(), "CHLC-1234")
+        self.assertEqual(data.secure_branch, "secure")
+        self.assertEqual(
+            data.vulnerable_branches,
+            [
+                "sqli_login",
+                "sqli_login_incorrect_0",
+                "sqli_login_incorrect_1",
+                "sqli_login_incorrect_2",
+            ],
+        )
+
+    def test_parse_challenge_screen_data_outside_branch_containers(self) -> None:
+        page = load_page("challenge_screen.html")
+        page._content = page.content.replace(  # pylint: disable=protected-access
+            b'<span class="badge badge-light">', b'<code class="branch">'
+        ).replace(b"</span></td>", b"</code></td>")
+
+        data = soup_parser.parse_challenge_screen_data(page)
+
+        self.assertEqual(data.secure_branch, "secure")
+        self.assertEqual(data.vulnerable_branches[0], "sqli_login")
+
+    def test_parse_application_screen_data(self) -> None:
+        data = soup_parser.parse_application_screen_data(
+            load_page("application_screen.html")
+        )
+
+        self.assertEqual(data.chlc.get_issue_id(), "CHLC-5678")
+        self.assertEqual(data.repository_name, "opentasks")
+        self.assertEqual(len(data.challenges), 24)
+        self.assertEqual(data.challenges[0].name, "challenge_00")
+        self.assertEqual(
+            data.challenges[0].url, "/challenges/a4c123b1612dd272d1371c17/show"
+        )
+        self.assertNotIn("challenge_04", [c.name for c in data.challenges])
+
+    def test_parse_application_screen_challenge_statuses(self) -> None:
+        data = soup_parser.parse_application_screen_data(
+            load_page("application_screen.html")
+        )
+
+        self.assertEqual(len(data.listed_challenges), 40)
+        self.assertEqual(data.listed_challenges[3].status, "In Review")
+        self.assertEqual(data.listed_challenges[4].status, "Deprecated")
+        self.assertIs(data.challenges[0], data.listed_challenges[0])
+
+    def test_parse_application_list_page(self) -> None:
+        list_page = soup_parser.parse_application_list_page(
+            load_page("application_list.html")
+        )
+
+        self.assertEqual(
+            [application.name for application in list_page.applications],
+            ["opentasks", "bankingapp", "petclinic"],
+        )
+        self.assertEqual(
+            list_page.applications[0].url,
+            "/applications/4b0e6f1c-8a55-4c1a-9a5e-2f3c7d9e1a20/show",
+        )
+        self.assertEqual(list_page.next_page_url, "/applications?page=2")
+
+
+if __name__ == "__main__":
+    unittest.main()
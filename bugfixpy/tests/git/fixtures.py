@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from git.repo import Repo
+
+REPOSITORY_NAME = "opentasks"
+
+
+class RemoteRepositoryTestCase(unittest.TestCase):
+    """
+    Base for tests that clone from a local bare remote instead of GitHub. setUp
+    creates the remote and a source repository with it as origin, subclasses
+    commit to the source and push it before cloning.
+    """
+
+    # Partial clones are not supported for local paths, only file:// URLs
+    USE_FILE_URL = False
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        remote_dir = os.path.join(self.temp_dir.name, "remote")
+        self.repo_dir = os.path.join(self.temp_dir.name, "repos")
+        self.remote_url = os.path.join(remote_dir, f"{REPOSITORY_NAME}.git")
+        self.patchers = []
+        self.start_patcher(
+            patch(
+                "bugfixpy.git.constants.SCW_GIT_URL",
+                f"file://{remote_dir}" if self.USE_FILE_URL else remote_dir,
+            )
+        )
+        self.start_patcher(patch("bugfixpy.git.constants.REPO_DIR", self.repo_dir))
+        self.start_patcher(
+            patch(
+                "bugfixpy.git.constants.MIRROR_DIR",
+                os.path.join(self.repo_dir, ".mirrors"),
+            )
+        )
+        self.start_patcher(
+            patch(
+                "bugfixpy.git.constants.WORKTREE_DIR",
+                os.path.join(self.repo_dir, ".worktrees"),
+            )
+        )
+
+        self.remote = Repo.init(self.remote_url, bare=True)
+        self.source = Repo.init(os.path.join(self.temp_dir.name, "source"))
+        self.configure_user(self.source)
+        self.source.create_remote("origin", self.remote_url)
+
+    def tearDown(self) -> None:
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        self.temp_dir.cleanup()
+
+    def start_patcher(self, patcher) -> None:
+        patcher.start()
+        self.patchers.append(patcher)
+
+    def configure_user(self, repository: Repo) -> None:
+        repository.git.config("user.email", "tester@securecodewarrior.com")
+        repository.git.config("user.name", "Tester")
+
+    def write_file(self, repository: Repo, path: str, contents: str) -> None:
+        file_path = os.path.join(repository.working_tree_dir, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(contents)
+
+    def push_source(self) -> None:
+        self.source.git.push("origin", "--all")
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.git import Repository, RevertCommit
+from bugfixpy.git.bulk_revert import BulkRevert
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+CLEAN_BRANCHES = ["sqli_login", "xss_search"]
+
+
+class TestBulkRevert(RemoteRepositoryTestCase):
+    """Test reverting a commit across branches without checking them out"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        source = self.source
+        self.write_file(source, "login.py", "query = 'SELECT *'\n")
+        self.write_file(source, "search.py", "term = request.args\n")
+        source.git.add(A=True)
+        source.git.commit("-m", "Initial commit")
+        source.git.branch("-M", "secure")
+        source.git.branch("unrelated")
+        self.write_file(source, "login.py", "query = 'SELECT ?'\n")
+        source.git.commit("-am", "Fix login")
+        self.fix_commit = source.head.commit.hexsha
+        source.git.branch("sqli_login")
+        source.git.checkout("-b", "xss_search")
+        self.write_file(source, "search.py", "term = escape(request.args)\n")
+        source.git.commit("-am", "Diverge search")
+        source.git.checkout("-b", "conflict", "secure")
+        self.write_file(source, "login.py", "query = 'SELECT id'\n")
+        source.git.commit("-am", "Diverge login")
+        self.push_source()
+
+        self.repository = Repository(REPOSITORY_NAME)
+        self.configure_user(self.repository.repository)
+        self.repository.checkout_to_branch("secure")
+
+    def test_branches_containing_commit(self) -> None:
+        self.assertCountEqual(
+            self.repository.get_branches_containing(self.fix_commit),
+            ["secure", "conflict"] + CLEAN_BRANCHES,
+        )
+
+    def test_clean_branches_are_reverted_in_memory(self) -> None:
+        git = self.repository.repository.git
+        secure_commit = git.rev_parse("secure")
+
+        outcomes = {
+            outcome.branch: outcome
+            for outcome in BulkRevert(self.repository, self.fix_commit).run()
+        }
+
+        self.assertCountEqual(outcomes, ["secure", "conflict"] + CLEAN_BRANCHES)
+        for branch in CLEAN_BRANCHES:
+            self.assertFalse(outcomes[branch].needs_checkout())
+            self.assertEqual(git.rev_parse(branch), outcomes[branch].new_commit)
+            self.assertEqual(git.show(f"{branch}:login.py"), "query = 'SELECT *'")
+            self.assertEqual(
+                self.repository.repository.commit(branch).message,
+                f'Revert "Fix login"\n\nThis reverts commit {self.fix_commit}.\n',
+            )
+        self.assertEqual(
+            git.show("xss_search:search.py"), "term = escape(request.args)"
+        )
+        self.assertEqual(outcomes["conflict"].conflicted_files, ["login.py"])
+        self.assertTrue(outcomes["conflict"].needs_checkout())
+        # The checked out branch is left to a checkout
+        self.assertTrue(outcomes["secure"].needs_checkout())
+        self.assertEqual(git.rev_parse("secure"), secure_commit)
+
+    def test_failed_ref_update_queues_every_branch(self) -> None:
+        git = self.repository.repository.git
+        sqli_login_commit = git.rev_parse("refs/remotes/origin/sqli_login")
+
+        with patch.object(self.repository, "update_branches", return_value=False):
+            outcomes = BulkRevert(self.repository, self.fix_commit).run()
+
+        self.assertTrue(all(outcome.needs_checkout() for outcome in outcomes))
+        self.assertEqual(git.rev_parse("sqli_login"), sqli_login_commit)
+
+    @patch("bugfixpy.utils.prompt_user.to_resolve_merge_conflict")
+    def test_conflicting_branches_are_resolved_manually(
+        self, to_resolve_merge_conflict
+    ) -> None:
+        resolved_branches = []
+
+        def open_code_in_editor() -> None:
+            resolved_branches.append(self.repository.get_current_branch())
+            self.write_file(self.repository.repository, "login.py", "resolved\n")
+
+        with patch.object(self.repository, "open_code_in_editor", open_code_in_editor):
+            RevertCommit(self.repository, self.fix_commit).run()
+
+        git = self.repository.repository.git
+        self.assertEqual(resolved_branches, ["conflict"])
+        self.assertEqual(git.show("conflict:login.py"), "resolved")
+        self.assertEqual(git.show("secure:login.py"), "query = 'SELECT *'")
+        to_resolve_merge_conflict.assert_called_once()
+        self.assertCountEqual(
+            self.repository.get_advanced_branches(),
+            ["secure", "conflict"] + CLEAN_BRANCHES,
+        )
+        self.assertNotIn("unrelated", self.repository.get_advanced_branches())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.git import CherryPick, Repository, constants
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+
+class TestClone(RemoteRepositoryTestCase):
+    """Test the partial, sparse and narrow clone strategies"""
+
+    USE_FILE_URL = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.remote.git.config("uploadpack.allowFilter", "true")
+        for path in ["README.md", "src/login.py", "src/search.py"]:
+            self.write_file(self.source, path, f"{path}\n")
+        self.source.git.add(A=True)
+        self.source.git.commit("-m", "Initial commit")
+        self.source.git.branch("-M", "secure")
+        for branch in ["sqli_login", "xss_search", "unrelated"]:
+            self.source.git.branch(branch)
+        self.push_source()
+
+    def test_full_clone_reports_transfer(self) -> None:
+        repository = Repository(REPOSITORY_NAME)
+        report = repository.get_clone_report()
+
+        self.assertEqual(report.strategy, constants.CLONE_STRATEGY_FULL)
+        self.assertGreater(report.transferred_bytes, 0)
+        self.assertGreaterEqual(report.elapsed, 0)
+
+    def test_blobless_clone_is_partial(self) -> None:
+        repository = Repository(REPOSITORY_NAME, constants.CLONE_STRATEGY_BLOBLESS)
+
+        self.assertEqual(
+            repository.repository.git.config("remote.origin.partialclonefilter"),
+            constants.BLOBLESS_FILTER,
+        )
+        self.assertEqual(len(repository.get_branches()), 4)
+
+    def test_narrow_clone_only_fetches_challenge_branches(self) -> None:
+        repository = Repository(
+            REPOSITORY_NAME,
+            constants.CLONE_STRATEGY_NARROW,
+            ["secure", "sqli_login", "xss_search"],
+        )
+
+        self.assertEqual(
+            sorted(repository.get_branches()), ["secure", "sqli_login", "xss_search"]
+        )
+        self.assertEqual(
+            repository.get_clone_report().strategy, constants.CLONE_STRATEGY_NARROW
+        )
+
+    def test_narrow_clone_without_branches_clones_everything(self) -> None:
+        repository = Repository(REPOSITORY_NAME, constants.CLONE_STRATEGY_NARROW)
+
+        self.assertEqual(len(repository.get_branches()), 4)
+        self.assertEqual(
+            repository.get_clone_report().strategy, constants.CLONE_STRATEGY_FULL
+        )
+
+    def test_sparse_cherry_pick_only_checks_out_fixed_files(self) -> None:
+        repository = Repository(REPOSITORY_NAME, constants.CLONE_STRATEGY_SPARSE)
+        working_tree = repository.repository.working_tree_dir
+        repository.checkout_to_branch("secure")
+        self.write_file(repository.repository, "src/login.py", "fixed\n")
+        self.configure_user(repository.repository)
+        repository.add_changes()
+        repository.commit_changes_with_message("Fix login")
+        checked_out_files = []
+
+        def checkout_to_branch(branch: str) -> None:
+            repository.repository.git.checkout(branch)
+            checked_out_files.append(
+                os.path.exists(os.path.join(working_tree, "src/search.py"))
+            )
+
+        # Conflicting branches are the ones that still go through a checkout
+        with patch.object(
+            repository, "checkout_to_branch", checkout_to_branch
+        ), patch.object(repository, "cherry_pick_without_checkout", return_value=False):
+            CherryPick(repository, branches=["sqli_login"]).across_all_branches()
+
+        self.assertEqual(checked_out_files, [False])
+        self.assertTrue(os.path.exists(os.path.join(working_tree, "src/search.py")))
+        with open(os.path.join(working_tree, "src/login.py"), encoding="utf-8") as file:
+            self.assertEqual(file.read(), "fixed\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
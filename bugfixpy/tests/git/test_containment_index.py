@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from git.repo import Repo
+
+from bugfixpy.git import plumbing
+from bugfixpy.git.containment_index import ContainmentIndex
+
+
+class TestContainmentIndex(unittest.TestCase):
+    """Test looking up the branches that contain a commit"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = Repo.init(self.temp_dir.name)
+        self.repository.git.config("user.email", "tester@securecodewarrior.com")
+        self.repository.git.config("user.name", "Tester")
+        self.commit("login.py", "query = 'SELECT *'\n", "Initial commit")
+        self.initial_commit = self.repository.head.commit.hexsha
+        self.repository.git.branch("-M", "secure")
+        self.repository.git.branch("sqli_login")
+        self.commit("login.py", "query = 'SELECT ?'\n", "Fix login")
+        self.fix_commit = self.repository.head.commit.hexsha
+        self.repository.git.branch("xss_search")
+
+        self.index = ContainmentIndex(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def commit(self, path: str, contents: str, message: str) -> None:
+        with open(
+            os.path.join(self.temp_dir.name, path), "w", encoding="utf-8"
+        ) as file:
+            file.write(contents)
+        self.repository.git.add(A=True)
+        self.repository.git.commit("-m", message)
+
+    def get_commit_graph_path(self) -> str:
+        return os.path.join(
+            self.temp_dir.name, ".git", "objects", "info", "commit-graph"
+        )
+
+    def test_commit_graph_is_written_on_first_lookup(self) -> None:
+        self.assertFalse(os.path.exists(self.get_commit_graph_path()))
+
+        self.index.get_branches_containing(self.fix_commit)
+
+        self.assertTrue(os.path.exists(self.get_commit_graph_path()))
+
+    def test_branches_containing(self) -> None:
+        self.assertEqual(
+            self.index.get_branches_containing(self.fix_commit),
+            {"secure", "xss_search"},
+        )
+        self.assertEqual(
+            self.index.get_branches_containing(self.initial_commit[:7]),
+            {"secure", "sqli_login", "xss_search"},
+        )
+        self.assertEqual(self.index.get_branches_containing("unknown"), frozenset())
+
+    def test_lookups_are_memoized(self) -> None:
+        with patch.object(
+            plumbing, "get_refs_containing", wraps=plumbing.get_refs_containing
+        ) as get_refs_containing:
+            for _ in range(3):
+                self.index.get_branches_containing(self.fix_commit)
+
+        get_refs_containing.assert_called_once()
+
+    def test_moved_branch_is_updated_incrementally(self) -> None:
+        self.index.get_branches_containing(self.fix_commit)
+        self.repository.git.checkout("sqli_login")
+        self.repository.git.merge("--ff-only", "secure")
+        self.index.branch_moved("sqli_login")
+
+        with patch.object(
+            plumbing, "get_refs_containing", wraps=plumbing.get_refs_containing
+        ) as get_refs_containing:
+            branches = self.index.get_branches_containing(self.fix_commit)
+
+        get_refs_containing.assert_not_called()
+        self.assertEqual(branches, {"secure", "sqli_login", "xss_search"})
+
+    def test_rewound_branch_is_updated(self) -> None:
+        self.index.get_branches_containing(self.fix_commit)
+        self.repository.git.branch("-f", "xss_search", self.initial_commit)
+        self.index.branch_moved("xss_search")
+
+        self.assertEqual(
+            self.index.get_branches_containing(self.fix_commit), {"secure"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.git import CherryPick, FixBranches, Repository, constants
+from bugfixpy.jira import ChallengeRequestIssue
+from bugfixpy.git.fix_journal import FixJournal
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+BRANCHES = ["sqli_login", "xss_search", "csrf_form"]
+
+
+class TestFixJournal(RemoteRepositoryTestCase):
+    """Test recording fix sessions and resuming them"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file(self.source, "login.py", "query = 'SELECT *'\n")
+        self.source.git.add(A=True)
+        self.source.git.commit("-m", "Initial commit")
+        self.source.git.branch("-M", "secure")
+        for branch in BRANCHES:
+            self.source.git.branch(branch)
+        self.push_source()
+
+    def commit_fix(self, repository: Repository) -> str:
+        self.configure_user(repository.repository)
+        repository.checkout_to_branch("secure")
+        self.write_file(repository.repository, "login.py", "query = 'fixed'\n")
+        repository.add_changes()
+        repository.commit_changes_with_message("Fix login")
+        fix_commit = repository.get_last_commit_id()
+        repository.get_journal().record_fix("secure", fix_commit, "secure: Fix login")
+
+        return fix_commit
+
+    def test_journal_is_saved_and_loaded(self) -> None:
+        journal = FixJournal(REPOSITORY_NAME)
+        journal.record_fix("secure", "abc123", "secure: Fix login")
+        journal.start_cherry_pick("abc123", BRANCHES)
+        journal.set_branch_state("sqli_login", constants.BRANCH_PICKED)
+        journal.set_branch_state("xss_search", constants.BRANCH_CONFLICTED)
+
+        loaded_journal = FixJournal(REPOSITORY_NAME)
+
+        self.assertTrue(loaded_journal.load())
+        self.assertEqual(loaded_journal.get_fix_commit("secure"), "abc123")
+        self.assertEqual(loaded_journal.get_fix_messages(), ["secure: Fix login"])
+        self.assertTrue(loaded_journal.is_finished("sqli_login", "abc123"))
+        self.assertFalse(loaded_journal.is_finished("sqli_login", "def456"))
+        self.assertEqual(
+            loaded_journal.get_unfinished_cherry_picks(),
+            {"abc123": ["xss_search", "csrf_form"]},
+        )
+        self.assertEqual(
+            loaded_journal.get_finished_branches(), ["secure", "sqli_login"]
+        )
+
+        loaded_journal.reset_conflicted_branches()
+
+        self.assertEqual(
+            loaded_journal.get_branch_state("xss_search"), constants.BRANCH_PENDING
+        )
+
+    def test_missing_journal_is_not_loaded(self) -> None:
+        self.assertFalse(FixJournal(REPOSITORY_NAME).load())
+
+    def test_new_run_deletes_journal(self) -> None:
+        FixJournal(REPOSITORY_NAME).record_fix("secure", "abc123", "secure: Fix")
+
+        repository = Repository(REPOSITORY_NAME)
+
+        self.assertFalse(repository.was_resumed())
+        self.assertFalse(os.path.exists(repository.get_journal().get_path()))
+
+    def test_resume_without_journal_clones(self) -> None:
+        repository = Repository(REPOSITORY_NAME, resume=True)
+
+        self.assertFalse(repository.was_resumed())
+        self.assertEqual(repository.get_clone_report().strategy, "full")
+
+    def test_interrupted_cherry_pick_is_resumed(self) -> None:
+        repository = Repository(REPOSITORY_NAME)
+        fix_commit = self.commit_fix(repository)
+        cherry_pick_without_checkout = repository.cherry_pick_without_checkout
+
+        def interrupt_after_first_branch(commit_id, branch, simulation=None):
+            if branch != BRANCHES[0]:
+                raise KeyboardInterrupt()
+            return cherry_pick_without_checkout(commit_id, branch, simulation)
+
+        with patch.object(
+            repository,
+            "cherry_pick_without_checkout",
+            side_effect=interrupt_after_first_branch,
+        ), self.assertRaises(KeyboardInterrupt):
+            CherryPick(repository, branches=BRANCHES).across_all_branches()
+
+        resumed_repository = Repository(REPOSITORY_NAME, resume=True)
+
+        self.assertTrue(resumed_repository.was_resumed())
+        self.assertEqual(
+            resumed_repository.get_clone_report().strategy,
+            constants.CLONE_STRATEGY_RESUMED,
+        )
+        self.assertEqual(
+            resumed_repository.get_advanced_branches(), ["secure", BRANCHES[0]]
+        )
+        self.assertEqual(
+            resumed_repository.get_journal().get_unfinished_cherry_picks(),
+            {fix_commit: BRANCHES[1:]},
+        )
+
+        with patch.object(
+            resumed_repository,
+            "simulate_cherry_pick",
+            wraps=resumed_repository.simulate_cherry_pick,
+        ) as simulate_cherry_pick:
+            CherryPick(
+                resumed_repository, branches=BRANCHES, commit_id=fix_commit
+            ).across_all_branches()
+
+        self.assertCountEqual(
+            [call.args[1] for call in simulate_cherry_pick.call_args_list],
+            BRANCHES[1:],
+        )
+        git = resumed_repository.repository.git
+        for branch in BRANCHES:
+            self.assertEqual(git.show(f"{branch}:login.py"), "query = 'fixed'")
+        self.assertEqual(
+            resumed_repository.get_journal().get_unfinished_cherry_picks(), {}
+        )
+
+    def test_finished_session_skips_fix(self) -> None:
+        repository = Repository(REPOSITORY_NAME)
+        fix_commit = self.commit_fix(repository)
+        CherryPick(repository, branches=BRANCHES).across_all_branches()
+        repository.get_journal().finish_fix()
+
+        resumed_repository = Repository(REPOSITORY_NAME, resume=True)
+
+        self.assertTrue(resumed_repository.is_fix_finished())
+        self.assertEqual(
+            resumed_repository.get_advanced_branches(), ["secure", *BRANCHES]
+        )
+
+        with patch("bugfixpy.git.fix_branches.prompt_user") as prompt_user:
+            fix_result = FixBranches(
+                resumed_repository, ChallengeRequestIssue("1234")
+            ).get_results()
+
+        self.assertEqual(prompt_user.mock_calls, [])
+        self.assertEqual(fix_result.fix_messages, ["secure: Fix login"])
+        self.assertTrue(fix_result.repo_was_cherrypicked)
+        self.assertEqual(resumed_repository.get_last_commit_id(), fix_commit)
+
+    def test_unfinished_session_is_not_finished(self) -> None:
+        repository = Repository(REPOSITORY_NAME)
+        fix_commit = self.commit_fix(repository)
+        repository.get_journal().start_cherry_pick(fix_commit, BRANCHES)
+        repository.get_journal().finish_fix()
+
+        self.assertFalse(Repository(REPOSITORY_NAME, resume=True).is_fix_finished())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import unittest
+
+from bugfixpy.git import Repository, mirror_cache
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+
+class TestMirrorCache(RemoteRepositoryTestCase):
+    """Test cloning working copies from a local mirror of the remote"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.source.git.commit("--allow-empty", "-m", "Initial commit")
+        self.source.git.branch("-M", "master")
+        for branch in ["secure", "sqli_login"]:
+            self.source.git.branch(branch)
+        self.push_source()
+
+    def test_clone_creates_mirror(self) -> None:
+        repository = Repository(REPOSITORY_NAME)
+
+        self.assertEqual(sorted(repository.get_branches()), ["secure", "sqli_login"])
+        self.assertTrue(os.path.isdir(mirror_cache.get_mirror_dir(REPOSITORY_NAME)))
+        self.assertEqual(repository.repository.remote().url, self.remote_url)
+
+    def test_second_clone_fetches_changes_into_mirror(self) -> None:
+        Repository(REPOSITORY_NAME)
+        self.source.git.branch("xss_search")
+        self.source.git.push("origin", "xss_search", ":sqli_login")
+
+        repository = Repository(REPOSITORY_NAME)
+
+        self.assertEqual(sorted(repository.get_branches()), ["secure", "xss_search"])
+
+    def test_broken_mirror_is_cloned_again(self) -> None:
+        mirror_dir = mirror_cache.get_mirror_dir(REPOSITORY_NAME)
+        os.makedirs(mirror_dir)
+
+        repository = Repository(REPOSITORY_NAME)
+
+        self.assertEqual(sorted(repository.get_branches()), ["secure", "sqli_login"])
+
+
+if __name__ == "__main__":
+    unittest.main()
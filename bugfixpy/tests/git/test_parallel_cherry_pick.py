@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.git import CherryPick, Repository
+from bugfixpy.git.plumbing import CherryPickSimulation
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+CLEAN_BRANCHES = ["sqli_login", "xss_search", "csrf_form", "idor_profile"]
+
+
+class TestParallelCherryPick(RemoteRepositoryTestCase):
+    """Test cherry-picking a fix in parallel worktrees"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        source = self.source
+        self.write_file(source, "login.py", "query = 'SELECT *'\n")
+        source.git.add(A=True)
+        source.git.commit("-m", "Initial commit")
+        source.git.branch("-M", "secure")
+        for branch in CLEAN_BRANCHES:
+            source.git.branch(branch)
+        source.git.checkout("-b", "conflict")
+        self.write_file(source, "login.py", "query = 'SELECT id'\n")
+        source.git.commit("-am", "Diverge")
+        self.push_source()
+
+        self.repository = Repository(REPOSITORY_NAME)
+        self.configure_user(self.repository.repository)
+        self.repository.checkout_to_branch("secure")
+        self.write_file(self.repository.repository, "login.py", "query = 'fixed'\n")
+        self.repository.add_changes()
+        self.repository.commit_changes_with_message("Fix login")
+
+    @patch("bugfixpy.utils.prompt_user.to_resolve_merge_conflict")
+    def test_unsimulated_branches_are_picked_and_conflicts_are_queued(
+        self, to_resolve_merge_conflict
+    ) -> None:
+        fix_commit = self.repository.repository.head.commit
+        resolved_branches = []
+
+        def open_code_in_editor() -> None:
+            resolved_branches.append(self.repository.get_current_branch())
+            self.write_file(self.repository.repository, "login.py", "resolved\n")
+
+        with patch.object(
+            self.repository, "open_code_in_editor", open_code_in_editor
+        ), patch.object(
+            self.repository,
+            "simulate_cherry_pick",
+            side_effect=lambda _commit_id, branch: CherryPickSimulation(
+                branch, error="Only single parent commits are simulated"
+            ),
+        ), patch.object(
+            self.repository, "add_worktree", wraps=self.repository.add_worktree
+        ) as add_worktree:
+            CherryPick(
+                self.repository, branches=CLEAN_BRANCHES + ["conflict"], max_workers=2
+            ).across_all_branches()
+
+        git = self.repository.repository.git
+        for branch in CLEAN_BRANCHES:
+            self.assertEqual(git.log("-1", "--format=%B", branch), fix_commit.message)
+            self.assertEqual(git.show(f"{branch}:login.py"), "query = 'fixed'")
+        self.assertEqual(resolved_branches, ["conflict"])
+        self.assertEqual(git.show("conflict:login.py"), "resolved")
+        to_resolve_merge_conflict.assert_called_once()
+        self.assertEqual(add_worktree.call_count, 2)
+        self.assertEqual(git.worktree("list").count("\n"), 0)
+
+    def test_simulated_branches_do_not_start_worktrees(self) -> None:
+        with patch.object(self.repository, "add_worktree") as add_worktree:
+            CherryPick(
+                self.repository, branches=CLEAN_BRANCHES, max_workers=2
+            ).across_all_branches()
+
+        add_worktree.assert_not_called()
+        for branch in CLEAN_BRANCHES:
+            self.assertEqual(
+                self.repository.repository.git.show(f"{branch}:login.py"),
+                "query = 'fixed'",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
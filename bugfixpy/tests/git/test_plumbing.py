@@ -0,0 +1,133 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+from git.repo import Repo
+
+from bugfixpy.git import plumbing
+from bugfixpy.git.conflict_preflight import ConflictPreflight
+
+
+class TestPlumbing(unittest.TestCase):
+    """Test cherry-picking onto branches without checking them out"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = Repo.init(self.temp_dir.name)
+        self.repository.git.config("user.email", "verifier@securecodewarrior.com")
+        self.repository.git.config("user.name", "Verifier")
+        self.write_file("login.py", "query = 'SELECT *'\nreturn query\n")
+        self.write_file("search.py", "term = request.args\n")
+        self.repository.git.add(A=True)
+        self.repository.git.commit("-m", "Initial commit")
+        self.repository.git.branch("-M", "secure")
+        self.repository.git.branch("sqli_login")
+        self.repository.git.checkout("-b", "xss_search")
+        self.write_file("search.py", "term = escape(request.args)\n")
+        self.repository.git.commit("-am", "Diverge search")
+        self.repository.git.checkout("-b", "conflict", "secure")
+        self.write_file("login.py", "query = 'SELECT id'\nreturn query\n")
+        self.repository.git.commit("-am", "Diverge login")
+        self.repository.git.checkout("secure")
+        self.write_file("login.py", "query = 'SELECT ?'\nreturn query\n")
+        self.repository.git.commit(
+            "-am", "Fix login", author="Fixer <fixer@securecodewarrior.com>"
+        )
+        self.fix_commit = self.repository.head.commit
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write_file(self, path: str, contents: str) -> None:
+        with open(
+            os.path.join(self.temp_dir.name, path), "w", encoding="utf-8"
+        ) as file:
+            file.write(contents)
+
+    def cherry_pick(self, branch: str):
+        return plumbing.cherry_pick_onto_branch(
+            self.temp_dir.name, self.fix_commit.hexsha, branch
+        )
+
+    def assert_cherry_picks_clean_branches(self) -> None:
+        for branch in ["sqli_login", "xss_search"]:
+            parent = self.repository.commit(branch)
+
+            new_commit = self.repository.commit(self.cherry_pick(branch))
+
+            self.assertEqual(self.repository.commit(branch), new_commit)
+            self.assertEqual(new_commit.parents, (parent,))
+            self.assertEqual(new_commit.message, self.fix_commit.message)
+            self.assertEqual(new_commit.author.email, "fixer@securecodewarrior.com")
+            self.assertEqual(
+                self.repository.git.show(f"{branch}:login.py"),
+                "query = 'SELECT ?'\nreturn query",
+            )
+
+        self.assertEqual(
+            self.repository.git.show("xss_search:search.py"),
+            "term = escape(request.args)",
+        )
+        self.assertEqual(self.repository.active_branch.name, "secure")
+        self.assertFalse(self.repository.is_dirty())
+
+    def test_cherry_pick_with_temporary_index(self) -> None:
+        with patch.object(
+            plumbing, "supports_merge_tree_merge_base", return_value=False
+        ):
+            self.assert_cherry_picks_clean_branches()
+
+    @unittest.skipUnless(
+        plumbing.supports_merge_tree_merge_base(),
+        "git merge-tree --merge-base needs git 2.40",
+    )
+    def test_cherry_pick_with_merge_tree(self) -> None:
+        self.assert_cherry_picks_clean_branches()
+
+    def test_conflict_leaves_branch_untouched(self) -> None:
+        branch_commit = self.repository.commit("conflict")
+
+        self.assertIsNone(self.cherry_pick("conflict"))
+        self.assertEqual(self.repository.commit("conflict"), branch_commit)
+
+    def test_already_applied_fix_is_left_to_checkout(self) -> None:
+        self.assertIsNone(self.cherry_pick("secure"))
+
+    def test_simulation_reports_conflicted_files(self) -> None:
+        with patch.object(
+            plumbing, "supports_merge_tree_merge_base", return_value=False
+        ):
+            simulation = plumbing.simulate_cherry_pick(
+                self.temp_dir.name, self.fix_commit.hexsha, "conflict"
+            )
+
+        self.assertFalse(simulation.is_clean())
+        self.assertEqual(simulation.conflicted_files, ["login.py"])
+        self.assertFalse(self.repository.is_dirty())
+
+    def test_preflight_report_lists_conflicting_branches(self) -> None:
+        repository = MagicMock()
+        repository.simulate_cherry_pick.side_effect = (
+            lambda commit_id, branch: plumbing.simulate_cherry_pick(
+                self.temp_dir.name, commit_id, branch
+            )
+        )
+        preflight = ConflictPreflight(repository, self.fix_commit.hexsha)
+        output = io.StringIO()
+
+        simulations = preflight.run(["sqli_login", "conflict", "xss_search"])
+        with redirect_stdout(output):
+            preflight.display_report(simulations)
+
+        self.assertEqual(
+            [simulation.is_clean() for simulation in simulations], [True, False, True]
+        )
+        self.assertIn("1 of 3 branches will conflict", output.getvalue())
+        self.assertIn("conflict: login.py", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
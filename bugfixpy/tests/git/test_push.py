@@ -0,0 +1,106 @@
+import unittest
+
+from bugfixpy.git import Repository
+from bugfixpy.git.push import parse_porcelain_output
+
+from .fixtures import REPOSITORY_NAME, RemoteRepositoryTestCase
+
+BRANCHES = ["sqli_login", "xss_search", "csrf_form"]
+
+
+class TestPush(RemoteRepositoryTestCase):
+    """Test pushing only the branches a fix advanced"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file(self.source, "login.py", "query = 'SELECT *'\n")
+        self.source.git.add(A=True)
+        self.source.git.commit("-m", "Initial commit")
+        self.source.git.branch("-M", "secure")
+        for branch in BRANCHES:
+            self.source.git.branch(branch)
+        self.push_source()
+
+        self.repository = Repository(REPOSITORY_NAME)
+        self.configure_user(self.repository.repository)
+
+    def commit_fix(self, branch: str) -> None:
+        self.repository.checkout_to_branch(branch)
+        self.write_file(self.repository.repository, "login.py", "query = 'fixed'\n")
+        self.repository.add_changes()
+        self.repository.commit_changes_with_message("Fix login")
+
+    def get_remote_commit(self, branch: str) -> str:
+        return self.remote.commit(branch).hexsha
+
+    def test_nothing_to_push(self) -> None:
+        push_report = self.repository.push_advanced_branches()
+
+        self.assertTrue(push_report.succeeded())
+        self.assertEqual(push_report.results, [])
+
+    def test_push_only_advanced_branches(self) -> None:
+        untouched_commit = self.get_remote_commit("csrf_form")
+        advanced = ["sqli_login", "xss_search"]
+        for branch in advanced:
+            self.commit_fix(branch)
+            self.repository.mark_branch_advanced(branch)
+        # Local commits on a branch that was not marked are left alone
+        self.commit_fix("csrf_form")
+
+        push_report = self.repository.push_advanced_branches()
+
+        self.assertTrue(push_report.succeeded())
+        self.assertEqual([result.branch for result in push_report.results], advanced)
+        for branch in advanced:
+            self.assertEqual(
+                self.get_remote_commit(branch),
+                self.repository.repository.commit(branch).hexsha,
+            )
+        self.assertEqual(self.get_remote_commit("csrf_form"), untouched_commit)
+
+    def test_push_rejected_when_remote_moved(self) -> None:
+        for branch in ["sqli_login", "xss_search"]:
+            self.commit_fix(branch)
+            self.repository.mark_branch_advanced(branch)
+        untouched_commit = self.get_remote_commit("sqli_login")
+        self.source.git.checkout("xss_search")
+        self.write_file(self.source, "login.py", "query = 'SELECT id'\n")
+        self.source.git.commit("-am", "Someone else's change")
+        self.source.git.push("origin", "xss_search")
+        moved_commit = self.get_remote_commit("xss_search")
+
+        push_report = self.repository.push_advanced_branches()
+
+        self.assertFalse(push_report.succeeded())
+        self.assertIn(
+            "xss_search",
+            [result.branch for result in push_report.results if not result.succeeded()],
+        )
+        # The atomic push leaves every branch untouched
+        self.assertEqual(self.get_remote_commit("sqli_login"), untouched_commit)
+        self.assertEqual(self.get_remote_commit("xss_search"), moved_commit)
+
+    def test_parse_porcelain_output(self) -> None:
+        output = (
+            "To github.com:SecureCodeWarrior/opentasks.git\n"
+            " \trefs/heads/sqli_login:refs/heads/sqli_login\t1a2b3c4..5d6e7f8\n"
+            "=\trefs/heads/csrf_form:refs/heads/csrf_form\t[up to date]\n"
+            "!\trefs/heads/xss_search:refs/heads/xss_search\t[rejected] (stale info)\n"
+            "Done"
+        )
+
+        results = parse_porcelain_output(output)
+
+        self.assertEqual(
+            [(result.branch, result.flag) for result in results],
+            [("sqli_login", " "), ("csrf_form", "="), ("xss_search", "!")],
+        )
+        self.assertEqual(results[2].summary, "[rejected] (stale info)")
+        self.assertEqual(
+            [result.succeeded() for result in results], [True, True, False]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.jira import constants, credential_cache
+
+CREDENTIALS = {
+    "JIRA_API_EMAIL": "tester@securecodewarrior.com",
+    "JIRA_API_KEY": "api-key",
+}
+
+
+class TestCredentialCache(unittest.TestCase):
+    """Test remembering that Jira accepted the stored credentials"""
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.cache_dir.name, "jira", "credentials.json")
+        self.credentials = dict(CREDENTIALS)
+        self.patchers = [
+            patch(
+                "bugfixpy.jira.constants.CREDENTIAL_VALIDATION_CACHE_FILE",
+                self.cache_file,
+            ),
+            patch("bugfixpy.utils.credentials.get_password", self.credentials.get),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        credential_cache.clear()
+
+    def tearDown(self) -> None:
+        credential_cache.clear()
+        for patcher in self.patchers:
+            patcher.stop()
+        self.cache_dir.cleanup()
+
+    def test_validation_is_kept_between_runs(self) -> None:
+        credential_cache.record_valid()
+        credential_cache.clear()
+
+        self.assertTrue(credential_cache.is_validated())
+
+    def test_credentials_are_not_stored_in_plain_text(self) -> None:
+        credential_cache.record_valid()
+
+        with open(self.cache_file, encoding="utf-8") as cache_file:
+            contents = cache_file.read()
+
+        self.assertNotIn(CREDENTIALS["JIRA_API_EMAIL"], contents)
+        self.assertNotIn(CREDENTIALS["JIRA_API_KEY"], contents)
+
+    def test_validation_expires(self) -> None:
+        validated_at = time.time() - constants.CREDENTIAL_VALIDATION_TTL - 1
+
+        with patch("time.time", return_value=validated_at):
+            credential_cache.record_valid()
+        credential_cache.clear()
+
+        self.assertFalse(credential_cache.is_validated())
+
+    def test_changed_credentials_are_not_validated(self) -> None:
+        credential_cache.record_valid()
+        self.credentials["JIRA_API_KEY"] = "new-api-key"
+
+        self.assertFalse(credential_cache.is_validated())
+
+    def test_rejected_credentials_are_forgotten(self) -> None:
+        credential_cache.record_valid()
+        credential_cache.record_invalid()
+
+        self.assertFalse(credential_cache.is_validated())
+        self.assertFalse(os.path.exists(self.cache_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
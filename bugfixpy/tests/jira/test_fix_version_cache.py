@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from requests import Response
+
+from bugfixpy.jira import FixVersion, api, fix_version_cache
+
+MONTH = date(2024, 3, 14)
+
+
+def create_page(names: list[str], is_last: bool) -> Response:
+    response = MagicMock(spec=Response)
+    response.ok = True
+    response.json.return_value = {
+        "values": [{"id": 100 + i, "name": name} for i, name in enumerate(names)],
+        "isLast": is_last,
+    }
+    return response
+
+
+class TestFixVersionCache(unittest.TestCase):
+    """Test resolving and caching the fix version of a month"""
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        cache_file = os.path.join(self.cache_dir.name, "fix_versions.json")
+        self.patcher = patch(
+            "bugfixpy.jira.constants.FIX_VERSION_CACHE_FILE", cache_file
+        )
+        self.patcher.start()
+        fix_version_cache.clear()
+
+    def tearDown(self) -> None:
+        fix_version_cache.clear()
+        self.patcher.stop()
+        self.cache_dir.cleanup()
+
+    def test_fix_version_is_cached_in_process_and_on_disk(self) -> None:
+        resolve = MagicMock(return_value=FixVersion("10042", "2024 Mar"))
+
+        first = fix_version_cache.get_or_resolve(MONTH, resolve)
+        second = fix_version_cache.get_or_resolve(MONTH, resolve)
+        fix_version_cache.clear()
+        from_disk = fix_version_cache.get_or_resolve(MONTH, resolve)
+
+        self.assertEqual(first, FixVersion("10042", "2024 Mar"))
+        self.assertEqual(second, first)
+        self.assertEqual(from_disk, first)
+        resolve.assert_called_once_with(MONTH)
+
+    def test_missing_fix_version_is_not_cached(self) -> None:
+        resolve = MagicMock(return_value=FixVersion("", ""))
+
+        fix_version_cache.get_or_resolve(MONTH, resolve)
+        fix_version_cache.get_or_resolve(MONTH, resolve)
+
+        self.assertEqual(resolve.call_count, 2)
+
+    @patch("bugfixpy.jira.session.get_session")
+    def test_find_fix_version_stops_at_first_match(self, get_session) -> None:
+        get_session.return_value.get.side_effect = [
+            create_page(["2024 May", "2024 Apr"], is_last=False),
+            create_page(["2024 Mar", "2024 Feb"], is_last=False),
+            create_page(["2024 Jan"], is_last=True),
+        ]
+
+        fix_version = api.find_fix_version(MONTH)
+
+        self.assertEqual(fix_version, FixVersion("100", "2024 Mar"))
+        self.assertEqual(get_session.return_value.get.call_count, 2)
+        url = get_session.return_value.get.call_args_list[1].kwargs["url"]
+        self.assertIn("startAt=2", url)
+
+
+if __name__ == "__main__":
+    unittest.main()
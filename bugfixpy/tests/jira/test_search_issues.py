@@ -0,0 +1,65 @@
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from urllib import parse
+
+from requests import Response
+
+from bugfixpy.exceptions import RequestFailedError
+from bugfixpy.jira import ChallengeCreationIssue, api
+
+ISSUES = [ChallengeCreationIssue(f"CHLC-{i}") for i in range(1, 8)]
+
+
+def create_response(status_code: int, body: dict) -> Response:
+    content = json.dumps(body).encode("utf-8")
+    response = Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def search(url: str, **_) -> Response:
+    query = parse.parse_qs(parse.urlparse(url).query)
+    keys = query["jql"][0].removeprefix("key in (").removesuffix(")").split(",")
+    start_at = int(query["startAt"][0])
+    max_results = int(query["maxResults"][0])
+    page = keys[start_at : start_at + max_results]
+
+    return create_response(200, {"issues": [{"key": key} for key in page]})
+
+
+@patch("bugfixpy.jira.constants.SEARCH_BATCH_SIZE", 4)
+@patch("bugfixpy.jira.constants.SEARCH_PAGE_SIZE", 3)
+class TestSearchIssues(unittest.TestCase):
+    """Test resolving many issue keys with batched and paginated JQL searches"""
+
+    @patch("bugfixpy.jira.session.get_session")
+    def test_search_issues(self, get_session) -> None:
+        get_session.return_value = MagicMock(get=MagicMock(side_effect=search))
+
+        issues = list(api.search_issues(ISSUES + ISSUES[:2], "status"))
+
+        self.assertEqual(
+            [issue["key"] for issue in issues],
+            [issue.get_issue_id() for issue in ISSUES],
+        )
+        # 2 batches of keys, each split into 2 pages
+        self.assertEqual(get_session.return_value.get.call_count, 4)
+        url = get_session.return_value.get.call_args_list[0].kwargs["url"]
+        self.assertIn("fields=status", url)
+
+    @patch("bugfixpy.jira.session.get_session")
+    def test_failed_search_raises(self, get_session) -> None:
+        get_session.return_value = MagicMock(
+            get=MagicMock(return_value=create_response(400, {}))
+        )
+
+        with self.assertRaises(RequestFailedError):
+            list(api.search_issues(ISSUES, "status"))
+
+
+if __name__ == "__main__":
+    unittest.main()
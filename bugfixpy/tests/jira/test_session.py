@@ -0,0 +1,117 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from bugfixpy.exceptions import InvalidCredentialsError
+from bugfixpy.jira import credential_cache, session
+
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_by_path: dict[str, int] = {}
+
+    def do_GET(self) -> None:
+        self.respond()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.respond()
+
+    def respond(self) -> None:
+        count = self.requests_by_path.get(self.path, 0) + 1
+        self.requests_by_path[self.path] = count
+
+        if self.path == "/ok" or count > 2:
+            self.send_response(204)
+        elif self.path == "/unauthorized":
+            self.send_response(401)
+        elif self.path == "/captcha":
+            self.send_response(403)
+            self.send_header("X-Seraph-LoginReason", "AUTHENTICATION_DENIED")
+        elif self.path == "/busy":
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+        else:
+            self.send_response(500)
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_) -> None:
+        pass
+
+
+@patch("bugfixpy.jira.constants.RETRY_BACKOFF_FACTOR", 0)
+class TestSession(unittest.TestCase):
+    """Test the pooled and retrying session used for Jira requests"""
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        cache_file = os.path.join(self.cache_dir.name, "credentials.json")
+        self.patcher = patch(
+            "bugfixpy.jira.constants.CREDENTIAL_VALIDATION_CACHE_FILE", cache_file
+        )
+        self.patcher.start()
+        credential_cache.clear()
+        MockJiraHandler.requests_by_path = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MockJiraHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        session.close_session()
+
+    def tearDown(self) -> None:
+        session.close_session()
+        self.server.shutdown()
+        self.server.server_close()
+        credential_cache.clear()
+        self.patcher.stop()
+        self.cache_dir.cleanup()
+
+    def test_connections_are_reused(self) -> None:
+        for _ in range(5):
+            session.get_session().get(f"{self.url}/ok")
+
+        stats = session.get_pool_stats()
+
+        self.assertEqual(stats.requests_sent, 5)
+        self.assertEqual(stats.connections_opened, 1)
+        self.assertEqual(stats.connections_reused, 4)
+
+    def test_get_is_retried_on_server_error(self) -> None:
+        response = session.get_session().get(f"{self.url}/error")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(MockJiraHandler.requests_by_path["/error"], 3)
+
+    def test_post_is_only_retried_when_jira_is_busy(self) -> None:
+        error_response = session.get_session().post(f"{self.url}/error", json={})
+        busy_response = session.get_session().post(f"{self.url}/busy", json={})
+
+        self.assertEqual(error_response.status_code, 500)
+        self.assertEqual(MockJiraHandler.requests_by_path["/error"], 1)
+        self.assertEqual(busy_response.status_code, 204)
+        self.assertEqual(MockJiraHandler.requests_by_path["/busy"], 3)
+
+    def test_accepted_request_validates_credentials(self) -> None:
+        self.assertFalse(credential_cache.is_validated())
+
+        session.get_session().get(f"{self.url}/ok")
+
+        self.assertTrue(credential_cache.is_validated())
+
+    def test_rejected_credentials_raise(self) -> None:
+        session.get_session().get(f"{self.url}/ok")
+
+        for path in ["/unauthorized", "/captcha"]:
+            with self.assertRaises(InvalidCredentialsError):
+                session.get_session().get(f"{self.url}{path}")
+
+            self.assertEqual(MockJiraHandler.requests_by_path[path], 1)
+            self.assertFalse(credential_cache.is_validated())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from bugfixpy.jira import ChallengeCreationIssue, ChallengeRequestIssue
+from bugfixpy.jira.transition_executor import TransitionExecutor
+from bugfixpy.jira.transition_planner import PlannedStep, TransitionPlan
+
+CHALLENGE_REQUEST = ChallengeRequestIssue("CHLRQ-1234")
+CREATION_ISSUES = [ChallengeCreationIssue(f"CHLC-{i}") for i in range(100, 112)]
+
+
+def create_response(status_code: int, reason: str = "") -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.reason = reason
+    return response
+
+
+class TestTransitionExecutor(unittest.TestCase):
+    """Test transitioning CHLCs in parallel"""
+
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.calls: dict[str, list[str]] = {}
+        self.running = 0
+        self.max_running = 0
+
+    def record_call(self, step: str, issue: ChallengeCreationIssue) -> Response:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.calls.setdefault(issue.get_issue_id(), []).append(step)
+
+        time.sleep(0.01)
+
+        with self.lock:
+            self.running -= 1
+
+        if issue.get_issue_id() == "CHLC-105" and step == "review":
+            return create_response(400, "Bad Request")
+
+        return create_response(204)
+
+    def test_transition_all(self) -> None:
+        with patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_open",
+            side_effect=lambda issue: self.record_call("open", issue),
+        ), patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_review",
+            side_effect=lambda issue: self.record_call("review", issue),
+        ), patch(
+            "bugfixpy.jira.api.update_challenge_creation_assignee_and_link_challenge_request",
+            side_effect=lambda issue, *_: self.record_call("assign", issue),
+        ) as update_assignee:
+            results = TransitionExecutor(
+                CHALLENGE_REQUEST, "verifier_id", max_workers=4
+            ).transition_all(CREATION_ISSUES)
+
+        self.assertEqual([result.issue for result in results], CREATION_ISSUES)
+        for issue in CREATION_ISSUES:
+            self.assertEqual(
+                self.calls[issue.get_issue_id()], ["open", "review", "assign"]
+            )
+        self.assertGreater(self.max_running, 1)
+        self.assertLessEqual(self.max_running, 4)
+        update_assignee.assert_any_call(
+            CREATION_ISSUES[0], CHALLENGE_REQUEST, "verifier_id"
+        )
+
+        failed_results = [result for result in results if not result.succeeded()]
+        self.assertEqual(len(failed_results), 1)
+        self.assertEqual(failed_results[0].issue.get_issue_id(), "CHLC-105")
+        self.assertEqual(failed_results[0].steps[1].reason, "Bad Request")
+
+    def test_step_errors_are_recorded(self) -> None:
+        with patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_open",
+            side_effect=ConnectionError("connection reset"),
+        ), patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_review",
+            return_value=create_response(204),
+        ), patch(
+            "bugfixpy.jira.api.update_challenge_creation_assignee_and_link_challenge_request",
+            return_value=create_response(204),
+        ):
+            result = TransitionExecutor(CHALLENGE_REQUEST, "verifier_id").transition(
+                CREATION_ISSUES[0]
+            )
+
+        self.assertFalse(result.succeeded())
+        self.assertEqual(result.steps[0].reason, "connection reset")
+        self.assertTrue(result.steps[1].succeeded)
+
+    def test_only_planned_steps_are_run(self) -> None:
+        issue = CREATION_ISSUES[0]
+        plan = TransitionPlan(
+            issue, "Feedback Open", [PlannedStep("Feedback Review", "521")]
+        )
+
+        with patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_open"
+        ) as feedback_open, patch(
+            "bugfixpy.jira.api.transition_challenge_creation_to_feedback_review",
+            return_value=create_response(204),
+        ) as feedback_review, patch(
+            "bugfixpy.jira.api.update_challenge_creation_assignee_and_link_challenge_request"
+        ) as update_assignee:
+            result = TransitionExecutor(
+                CHALLENGE_REQUEST, "verifier_id", plans={issue.get_issue_id(): plan}
+            ).transition(issue)
+
+        feedback_open.assert_not_called()
+        feedback_review.assert_called_once_with(issue)
+        update_assignee.assert_not_called()
+        self.assertTrue(result.succeeded())
+        self.assertEqual([step.skipped for step in result.steps], [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,7 +27,7 @@ class TestTransitionIssues(TestCase):
     FIX_VERSION = FixVersion("version_id", "version_name")
     FIX_MESSAGE = "test fix"
     FIX_RESULT = FixResult([FIX_MESSAGE], False, False)
-    CHALLENGE_SCREEN_DATA = ChallengeScreenData("~", CHALLENGE_CREATION)
+    CHALLENGE_SCREEN_DATA = ChallengeScreenData("~", CHALLENGE_CREATION, "", [])
     APPLICATION_SCREEN_DATA = ApplicationScreenData(APPLICATION_CREATION, "mock-repo")
     CHALLENGE_DATA = ScraperData(CHALLENGE_SCREEN_DATA, APPLICATION_SCREEN_DATA)
 
@@ -53,8 +53,15 @@ class TestTransitionIssues(TestCase):
     )
     @patch("bugfixpy.utils.prompt_user.to_press_enter_to_transition_request_issue")
     @patch("bugfixpy.utils.prompt_user.to_press_enter_to_transition_creation_issues")
+    @patch(
+        "bugfixpy.utils.prompt_user.to_select_content_verifier",
+        return_value={"name": "Verifier", "id": "verifier_id"},
+    )
+    @patch("bugfixpy.jira.api.search_issues", return_value=[])
     def test_run(
         self,
+        _,
+        __,
         mock_prompt_transition_creation,
         mock_prompt_transition_request,
         get_fix_version,
@@ -87,7 +94,7 @@ class TestTransitionIssues(TestCase):
         transition_feedback_open.assert_called_with(self.CHALLENGE_CREATION)
         transition_feedback_review.assert_called_with(self.CHALLENGE_CREATION)
         update_assignee_and_link.assert_called_with(
-            self.CHALLENGE_CREATION, self.CHALLENGE_REQUEST
+            self.CHALLENGE_CREATION, self.CHALLENGE_REQUEST, "verifier_id"
         )
         get_fix_version.assert_called_once()
         mock_prompt_transition_request.assert_called_once()
@@ -0,0 +1,51 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from bugfixpy.jira import (
+    ApplicationCreationIssue,
+    ChallengeCreationIssue,
+    ChallengeRequestIssue,
+    TransitionIssueService,
+)
+
+
+class TestTransitionIssueService(TestCase):
+    """Test transitioning the CHLCs of an application"""
+
+    CHALLENGE_REQUEST = ChallengeRequestIssue("CHLRQ-1234")
+    APPLICATION_CREATION = ApplicationCreationIssue("CHLC-5678")
+    LINKED_CREATION_ISSUES = [ChallengeCreationIssue("CHLC-3456")]
+
+    @patch("bugfixpy.jira.TransitionIssueService.transition_chlcs")
+    @patch(
+        "bugfixpy.jira.api.get_challenge_creation_issues_linked_to_application",
+        return_value=LINKED_CREATION_ISSUES,
+    )
+    def test_linked_creation_issues_are_looked_up(
+        self, get_linked_issues, transition_chlcs
+    ) -> None:
+        TransitionIssueService().transition_all_chlcs(
+            self.APPLICATION_CREATION, self.CHALLENGE_REQUEST, "verifier"
+        )
+
+        get_linked_issues.assert_called_once_with(self.APPLICATION_CREATION)
+        transition_chlcs.assert_called_once_with(
+            self.LINKED_CREATION_ISSUES, self.CHALLENGE_REQUEST, "verifier"
+        )
+
+    @patch("bugfixpy.jira.TransitionIssueService.transition_chlcs")
+    @patch("bugfixpy.jira.api.get_challenge_creation_issues_linked_to_application")
+    def test_linked_creation_issues_looked_up_earlier_are_reused(
+        self, get_linked_issues, transition_chlcs
+    ) -> None:
+        TransitionIssueService().transition_all_chlcs(
+            self.APPLICATION_CREATION,
+            self.CHALLENGE_REQUEST,
+            "verifier",
+            linked_creation_issues=self.LINKED_CREATION_ISSUES,
+        )
+
+        get_linked_issues.assert_not_called()
+        transition_chlcs.assert_called_once_with(
+            self.LINKED_CREATION_ISSUES, self.CHALLENGE_REQUEST, "verifier"
+        )
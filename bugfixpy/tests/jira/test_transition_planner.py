@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import patch
+
+from bugfixpy.jira import ChallengeCreationIssue, ChallengeRequestIssue
+from bugfixpy.jira.transition_planner import TransitionPlanner
+
+CHALLENGE_REQUEST = ChallengeRequestIssue("CHLRQ-1234")
+NEW_CHALLENGE = ChallengeCreationIssue("CHLC-100")
+REVIEWED_CHALLENGE = ChallengeCreationIssue("CHLC-101")
+OPEN_CHALLENGE = ChallengeCreationIssue("CHLC-102")
+BLOCKED_CHALLENGE = ChallengeCreationIssue("CHLC-103")
+ASSIGNED_CHALLENGE = ChallengeCreationIssue("CHLC-104")
+VERIFIER_ID = "verifier_id"
+
+
+def create_issue(key, status, transition_ids, assignee_id=None, comments=()) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "status": {"name": status},
+            "assignee": {"accountId": assignee_id} if assignee_id else None,
+            "comment": {"comments": [{"body": comment} for comment in comments]},
+        },
+        "transitions": [{"id": str(transition_id)} for transition_id in transition_ids],
+    }
+
+
+ISSUES = [
+    create_issue("CHLRQ-1234", "Planned", [291]),
+    create_issue("CHLC-100", "Done", [511]),
+    create_issue("CHLC-101", "Feedback Review", [], VERIFIER_ID, ["CHLRQ-1234"]),
+    create_issue("CHLC-102", "feedback open", [521], "someone_else"),
+    create_issue("CHLC-103", "Done", [611]),
+    create_issue("CHLC-104", "Feedback Review", [], VERIFIER_ID, ["CHLRQ-1000"]),
+]
+
+
+@patch("bugfixpy.jira.api.search_issues", return_value=ISSUES)
+class TestTransitionPlanner(unittest.TestCase):
+    """Test planning only the transitions an issue still needs"""
+
+    def create_planner(self) -> TransitionPlanner:
+        planner = TransitionPlanner()
+        planner.fetch_issue_states(
+            [
+                CHALLENGE_REQUEST,
+                NEW_CHALLENGE,
+                REVIEWED_CHALLENGE,
+                OPEN_CHALLENGE,
+                BLOCKED_CHALLENGE,
+                ASSIGNED_CHALLENGE,
+            ]
+        )
+        return planner
+
+    def test_states_are_fetched_in_one_query(self, search_issues) -> None:
+        self.create_planner()
+
+        search_issues.assert_called_once()
+
+    def test_plan_challenge_request(self, _) -> None:
+        plan = self.create_planner().plan_challenge_request(CHALLENGE_REQUEST)
+
+        self.assertEqual(plan.status, "Planned")
+        self.assertEqual(plan.get_step_names(), ["In Progress", "Closed"])
+
+    def test_plan_creation_issues(self, _) -> None:
+        planner = self.create_planner()
+
+        self.assertEqual(
+            planner.plan_creation_issue(
+                NEW_CHALLENGE, CHALLENGE_REQUEST, VERIFIER_ID
+            ).get_step_names(),
+            ["Feedback Open", "Feedback Review", "Assignee and comment"],
+        )
+        self.assertEqual(
+            planner.plan_creation_issue(
+                REVIEWED_CHALLENGE, CHALLENGE_REQUEST, VERIFIER_ID
+            ).get_step_names(),
+            [],
+        )
+        self.assertEqual(
+            planner.plan_creation_issue(
+                OPEN_CHALLENGE, CHALLENGE_REQUEST, VERIFIER_ID
+            ).get_step_names(),
+            ["Feedback Review", "Assignee and comment"],
+        )
+
+    def test_new_chlrq_is_commented_on_chlc_assigned_to_verifier(self, _) -> None:
+        plan = self.create_planner().plan_creation_issue(
+            ASSIGNED_CHALLENGE, CHALLENGE_REQUEST, VERIFIER_ID
+        )
+
+        self.assertEqual(plan.get_step_names(), ["Assignee and comment"])
+
+    def test_unavailable_transition_blocks_plan(self, _) -> None:
+        plan = self.create_planner().plan_creation_issue(
+            BLOCKED_CHALLENGE, CHALLENGE_REQUEST, VERIFIER_ID
+        )
+
+        self.assertIn("Feedback Open", plan.blocked_reason)
+        self.assertEqual(plan.get_step_names(), ["Assignee and comment"])
+
+    def test_unknown_issue_gets_full_plan(self, _) -> None:
+        plan = self.create_planner().plan_challenge_request(
+            ChallengeRequestIssue("CHLRQ-9999")
+        )
+
+        self.assertEqual(plan.get_step_names(), ["Planned", "In Progress", "Closed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import unittest
+
+MAIN = os.path.join(os.path.dirname(__file__), "../../../__main__.py")
+
+HEAVY_MODULES = ["bs4", "git", "keyring", "bugfixpy.jira", "bugfixpy.cms"]
+
+
+def get_imported_modules(*args: str) -> list[str]:
+    probe = (
+        "import runpy, sys\n"
+        f"sys.argv = {[MAIN, *args]!r}\n"
+        "try:\n"
+        "    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+
+    return result.stdout.splitlines()[-1].split() if result.stdout.strip() else []
+
+
+class TestStartup(unittest.TestCase):
+    """Test that the CLI only loads heavy dependencies once a mode needs them"""
+
+    def test_help_does_not_import_heavy_modules(self) -> None:
+        self.assertEqual(get_imported_modules("--help"), [])
+
+    def test_invalid_flags_do_not_import_heavy_modules(self) -> None:
+        self.assertEqual(get_imported_modules("--view", "--auto"), [])
+
+    def test_credentials_are_resolved_on_first_use(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from bugfixpy.jira import constants
+
+        self.assertIn("API_EMAIL", constants.CREDENTIALS)
+        self.assertNotIn("API_EMAIL", vars(constants))
+        with self.assertRaises(AttributeError):
+            getattr(constants, "MISSING_CONSTANT")
+
+
+if __name__ == "__main__":
+    unittest.main()
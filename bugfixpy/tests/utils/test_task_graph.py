@@ -0,0 +1,108 @@
+import io
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError
+from contextlib import redirect_stdout
+
+from bugfixpy.utils.task_graph import TaskGraph
+
+
+class TestTaskGraph(unittest.TestCase):
+    """Test overlapping the steps of a mode"""
+
+    def setUp(self) -> None:
+        self.task_graph = TaskGraph()
+
+    def tearDown(self) -> None:
+        self.task_graph.shutdown()
+
+    def test_background_step_overlaps_foreground_step(self) -> None:
+        self.task_graph.add("clone", lambda: time.sleep(0.2) or "repository")
+
+        self.task_graph.run("prompt", lambda: time.sleep(0.2))
+        start = time.perf_counter()
+        result = self.task_graph.result("clone")
+
+        self.assertEqual(result, "repository")
+        self.assertLess(time.perf_counter() - start, 0.15)
+        self.assertGreater(self.task_graph.get_time_saved(), 0.1)
+
+    def test_step_waits_for_its_dependencies(self) -> None:
+        order = []
+        clone_done = threading.Event()
+
+        def clone() -> None:
+            clone_done.wait(1)
+            order.append("clone")
+
+        self.task_graph.add("clone", clone)
+        self.task_graph.add("scope checkout", lambda: order.append("scope"), ("clone",))
+        clone_done.set()
+
+        self.task_graph.run("fix", lambda: order.append("fix"), ("scope checkout",))
+
+        self.assertEqual(order, ["clone", "scope", "fix"])
+
+    def test_exception_is_raised_when_result_is_needed(self) -> None:
+        def fail() -> None:
+            raise ValueError("Error getting repository")
+
+        self.task_graph.add("clone", fail)
+
+        with self.assertRaises(ValueError):
+            self.task_graph.result("clone")
+
+    def test_shutdown_cancels_steps_that_have_not_started(self) -> None:
+        clone_done = threading.Event()
+        self.task_graph.add("clone", lambda: clone_done.wait(1))
+        self.task_graph.add("scope checkout", lambda: "scoped", ("clone",))
+
+        self.task_graph.shutdown()
+        clone_done.set()
+
+        with self.assertRaises(CancelledError):
+            self.task_graph.result("scope checkout")
+
+    def test_interrupt_does_not_wait_for_running_step(self) -> None:
+        probe = (
+            "import time\n"
+            "from bugfixpy.utils.task_graph import TaskGraph\n"
+            "task_graph = TaskGraph()\n"
+            "task_graph.add('clone', lambda: time.sleep(30))\n"
+            "try:\n"
+            "    raise KeyboardInterrupt\n"
+            "finally:\n"
+            "    task_graph.shutdown()\n"
+        )
+        start = time.perf_counter()
+
+        subprocess.run([sys.executable, "-c", probe], capture_output=True, check=False)
+
+        self.assertLess(time.perf_counter() - start, 10)
+
+    def test_unneeded_background_step_does_not_count_as_saved(self) -> None:
+        self.task_graph.add("linked CHLCs", lambda: time.sleep(0.2))
+        self.task_graph.run("fix", lambda: time.sleep(0.2))
+
+        self.assertLess(self.task_graph.get_time_saved(), 0.05)
+
+    def test_display_timeline(self) -> None:
+        self.task_graph.add("clone", lambda: "repository")
+        self.task_graph.run("prompt", lambda: None)
+        self.task_graph.result("clone")
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            self.task_graph.display_timeline()
+
+        self.assertIn("clone", output.getvalue())
+        self.assertIn("background, waited", output.getvalue())
+        self.assertIn("prompt", output.getvalue())
+        self.assertIn("Overlapping steps saved", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 from unittest import TestCase
+from unittest.mock import patch
+
 from ...jira.issue import (
     ApplicationCreationIssue,
     ChallengeCreationIssue,
@@ -100,3 +102,20 @@ class TestValidate(TestCase):
     def test_has_valid_credentials(self) -> None:
         # Figure out how to test the case of not having valid credentials
         self.assertTrue(has_valid_credentials())
+
+    @patch("bugfixpy.utils.validate.credentials_are_loaded", return_value=True)
+    @patch("bugfixpy.jira.credential_cache.is_validated", return_value=False)
+    @patch("bugfixpy.jira.api.get_response_code_from_query_to_verify_credentials")
+    def test_unvalidated_credentials_are_left_to_the_first_request(
+        self, verify_credentials, *_mocks
+    ) -> None:
+        self.assertTrue(has_valid_credentials())
+        verify_credentials.assert_not_called()
+
+    @patch("bugfixpy.utils.validate.credentials_are_loaded", return_value=False)
+    @patch("bugfixpy.jira.api.get_response_code_from_query_to_verify_credentials")
+    def test_missing_credentials_are_not_requested(
+        self, verify_credentials, _credentials_are_loaded
+    ) -> None:
+        self.assertFalse(has_valid_credentials())
+        verify_credentials.assert_not_called()
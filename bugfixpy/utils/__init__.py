@@ -1,5 +1,22 @@
-from . import prompt_user, validate
-from . import text
-from . import formatter
-from . import browser
-from . import arguments
+from importlib import import_module
+from typing import Any
+
+# Submodules are imported on first use so the CLI can start without loading
+# git, jira and cms when a mode does not need them
+SUBMODULES = [
+    "prompt_user",
+    "validate",
+    "text",
+    "formatter",
+    "browser",
+    "arguments",
+    "credentials",
+    "task_graph",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
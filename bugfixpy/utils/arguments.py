@@ -56,4 +56,62 @@ def setup_parser() -> ArgumentParser:
         help="Enable repository view mode",
     )
 
+    parser.add_argument(
+        "--sync-catalog",
+        action="store_true",
+        help="Index every CMS application and challenge locally for offline lookups",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned Jira transitions without executing them"
+        " (with --auto and --alert, the fix is also not pushed)",
+    )
+
+    parser.add_argument(
+        "--clone-strategy",
+        choices=["full", "blobless", "sparse", "narrow"],
+        help="How to clone the repository: every branch through the local mirror"
+        " (full, default), without blobs until checkout (blobless), blobless with"
+        " cherry-picks checking out only the files of the fix (sparse), or only"
+        " the challenge branches reported by the CMS (narrow)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last --auto, --manual or --alert run of the repository"
+        " from its journal, without cloning it again",
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run the jobs of a JSON lines manifest without prompting. Each job has"
+        " a challenge_id or application, a chlrq, a patch or script, and optionally"
+        " a message, reviewer, push and transition",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Number of --batch jobs run at the same time",
+    )
+
+    parser.add_argument(
+        "--results",
+        metavar="FILE",
+        help="Where --batch writes the results of its jobs"
+        " (default: <manifest>.results.jsonl)",
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached CMS data and scrape the CMS again"
+        " (with --sync-catalog, re-fetch every challenge screen)",
+    )
+
     return parser
@@ -0,0 +1,33 @@
+from threading import Lock
+from typing import Optional
+
+# Keyring service the credentials are stored under
+SERVICE = "system"
+
+__credentials: dict[str, Optional[str]] = {}
+__lock = Lock()
+
+
+def get_password(name: str) -> Optional[str]:
+    with __lock:
+        if name not in __credentials:
+            # keyring is slow to import with the keyrings.alt backends, so only
+            # load it once a credential is actually needed
+            import keyring  # pylint: disable=import-outside-toplevel
+
+            __credentials[name] = keyring.get_password(SERVICE, name)
+
+        return __credentials[name]
+
+
+def set_password(name: str, password: str) -> None:
+    import keyring  # pylint: disable=import-outside-toplevel
+
+    with __lock:
+        keyring.set_password(SERVICE, name, password)
+        __credentials[name] = password
+
+
+def clear() -> None:
+    with __lock:
+        __credentials.clear()
@@ -0,0 +1,164 @@
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from bugfixpy.utils.text import colors
+
+# Width of the longest bar in the timeline
+TIMELINE_WIDTH = 40
+
+
+@dataclass
+class TaskTiming:
+    name: str
+    background: bool
+    started: float = 0
+    finished: float = 0
+    waited: float = 0
+    needed: bool = False
+
+    def get_elapsed(self) -> float:
+        return self.finished - self.started
+
+
+class TaskGraph:
+    """
+    Run the steps of a mode. Background steps start as soon as the steps they
+    depend on are done and are only waited on when their result is needed.
+    Foreground steps run in the calling thread, so they can prompt the user.
+    Background steps run in daemon threads, so an interrupt exits without waiting
+    for one such as the clone. Its git process gets the interrupt too.
+    """
+
+    __workers: threading.BoundedSemaphore
+    __cancelled: threading.Event
+    __futures: dict[str, Future]
+    __timings: dict[str, TaskTiming]
+    __start: float
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.__workers = threading.BoundedSemaphore(max_workers)
+        self.__cancelled = threading.Event()
+        self.__futures = {}
+        self.__timings = {}
+        self.__start = time.perf_counter()
+
+    def add(
+        self,
+        name: str,
+        function: Callable[[], Any],
+        dependencies: tuple[str, ...] = (),
+    ) -> None:
+        # Dependencies were added before, so waiting on them cannot deadlock
+        dependency_futures = [self.__futures[dependency] for dependency in dependencies]
+        timing = self.__timings[name] = TaskTiming(name, True)
+        future: Future = Future()
+
+        def run_after_dependencies() -> None:
+            try:
+                for dependency_future in dependency_futures:
+                    dependency_future.result()
+
+                with self.__workers:
+                    if self.__cancelled.is_set():
+                        raise CancelledError(f"{name} was cancelled")
+
+                    result = self.__run_timed(timing, function)
+            except BaseException as err:
+                future.set_exception(err)
+            else:
+                future.set_result(result)
+
+        self.__futures[name] = future
+        threading.Thread(
+            target=run_after_dependencies, name=f"task-{name}", daemon=True
+        ).start()
+
+    def is_done(self, name: str) -> bool:
+        return self.__futures[name].done()
+
+    def run(
+        self,
+        name: str,
+        function: Callable[[], Any],
+        dependencies: tuple[str, ...] = (),
+    ) -> Any:
+        for dependency in dependencies:
+            self.result(dependency)
+
+        timing = self.__timings[name] = TaskTiming(name, False)
+
+        return self.__run_timed(timing, function)
+
+    def result(self, name: str) -> Any:
+        timing = self.__timings[name]
+        timing.needed = True
+        start = time.perf_counter()
+        try:
+            return self.__futures[name].result()
+        finally:
+            timing.waited += time.perf_counter() - start
+
+    def shutdown(self) -> None:
+        # Steps that have not started are cancelled, running ones are not waited on
+        self.__cancelled.set()
+
+    def get_timings(self) -> list[TaskTiming]:
+        return list(self.__timings.values())
+
+    def get_time_saved(self) -> float:
+        finished = [timing for timing in self.__timings.values() if timing.finished]
+        if not finished:
+            return 0
+
+        # A background step whose result was never needed would not have run
+        sequential = sum(
+            timing.get_elapsed()
+            for timing in finished
+            if timing.needed or not timing.background
+        )
+        overlapped = max(timing.finished for timing in finished) - self.__start
+
+        return max(0, sequential - overlapped)
+
+    def display_timeline(self) -> None:
+        timings = [timing for timing in self.__timings.values() if timing.finished]
+        if not timings:
+            return
+
+        end = max(timing.finished for timing in timings)
+        scale = TIMELINE_WIDTH / max(end - self.__start, 0.001)
+        name_width = max(len(timing.name) for timing in timings)
+
+        print(f"{colors.HEADER}Timeline{colors.ENDC}")
+        for timing in timings:
+            offset = timing.started - self.__start
+            bar_start = int(offset * scale)
+            bar_length = max(1, int(timing.get_elapsed() * scale))
+            waited = self.__describe_wait(timing)
+            print(
+                f"  {timing.name:<{name_width}} {' ' * bar_start}"
+                f"{colors.OKCYAN}{'=' * bar_length}{colors.ENDC}"
+                f"{' ' * (TIMELINE_WIDTH - bar_start - bar_length + 1)}"
+                f"{offset:6.1f}s +{timing.get_elapsed():.1f}s{waited}"
+            )
+
+        print(
+            f"Overlapping steps saved {colors.OKGREEN}{self.get_time_saved():.1f}s"
+            f"{colors.ENDC}"
+        )
+
+    def __describe_wait(self, timing: TaskTiming) -> str:
+        if not timing.background:
+            return ""
+
+        return f" (background, waited {timing.waited:.1f}s)"
+
+    def __run_timed(self, timing: TaskTiming, function: Callable[[], Any]) -> Any:
+        timing.started = time.perf_counter()
+        try:
+            return function()
+        finally:
+            timing.finished = time.perf_counter()
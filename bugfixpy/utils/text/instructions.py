@@ -84,3 +84,6 @@ WARN_USER_OF_MERGE_CONFLICT = (
 )
 
 DONE = f"{colors.OKGREEN}[Done]{colors.ENDC}"
+
+FIX_FINISHED_IN_PREVIOUS_RUN = f"""{colors.HEADER}Every fix and cherry-pick was finished in the previous run.
+Continuing with the push{colors.ENDC}"""
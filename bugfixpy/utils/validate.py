@@ -1,7 +1,7 @@
 import re
 
 from bugfixpy import jira, cms
-from bugfixpy.jira import api, Issue
+from bugfixpy.jira import api, credential_cache, Issue
 
 
 def is_valid_issue(issue: Issue) -> bool:
@@ -47,21 +47,21 @@ def has_valid_credentials() -> bool:
     if not credentials_are_loaded():
         return False
 
-    response_code = api.get_response_code_from_query_to_verify_credentials()
-
-    if response_code != 200:
-        print("Invalid API credentials: Invalid email or permissions on account")
-        print("confirm your credentials are correct")
-        print("run bug-fix.py --setup to change credentials")
-        return False
+    # Credentials that were not accepted recently are checked by the first Jira
+    # request of the run, which raises InvalidCredentialsError if Jira rejects them
+    if not credential_cache.is_validated():
+        print("API credentials will be verified with the first Jira request")
 
     return True
 
 
 def credentials_are_loaded() -> bool:
-    return (
-        jira.constants.API_EMAIL != ""
-        and jira.constants.API_KEY != ""
-        and cms.constants.EMAIL != ""
-        and cms.constants.PASSWORD != ""
+    # keyring returns None for credentials that were never set up
+    return all(
+        [
+            jira.constants.API_EMAIL,
+            jira.constants.API_KEY,
+            cms.constants.EMAIL,
+            cms.constants.PASSWORD,
+        ]
     )